@@ -0,0 +1,354 @@
+# ============================================
+# PYTHON AUDIT OF IMAGE BYTES SHIPPED PER PAGE
+# ============================================
+
+# =======
+# IMPORTS
+# =======
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+
+# =========
+# CONSTANTS
+# =========
+
+# Pages audited (paths relative to PythonFiles, like every other script)
+PAGE_PATTERNS = ["../*.html", "../projects/*.html"]
+
+# Data files the page loaders read image names from
+CAROUSEL_DATA = "../projects/js/JSON/carouselData.js"
+PROJECT_STEPS = "../projects/js/JSON/projectSteps.js"
+PROJECT_LINKS = "../projects/js/JSON/projectLinks.js"
+PROJECT_LIST = "../js/JSON/projectListData.js"
+
+# Per-image srcsets from Image-Optimizer.py's adaptive widths, and the share of
+# the viewport js/responsiveImageLoader.js and projects/js/carousel.js declare
+# in their sizes attributes
+SRCSET_MANIFEST = "../projects/js/JSON/srcsetManifest.js"
+RESPONSIVE_SLOT = 0.9
+CAROUSEL_SLOT = 1.0
+
+# Per-image built extra formats, from which the loaders emit their <source> types
+IMAGE_MANIFEST = "../projects/js/JSON/imageManifest.js"
+
+# Optimized output folders checked for files nothing references
+OUTPUT_PATTERNS = [
+    "../images/*/optimized/**/*",
+    "../projects/images/*/optimized/**/*",
+]
+
+# Site text searched for image references when looking for unreferenced outputs
+REFERENCE_PATTERNS = PAGE_PATTERNS + ["../js/**/*.js", "../projects/js/**/*.js", "../styles/*.css"]
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".webp", ".avif", ".ico", ".svg")
+
+# The .<hash> part of content-hashed twins (Image-Optimizer.py FINGERPRINT_CONFIG hash_length)
+FINGERPRINT_PATTERN = re.compile(r"\.[0-9a-f]{10}$")
+
+# Viewport widths modelled, one per breakpoint band of js/responsiveImageLoader.js
+# and projects/js/carousel.js (min-width 1280 / 1024 / 480, and below 480)
+VIEWPORTS = {"desktop": 1440, "laptop": 1152, "tablet": 800, "mobile": 390}
+
+# The loaders' <source> breakpoints, widest first: (min-width, device folder)
+BREAKPOINTS = [(1280, "desktop"), (1024, "laptop"), (480, "mobile")]
+
+# The loaders' <source type> order, and the types the modelled browser decodes.
+# Like a browser, the audit takes the first listed type it supports and never
+# falls back to another one when that file is missing
+FORMAT_PREFERENCE = ["avif", "webp"]
+SUPPORTED_TYPES = {"image/avif", "image/webp", None}
+
+# Default budget per page and viewport, in KB of images fetched while the page
+# is scrolled through; zoom images only count with --include-zoom
+PAGE_BUDGET_KB = 3000
+
+# ================
+# HELPER FUNCTIONS
+# ================
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Report the image bytes each page ships.")
+    parser.add_argument("--budget", type=int, default=PAGE_BUDGET_KB, metavar="KB",
+                        help=f"Fail when a page exceeds KB at any viewport (default: {PAGE_BUDGET_KB}).")
+    parser.add_argument("--include-zoom", action="store_true",
+                        help="Count the full-screen zoom image of every picture in the budget.")
+    parser.add_argument("--pages", nargs="+", metavar="NAME",
+                        help="Only report these page file names.")
+    args = parser.parse_args()
+    if args.budget < 1:
+        parser.error("--budget must be at least 1")
+    return args
+
+def find_files(patterns):
+    """Return the sorted, de-duplicated files matching any glob pattern."""
+    paths = set()
+    for pattern in patterns:
+        paths.update(p for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
+    return sorted(os.path.normpath(p) for p in paths)
+
+def read_text(path):
+    """Return a file's text, or an empty string if it does not exist."""
+    if not os.path.isfile(path):
+        print(f"[WARNING] Missing data file: {path}")
+        return ""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+def keyed_lists(text, field):
+    """
+    Read a JSON-style JS data file of `key: [ {field: "value"}, ... ]` lists
+    and return {key: [values]}, without evaluating any JavaScript.
+    """
+    starts = list(re.finditer(r"^\s*(\w+)\s*:\s*\[", text, re.M))
+    lists = {}
+    for i, match in enumerate(starts):
+        end = starts[i + 1].start() if i + 1 < len(starts) else len(text)
+        block = text[match.end():end]
+        lists[match.group(1)] = re.findall(rf'\b{field}\s*:\s*"([^"]+)"', block)
+    return lists
+
+def manifest_entries(text):
+    """Return {image name: entry} from a generated `"name": {...},` per line JS manifest."""
+    return {
+        json.loads(name): json.loads(entry)
+        for name, entry in re.findall(r'^\s*("[^"]+"):\s*(\{.*\}),$', text, re.M)
+    }
+
+def load_data_files():
+    """Load the image names each data-driven loader can insert."""
+    return {
+        "carousel": keyed_lists(read_text(CAROUSEL_DATA), "imgName"),
+        "steps": keyed_lists(read_text(PROJECT_STEPS), "img"),
+        "links": keyed_lists(read_text(PROJECT_LINKS), "icon"),
+        "project_list": re.findall(r'"img"\s*:\s*"([^"]+)"', read_text(PROJECT_LIST)),
+        "srcsets": {
+            name: entry["srcset"] for name, entry in manifest_entries(read_text(SRCSET_MANIFEST)).items()
+        },
+        "formats": {
+            name: entry.get("formats", []) for name, entry in manifest_entries(read_text(IMAGE_MANIFEST)).items()
+        },
+    }
+
+# ===============
+# PAGE REFERENCES
+# ===============
+def tag_attr(tag, name):
+    """Return one attribute value from an HTML start tag, or None."""
+    match = re.search(rf'\b{name}="([^"]*)"', tag)
+    return match.group(1) if match else None
+
+def page_references(html, data):
+    """
+    List the images a page ends up showing once its loaders have run, as
+    (kind, value) pairs: "responsive" and "carousel" hold image names placed
+    by the loaders, "picture" holds ([(min-width, type, src)], fallback src) and
+    "url" a plain image path relative to the page.
+    """
+    html = re.sub(r"<!--.*?-->", "", html, flags=re.S)
+    refs = []
+
+    # Hand-written <picture> blocks, then any other <img> on the page
+    for block in re.findall(r"<picture\b.*?</picture>", html, flags=re.S):
+        sources = []
+        for tag in re.findall(r"<source\b[^>]*>", block):
+            media = re.search(r"min-width:\s*(\d+)px", tag_attr(tag, "media") or "")
+            sources.append((int(media.group(1)) if media else 0, tag_attr(tag, "type"), tag_attr(tag, "srcset")))
+        img = re.search(r"<img\b[^>]*>", block)
+        refs.append(("picture", (sources, tag_attr(img.group(0), "src") if img else None)))
+    for tag in re.findall(r"<img\b[^>]*>", re.sub(r"<picture\b.*?</picture>", "", html, flags=re.S)):
+        if tag_attr(tag, "src"):
+            refs.append(("url", tag_attr(tag, "src")))
+
+    # Containers filled by the loaders from the data files
+    for tag in re.findall(r"<\w+\b[^>]*>", html):
+        classes = (tag_attr(tag, "class") or "").split()
+        if "responsive-image" in classes and tag_attr(tag, "data-img-name"):
+            refs.append(("responsive", tag_attr(tag, "data-img-name")))
+        if tag_attr(tag, "data-carousel"):
+            refs += [("carousel", name) for name in data["carousel"].get(tag_attr(tag, "data-carousel"), [])]
+        if tag_attr(tag, "data-links"):
+            refs += [("url", icon) for icon in data["links"].get(tag_attr(tag, "data-links"), [])]
+    body = re.search(r"<body\b[^>]*>", html)
+    if body and "projectStepsData.js" in html and tag_attr(body.group(0), "data-project"):
+        refs += [("responsive", name) for name in data["steps"].get(tag_attr(body.group(0), "data-project"), [])]
+    if "projectListLoader.js" in html:
+        refs += [("url", src) for src in data["project_list"]]
+    return refs
+
+# ================
+# LOADER SEMANTICS
+# ================
+def breakpoint_folder(width):
+    """Return the device folder the loaders' <source> media queries pick, or None below them all."""
+    for min_width, folder in BREAKPOINTS:
+        if width >= min_width:
+            return folder
+    return None
+
+def responsive_zoom_folder(width):
+    """Return the zoom folder js/responsiveImageLoader.js sets as data-full for a viewport."""
+    if width < 768:
+        return "mobile"
+    return "laptop" if width < 1280 else "desktop"
+
+def modern_formats(name, data):
+    """
+    Return the extra formats the loaders emit <source> elements for (those
+    the image manifest lists as built), in FORMAT_PREFERENCE order, keeping
+    only the ones the modelled browser decodes.
+    """
+    built = data["formats"].get(name, [])
+    return [fmt for fmt in FORMAT_PREFERENCE if fmt in built and f"image/{fmt}" in SUPPORTED_TYPES]
+
+def srcset_pick(srcset, width, fraction=RESPONSIVE_SLOT):
+    """Return the narrowest srcset candidate covering the slot at a viewport width, else the widest."""
+    slot = width * fraction
+    options = sorted(
+        (int(descriptor[:-1]), url)
+        for url, descriptor in (item.split() for item in srcset.split(","))
+    )
+    return next((url for w, url in options if w >= slot), options[-1][1])
+
+def fetches(kind, value, width, data):
+    """
+    Return (image, zoom) one reference fetches at a viewport width: the
+    path (relative to the page) the browser chooses, or None when it fetches
+    nothing. Only the first supported <source> counts, as in a browser.
+    """
+    if kind in ("responsive", "carousel"):
+        name = value
+        formats = modern_formats(name, data)
+        folder = breakpoint_folder(width)
+        srcsets = data["srcsets"].get(name)
+        if srcsets:
+            fmt = next((fmt for fmt in formats if srcsets.get(fmt)), None)
+            srcset = srcsets.get(fmt) if fmt else srcsets.get(os.path.splitext(name)[1].lstrip(".").lower())
+            fraction = RESPONSIVE_SLOT if kind == "responsive" else CAROUSEL_SLOT
+            image = srcset_pick(srcset, width, fraction) if srcset else f"images/main/optimized/desktop/standard/{name}"
+        elif folder:
+            base = f"images/main/optimized/{folder}/standard/{name}"
+            image = f"{os.path.splitext(base)[0]}.{formats[0]}" if formats else base
+        else:
+            # Below every breakpoint the <img src> fallback is used as-is
+            fallback = "desktop" if kind == "responsive" else "mobile"
+            image = f"images/main/optimized/{fallback}/standard/{name}"
+        zoom_folder = responsive_zoom_folder(width) if kind == "responsive" else "desktop"
+        return image, f"images/main/optimized/{zoom_folder}/zoom/{name}"
+    if kind == "picture":
+        sources, fallback = value
+        for min_width, media_type, srcset in sources:
+            if srcset and width >= min_width and media_type in SUPPORTED_TYPES:
+                return srcset.split(",")[0].split()[0], None
+        return fallback, None
+    return value, None
+
+def audit_page(page_path, data, include_zoom):
+    """
+    Work out the image bytes one page fetches at every viewport.
+    Returns ({viewport: (image bytes, zoom bytes)}, set of missing references).
+    """
+    with open(page_path, "r", encoding="utf-8") as f:
+        refs = page_references(f.read(), data)
+    totals, missing = {}, set()
+    for viewport, width in VIEWPORTS.items():
+        images, zooms = set(), set()
+        for kind, value in refs:
+            image, zoom = fetches(kind, value, width, data)
+            for chosen, fetched in ((image, images), (zoom, zooms)):
+                if not chosen:
+                    continue
+                path = os.path.normpath(os.path.join(os.path.dirname(page_path), chosen))
+                (fetched if os.path.isfile(path) else missing).add(path)
+        image_bytes = sum(os.path.getsize(p) for p in images)
+        zoom_bytes = sum(os.path.getsize(p) for p in zooms - images) if include_zoom else 0
+        totals[viewport] = (image_bytes, zoom_bytes)
+    return totals, missing
+
+# ====================
+# UNREFERENCED OUTPUTS
+# ====================
+def referenced_names():
+    """
+    Return the base names (no extension) of every image file named anywhere
+    in the site's HTML, JS and CSS. Modern-format variants share their base
+    name with the original, so one reference covers all of them.
+    """
+    names = set()
+    pattern = r"[\w@.-]+(?:" + "|".join(re.escape(ext) for ext in IMAGE_EXTS) + r")\b"
+    for path in find_files(REFERENCE_PATTERNS):
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for token in re.findall(pattern, f.read(), flags=re.I):
+                names.add(os.path.splitext(token)[0].lower())
+    return names
+
+def output_name(path):
+    """
+    Return the image an output belongs to: its base name (without any
+    fingerprint), or its pyramid's for deep zoom tiles.
+    """
+    tile = re.search(r"([^/\\]+)_files[/\\]\d+[/\\][^/\\]+$", path)
+    name = tile.group(1) if tile else os.path.splitext(os.path.basename(path))[0]
+    return FINGERPRINT_PATTERN.sub("", name).lower()
+
+def unreferenced_outputs():
+    """Return the optimized files whose base name no page, script or stylesheet mentions."""
+    names = referenced_names()
+    return [
+        path for path in find_files(OUTPUT_PATTERNS)
+        if path.lower().endswith(IMAGE_EXTS) and output_name(path) not in names
+    ]
+
+# =====
+# MAIN
+# =====
+def main():
+    """Print each page's image weight per viewport and fail when a page is over budget."""
+    args = parse_args()
+    data = load_data_files()
+    pages = [p for p in find_files(PAGE_PATTERNS) if not args.pages or os.path.basename(p) in args.pages]
+    budget = args.budget * 1024
+    over_budget = []
+    all_missing = {}
+
+    viewports = "".join(f"{f'{name} ({width}px)':>18}" for name, width in VIEWPORTS.items())
+    print(f"{'Page':<40}{viewports}")
+    for page in pages:
+        totals, missing = audit_page(page, data, args.include_zoom)
+        cells = ""
+        for viewport, (image_bytes, zoom_bytes) in totals.items():
+            total = image_bytes + zoom_bytes
+            flag = " !" if total > budget else "  "
+            cells += f"{total / 1024:>16.0f}{flag}"
+            if total > budget:
+                over_budget.append((page, viewport, total))
+        print(f"{page:<40}{cells}")
+        for path in missing:
+            all_missing.setdefault(path, []).append(page)
+    scope = "images + zoom" if args.include_zoom else "images"
+    print(f"\n[INFO] KB of {scope} fetched per page and viewport; budget {args.budget} KB.")
+
+    if all_missing:
+        print(f"\n[WARNING] {len(all_missing)} image file(s) the browser would request are missing:")
+        for path, referrers in sorted(all_missing.items()):
+            print(f"  {path} (from {', '.join(sorted(os.path.basename(p) for p in referrers))})")
+
+    unreferenced = unreferenced_outputs()
+    if unreferenced:
+        wasted = sum(os.path.getsize(p) for p in unreferenced)
+        print(f"\n[WARNING] {len(unreferenced)} optimized file(s) ({wasted / 1024:.0f} KB) "
+              f"are not referenced by any page:")
+        for path in unreferenced:
+            print(f"  {path}")
+
+    if over_budget:
+        print(f"\n[ERROR] {len(over_budget)} page/viewport combination(s) over the {args.budget} KB budget:")
+        for page, viewport, total in over_budget:
+            print(f"  {page} @ {viewport}: {total / 1024:.0f} KB")
+        sys.exit(1)
+    print("\n[INFO] Every page is within budget.")
+
+if __name__ == "__main__":
+    main()
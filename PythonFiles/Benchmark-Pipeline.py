@@ -0,0 +1,345 @@
+# ==============================================
+# PYTHON BENCHMARK FOR THE IMAGE + DIAGRAM BUILD
+# ==============================================
+
+# =======
+# IMPORTS
+# =======
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from PIL import Image, ImageDraw, ImageFilter
+
+# =========
+# CONSTANTS
+# =========
+
+# Scripts under test (hyphenated names, so they are loaded by path)
+OPTIMIZER_SCRIPT = "Image-Optimizer.py"
+FLOWCHART_SCRIPT = "Generate-Flowchart.py"
+SITEMAP_SCRIPT = "Generate-SiteDiagrams.py"
+FLOW_CONFIG_PATH = "../diagrams/FlowConfig.json"
+
+# Default report location; compare reports from different commits side by side
+OUTPUT_PATH = "../benchmark-results.json"
+REPORT_VERSION = 2
+
+# Synthetic corpus: (kind, count, (width, height)) per scale. Photos are noisy
+# gradients, diagrams are flat colour blocks with text-like strokes and
+# screenshots are very large flat UIs
+CORPUS = {
+    "small": [
+        ("photo", 4, (2400, 1600)),
+        ("diagram", 4, (1800, 1200)),
+        ("screenshot", 1, (5120, 2880)),
+    ],
+    "full": [
+        ("photo", 16, (4000, 3000)),
+        ("diagram", 16, (3000, 2000)),
+        ("screenshot", 4, (7680, 4320)),
+    ],
+}
+
+# Synthetic diagram definitions per scale: (count, nodes per diagram)
+DIAGRAMS = {
+    "small": (20, 12),
+    "full": (200, 40),
+}
+
+# Latency percentiles reported for every stage
+PERCENTILES = [50, 90, 99]
+
+# ============
+# MODULE SETUP
+# ============
+def load_script(path):
+    """Import one of the pipeline scripts by file path."""
+    name = os.path.splitext(os.path.basename(path))[0].replace("-", "_").lower()
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Benchmark the image and diagram pipeline.")
+    parser.add_argument("--scale", choices=sorted(CORPUS), default="small",
+                        help="Size of the synthetic corpus (default: small).")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="Run every stage this many times (default: 1).")
+    parser.add_argument("--seed", type=int, default=1234,
+                        help="Random seed for the synthetic corpus (default: 1234).")
+    parser.add_argument("--output", default=OUTPUT_PATH,
+                        help=f"Where to write the JSON report (default: {OUTPUT_PATH}).")
+    parser.add_argument("--keep", action="store_true",
+                        help="Keep the generated corpus and outputs instead of deleting them.")
+    return parser.parse_args()
+
+# ================
+# SYNTHETIC CORPUS
+# ================
+def make_photo(rng, size):
+    """Smooth gradient with fine noise, close to a JPEG-friendly photo."""
+    base = Image.linear_gradient("L").resize(size).convert("RGB")
+    tint = Image.new("RGB", size, tuple(rng.randrange(256) for _ in range(3)))
+    img = Image.blend(base, tint, 0.5)
+    noise = Image.effect_noise(size, 40).convert("RGB")
+    return Image.blend(img, noise, 0.2).filter(ImageFilter.GaussianBlur(1))
+
+def make_diagram(rng, size):
+    """Flat-colour boxes, connectors and text-like strokes on white."""
+    w, h = size
+    img = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(img)
+    palette = [tuple(rng.randrange(256) for _ in range(3)) for _ in range(5)]
+    for _ in range(20):
+        x, y = rng.randrange(w - 300), rng.randrange(h - 120)
+        draw.rounded_rectangle([x, y, x + 280, y + 100], radius=16,
+                               fill=rng.choice(palette), outline="black", width=3)
+        for line in range(3):
+            draw.line([x + 20, y + 25 + line * 25, x + 20 + rng.randrange(80, 240), y + 25 + line * 25],
+                      fill="black", width=4)
+        draw.line([x + 280, y + 50, rng.randrange(w), rng.randrange(h)], fill="black", width=3)
+    return img
+
+def make_screenshot(rng, size):
+    """Very large flat UI: header bar, sidebar and many rows of text-like strokes."""
+    w, h = size
+    img = Image.new("RGB", size, (245, 245, 245))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([0, 0, w, 120], fill=(40, 60, 90))
+    draw.rectangle([0, 120, 400, h], fill=(225, 228, 232))
+    for y in range(160, h - 40, 48):
+        draw.line([460, y, 460 + rng.randrange(400, w - 600), y], fill=(60, 60, 60), width=6)
+    return img
+
+MAKERS = {
+    "photo": (make_photo, ".jpg"),
+    "diagram": (make_diagram, ".png"),
+    "screenshot": (make_screenshot, ".png"),
+}
+
+def build_image_corpus(root, scale, rng):
+    """Write the synthetic images and return [(kind, path)]."""
+    corpus = []
+    os.makedirs(root, exist_ok=True)
+    for kind, count, size in CORPUS[scale]:
+        maker, ext = MAKERS[kind]
+        for i in range(count):
+            path = os.path.join(root, f"{kind}-{i:03d}{ext}")
+            img = maker(rng, size)
+            if ext == ".jpg":
+                img.save(path, quality=92)
+            else:
+                img.save(path)
+            corpus.append((kind, path))
+    return corpus
+
+def build_flowchart_corpus(root, scale, rng):
+    """Write synthetic *Flow.json definitions and return their paths."""
+    count, node_count = DIAGRAMS[scale]
+    shapes = ["box", "decision", "start", "end", "process"]
+    paths = []
+    os.makedirs(root, exist_ok=True)
+    for i in range(count):
+        nodes = {
+            f"Node{n}": {"label": f"Step {n} of synthetic flow {i} with a wrapped label",
+                         "shape": rng.choice(shapes)}
+            for n in range(node_count)
+        }
+        connections = [[f"Node{n}", f"Node{n + 1}"] for n in range(node_count - 1)]
+        connections += [[f"Node{rng.randrange(node_count)}", f"Node{rng.randrange(node_count)}",
+                         rng.choice(["Yes", "No", "retry"])] for _ in range(node_count // 4)]
+        path = os.path.join(root, f"Synthetic{i:03d}Flow.json")
+        with open(path, "w") as f:
+            json.dump({"nodes": nodes, "connections": connections}, f)
+        paths.append(path)
+    return paths
+
+def build_sitemap_corpus(scale, rng):
+    """Return synthetic site map definitions in the siteMaps JSON layout."""
+    count, node_count = DIAGRAMS[scale]
+    maps = []
+    for i in range(count):
+        pages = {f"Page{n}": f"page{n}.html" for n in range(node_count)}
+        scripts = {f"Script{n}": f"script{n}.js" for n in range(node_count)}
+        maps.append({
+            "meta": {"key_main": "Main", "key_second": "Pages", "key_third": "Scripts",
+                     "key_links": "links", "key_classes": "classes", "key_class_map": "class_map"},
+            "Main": {"Index": "index.html"},
+            "Pages": pages,
+            "Scripts": scripts,
+            "links": [["Index", p] for p in pages] + [[p, rng.choice(list(scripts))] for p in pages],
+            "classes": {"primary": "fill:#3399ff,stroke:#000"},
+            "class_map": {"Index": "primary"},
+        })
+    return maps
+
+# ===========
+# MEASUREMENT
+# ===========
+def peak_rss_mb():
+    """Peak resident set size of this process so far, in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+def run_stage(name, items, func, repeat):
+    """
+    Time func(item) for every item, repeat times over. Items are
+    (label, input_bytes, argument). Returns the stage summary dict.
+
+    ru_maxrss is a process-wide high-water mark, so a stage can only report
+    how far it raised it: peak_rss_growth_mb is 0 when the stage stayed below
+    the peak an earlier stage set.
+    """
+    rss_before = peak_rss_mb()
+    latencies = []
+    total_bytes = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for _, input_bytes, arg in items:
+            t0 = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                func(arg)
+            latencies.append(time.perf_counter() - t0)
+            total_bytes += input_bytes
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    summary = {
+        "items": len(latencies),
+        "seconds": round(elapsed, 4),
+        "items_per_s": round(len(latencies) / elapsed, 3) if elapsed else None,
+        "mb_per_s": round(total_bytes / (1024 * 1024) / elapsed, 3) if elapsed else None,
+        "latency_ms": {f"p{p}": round(percentile(latencies, p) * 1000, 2) for p in PERCENTILES},
+        "peak_rss_growth_mb": round(peak_rss_mb() - rss_before, 1),
+    }
+    summary["latency_ms"]["max"] = round(latencies[-1] * 1000, 2) if latencies else 0.0
+    print(f"[BENCH] {name}: {summary['items']} items in {summary['seconds']}s "
+          f"({summary['items_per_s']} items/s, p50 {summary['latency_ms']['p50']} ms)")
+    return summary
+
+def git_commit():
+    """Current commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# =====
+# MAIN
+# =====
+def main():
+    """Build the synthetic corpus, time each pipeline stage and write the JSON report."""
+    args = parse_args()
+    optimizer = load_script(OPTIMIZER_SCRIPT)
+    flowchart = load_script(FLOWCHART_SCRIPT)
+    sitemap = load_script(SITEMAP_SCRIPT)
+    rng = random.Random(args.seed)
+
+    work_dir = tempfile.mkdtemp(prefix="pipeline-bench-")
+    print(f"[INFO] Building {args.scale} corpus in {work_dir}")
+    corpus = build_image_corpus(os.path.join(work_dir, "original"), args.scale, rng)
+    flow_paths = build_flowchart_corpus(os.path.join(work_dir, "flowCharts"), args.scale, rng)
+    site_maps = build_sitemap_corpus(args.scale, rng)
+    out_dir = os.path.join(work_dir, "optimized")
+
+    # Resize every image exactly as the main profile would, into the scratch dir
+    profile = {**optimizer.IMAGE_PROFILES["main"], "output_base": out_dir}
+    targets = optimizer.profile_targets(profile, optimizer.DEVICES)
+    all_tasks = optimizer.build_resize_tasks(
+        os.path.dirname(corpus[0][1]), targets, optimizer.VALID_EXTS, profile["quality"],
+        optimizer.supported_formats(profile.get("formats", {})), profile.get("png_palette"),
+        profile.get("quality_search")
+    )
+    stages = {}
+    for kind in MAKERS:
+        tasks = [
+            (os.path.basename(path), os.path.getsize(path), (path, variants))
+            for path, variants in all_tasks
+            if os.path.basename(path).startswith(f"{kind}-")
+        ]
+        stages[f"resize_{kind}"] = run_stage(
+            f"resize_{kind}", tasks,
+            lambda task: optimizer.resize_image(task[0], task[1], profile.get("no_upscale", False)),
+            args.repeat
+        )
+
+    # Favicons from the first diagram-style image
+    favicon_src = next(path for k, path in corpus if k == "diagram")
+    favicon_items = [("favicon", os.path.getsize(favicon_src), favicon_src)]
+    stages["favicon_png"] = run_stage(
+        "favicon_png", favicon_items,
+        lambda src: optimizer.generate_favicon_png(src, os.path.join(out_dir, "favicon.png"), 192),
+        args.repeat
+    )
+    stages["favicon_ico"] = run_stage(
+        "favicon_ico", favicon_items,
+        lambda src: optimizer.generate_favicon_ico(src, os.path.join(out_dir, "favicon.ico"),
+                                                   [16, 32, 48, 64]),
+        args.repeat
+    )
+
+    # Diagram source generation (no external renderer needed)
+    with open(FLOW_CONFIG_PATH) as f:
+        flow_config = json.load(f)
+    flow_items = [(os.path.basename(p), os.path.getsize(p), p) for p in flow_paths]
+    stages["flowchart_build"] = run_stage(
+        "flowchart_build", flow_items,
+        lambda p: flowchart.build_flowchart(os.path.basename(p), p, flow_config).source,
+        args.repeat
+    )
+    site_items = [(f"sitemap-{i}", len(json.dumps(m)), m) for i, m in enumerate(site_maps)]
+    stages["mermaid_text"] = run_stage(
+        "mermaid_text", site_items,
+        lambda m: "\n".join(sitemap.build_mermaid_lines(m)),
+        args.repeat
+    )
+
+    report = {
+        "version": REPORT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "scale": args.scale,
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "environment": {
+            "python": platform.python_version(),
+            "pillow": Image.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "stages": stages,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"[OK] Benchmark report written to {args.output}")
+
+    if args.keep:
+        print(f"[INFO] Corpus kept in {work_dir}")
+    else:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+# ==============================================
+# PYTHON PROGRAM TO PRECOMPRESS STATIC WEB ASSETS
+# ==============================================
+
+# =======
+# IMPORTS
+# =======
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# =========
+# CONSTANTS
+# =========
+
+# Text assets the site serves; each gets .gz (and .br) siblings
+ASSET_PATTERNS = [
+    "../*.html",
+    "../projects/*.html",
+    "../styles/*.css",
+    "../js/**/*.js",
+    "../projects/js/**/*.js",
+    "../images/icons/optimized/sprite/*.css",
+    "../diagrams/siteMaps/*.svg",
+]
+
+# SVGs minified in place before compression (minifying is idempotent, so
+# committed SVGs only change when the generator changes them)
+SVG_PATTERNS = ["../diagrams/siteMaps/*.svg"]
+
+# Elements whose whitespace is content (label text), never stripped when minifying
+SVG_TEXT_ELEMENTS = ("text", "foreignObject")
+
+# Compression settings (maximum: the work is done once at build time)
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# Attribute values whose numbers are rounded when minifying SVGs
+SVG_NUMERIC_ATTRS = ("d", "points", "transform", "viewBox", "x", "y", "x1", "y1", "x2", "y2",
+                     "width", "height", "rx", "ry", "cx", "cy", "r")
+SVG_DECIMALS = 3
+
+# Skip manifest: source hash + settings per compressed output
+MANIFEST_PATH = "../compress-manifest.json"
+MANIFEST_VERSION = 1
+
+# ================
+# HELPER FUNCTIONS
+# ================
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Minify SVGs and precompress static web assets.")
+    parser.add_argument("--force", action="store_true",
+                        help="Recompress every asset, ignoring the manifest.")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes (default: CPU count).")
+    parser.add_argument("--only", nargs="+", metavar="PATH",
+                        help="Only minify/compress these asset paths (relative to PythonFiles); "
+                             "the rest are left untouched.")
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
+
+def find_assets(patterns):
+    """Return the sorted, de-duplicated files matching any glob pattern."""
+    paths = set()
+    for pattern in patterns:
+        paths.update(p for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
+    return sorted(os.path.normpath(p) for p in paths)
+
+def load_manifest(path):
+    """Load the compression manifest, returning an empty one if missing or stale."""
+    empty = {"version": MANIFEST_VERSION, "outputs": {}}
+    if not os.path.isfile(path):
+        return empty
+    try:
+        with open(path, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[WARNING] Ignoring unreadable manifest {path}: {e}")
+        return empty
+    return manifest if manifest.get("version") == MANIFEST_VERSION else empty
+
+def save_manifest(path, manifest):
+    """Write the compression manifest atomically."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def write_atomic(path, data):
+    """Write bytes via a temp file so readers never see a partial file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+# ================
+# SVG MINIFICATION
+# ================
+def split_css_rules(css):
+    """Split a stylesheet into top-level rules, keeping nested blocks (@keyframes) whole."""
+    rules, depth, start = [], 0, 0
+    for i, ch in enumerate(css):
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append(css[start:i + 1].strip())
+                start = i + 1
+    return [r for r in rules if r]
+
+def prune_css(css, used_classes):
+    """
+    Drop rules whose selectors all need a class the document never uses, then
+    @keyframes no remaining rule animates. Mermaid ships its whole theme
+    (error icons, edge animations, every node shape) in each diagram.
+    """
+    kept = []
+    for rule in split_css_rules(css):
+        if rule.startswith("@"):
+            kept.append(rule)
+            continue
+        selectors, body = rule.split("{", 1)
+        live = [
+            sel for sel in selectors.split(",")
+            if set(re.findall(r"\.([\w-]+)", sel)) <= used_classes
+        ]
+        if live:
+            kept.append(",".join(s.strip() for s in live) + "{" + body)
+    plain_rules = "".join(r for r in kept if not r.startswith("@keyframes"))
+    animated = set()
+    for value in re.findall(r"animation(?:-name)?\s*:([^;}]*)", plain_rules):
+        animated.update(re.findall(r"[\w-]+", value))
+    return "".join(
+        rule for rule in kept
+        if not rule.startswith("@keyframes")
+        or re.match(r"@keyframes\s+([\w-]+)", rule).group(1) in animated
+    )
+
+def round_numbers(value):
+    """Round long decimals in an attribute value to SVG_DECIMALS places."""
+    def shorten(match):
+        text = f"{float(match.group(0)):.{SVG_DECIMALS}f}".rstrip("0").rstrip(".")
+        return text if text not in ("", "-0") else "0"
+    return re.sub(rf"-?\d+\.\d{{{SVG_DECIMALS + 1},}}", shorten, value)
+
+def strip_tag_whitespace(svg):
+    """
+    Drop whitespace between structural tags, leaving everything inside
+    SVG_TEXT_ELEMENTS alone: whitespace between <tspan>s (or HTML label
+    spans) there is part of the label.
+    """
+    names = "|".join(SVG_TEXT_ELEMENTS)
+    return re.sub(
+        rf"(<({names})\b.*?</\2>)|(?<=>)\s+(?=<)",
+        lambda m: m.group(1) or "",
+        svg, flags=re.S
+    )
+
+def minify_svg(svg):
+    """Return a smaller but equivalent Mermaid SVG."""
+    svg = re.sub(r"<!--.*?-->", "", svg, flags=re.S)
+    svg = re.sub(r"<metadata\b.*?</metadata>", "", svg, flags=re.S)
+    svg = strip_tag_whitespace(svg)
+    used_classes = set()
+    for classes in re.findall(r'\bclass="([^"]*)"', svg):
+        used_classes.update(classes.split())
+    svg = re.sub(
+        r"(<style[^>]*>)(.*?)(</style>)",
+        lambda m: m.group(1) + prune_css(m.group(2), used_classes) + m.group(3),
+        svg, flags=re.S
+    )
+    attrs = "|".join(SVG_NUMERIC_ATTRS)
+    return re.sub(
+        rf'(\s(?:{attrs})=")([^"]*)(")',
+        lambda m: m.group(1) + round_numbers(m.group(2)) + m.group(3),
+        svg
+    )
+
+def minify_svg_file(path):
+    """Minify an SVG in place; returns (bytes before, bytes after)."""
+    with open(path, "r", encoding="utf-8") as f:
+        original = f.read()
+    minified = minify_svg(original)
+    if minified != original:
+        write_atomic(path, minified.encode("utf-8"))
+    return len(original.encode("utf-8")), len(minified.encode("utf-8"))
+
+# ===========
+# COMPRESSION
+# ===========
+def compress_file(path, encodings):
+    """
+    Write compressed siblings of one file. An encoding that would not be
+    smaller than the source is skipped and any old sibling removed.
+    Returns {encoding: compressed bytes or None}.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    results = {}
+    for encoding in encodings:
+        if encoding == "br":
+            compressed = brotli.compress(data, quality=BROTLI_QUALITY)
+        else:
+            compressed = gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+        output_path = f"{path}.{encoding}"
+        if len(compressed) >= len(data):
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            results[encoding] = None
+            continue
+        write_atomic(output_path, compressed)
+        results[encoding] = len(compressed)
+    return results
+
+def file_signature(path, encodings):
+    """Return the hash of a file's bytes plus the compression settings."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        digest.update(f.read())
+    settings = {"encodings": encodings, "gzip": GZIP_LEVEL, "brotli": BROTLI_QUALITY}
+    digest.update(json.dumps(settings, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+def remove_orphans(patterns, manifest):
+    """
+    Delete .gz/.br siblings whose source was deleted or renamed, and drop
+    manifest records of sources that no longer exist. Returns the number of
+    files removed.
+    """
+    removed = 0
+    siblings = find_assets([f"{pattern}.{enc}" for pattern in patterns for enc in ("gz", "br")])
+    for path in siblings:
+        if not os.path.isfile(os.path.splitext(path)[0]):
+            os.remove(path)
+            removed += 1
+            print(f"Removed: {path} (source is gone)")
+    for path in [p for p in manifest["outputs"] if not os.path.isfile(p)]:
+        del manifest["outputs"][path]
+    for path in [p for p in manifest["skipped"] if not os.path.isfile(os.path.splitext(p)[0])]:
+        del manifest["skipped"][path]
+    return removed
+
+def is_current(manifest, path, signature, encodings):
+    """Return True if every sibling was written from this exact source."""
+    if manifest["outputs"].get(path) != signature:
+        return False
+    return all(
+        os.path.isfile(f"{path}.{enc}") or manifest.get("skipped", {}).get(f"{path}.{enc}") == signature
+        for enc in encodings
+    )
+
+# =====
+# MAIN
+# =====
+def main():
+    """Minify SVG output, then write .br/.gz siblings for every changed text asset."""
+    args = parse_args()
+    encodings = ["br", "gz"] if brotli else ["gz"]
+    if brotli is None:
+        print("[WARNING] Python module 'brotli' not installed; writing .gz only "
+              "(install with 'pip install brotli').")
+
+    only = {os.path.normpath(p) for p in args.only} if args.only else None
+
+    # Minify SVGs first so their compressed siblings match the minified bytes
+    svgs = [p for p in find_assets(SVG_PATTERNS) if only is None or p in only]
+    if svgs:
+        before = after = 0
+        for path in svgs:
+            old, new = minify_svg_file(path)
+            before += old
+            after += new
+        print(f"[INFO] Minified {len(svgs)} SVG(s): {before / 1024:.0f} KB -> {after / 1024:.0f} KB")
+
+    assets = [p for p in find_assets(ASSET_PATTERNS) if only is None or p in only]
+    manifest = load_manifest(MANIFEST_PATH)
+    manifest.setdefault("skipped", {})
+    remove_orphans(ASSET_PATTERNS, manifest)
+    pending = []
+    for path in assets:
+        signature = file_signature(path, encodings)
+        if args.force or not is_current(manifest, path, signature, encodings):
+            pending.append((path, signature))
+    print(f"[INFO] {len(pending)} of {len(assets)} asset(s) need compressing "
+          f"({', '.join(encodings)}) with {args.jobs} worker(s).")
+
+    source_bytes = compressed_bytes = failed = 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [executor.submit(compress_file, path, encodings) for path, _ in pending]
+        for (path, signature), future in zip(pending, futures):
+            try:
+                results = future.result()
+            except Exception as e:
+                print(f"[ERROR] Failed compressing {path}: {type(e).__name__}: {e}")
+                failed += 1
+                continue
+            manifest["outputs"][path] = signature
+            for encoding, size in results.items():
+                if size is None:
+                    manifest["skipped"][f"{path}.{encoding}"] = signature
+                else:
+                    manifest["skipped"].pop(f"{path}.{encoding}", None)
+            size = os.path.getsize(path)
+            best = min((s for s in results.values() if s is not None), default=size)
+            source_bytes += size
+            compressed_bytes += best
+            print(f"Saved: {path} ({size} -> {best} bytes)")
+
+    save_manifest(MANIFEST_PATH, manifest)
+    if pending:
+        print(f"[INFO] Compressed {source_bytes / 1024:.0f} KB of assets to "
+              f"{compressed_bytes / 1024:.0f} KB (smallest encoding each).")
+    print(f"[INFO] Assets compressed: {len(pending) - failed}, "
+          f"skipped (unchanged): {len(assets) - len(pending)}, failed: {failed}")
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
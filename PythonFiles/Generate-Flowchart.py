@@ -5,24 +5,68 @@
 # =======
 # IMPORTS
 # =======
+import argparse
+import atexit
+import cProfile
+import hashlib
 import json
+import pstats
+import re
 import sys
 import os
 import shutil
+import struct
+import subprocess
 import textwrap
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import graphviz
 from graphviz import Digraph
 
 # =========
 # CONSTANTS
 # =========
 
-# Folder paths and required command
+# Folder paths and required command. Each PNG also gets an SVG master next to
+# its JSON, which Image-Optimizer.py rasterizes directly at every target width
+# (masters are build output, like the render cache, and are not committed)
 FLOWCHART_DIR = "../diagrams/flowCharts"
 CONFIG_PATH = "../diagrams/FlowConfig.json"
 OUTPUT_DIR = "../projects/images/main/original"
+SVG_MASTER_DIR = FLOWCHART_DIR
 CHECK_CMD = "dot"
 CHECK_DES = "Graphviz binary"
 
+# Render cache: skip dot.render when the DOT source, Graphviz version and
+# output PNG are all unchanged since the last run. Each entry also keeps the
+# diagram's computed layout (node positions and edge splines)
+RENDER_CACHE_PATH = "../diagrams/flowchart-render-cache.json"
+RENDER_CACHE_VERSION = 3
+
+# Attributes that only change how a laid-out diagram is painted, never node
+# sizes or placement; edits to these reuse the cached layout
+VISUAL_ATTRIBUTES = ("bgcolor", "color", "fillcolor", "fontcolor", "gradientangle", "style")
+
+# Layout format written next to every fresh dot render, and the engine that
+# re-renders style-only edits from those fixed positions
+LAYOUT_FORMAT = "json0"
+POSITIONED_ENGINE = "neato"
+POSITIONED_ARGS = ["-n2"]
+
+# One edge statement as the graphviz module writes it: tail -> head [attributes]
+EDGE_STATEMENT = re.compile(
+    r'\t(?P<tail>"(?:[^"\\]|\\.)*"|[^\s"\[]+) -> (?P<head>"(?:[^"\\]|\\.)*"|[^\s"\[]+)'
+    r'(?: \[(?P<attrs>.*)\])?\n?',
+    re.S
+)
+
+# Seconds a single diagram may spend in Graphviz before it is killed
+RENDER_TIMEOUT = 60
+
+# How many of the slowest/largest diagrams the end-of-run metrics summary lists
+METRICS_SUMMARY_COUNT = 5
+
 # ================
 # HELPER FUNCTIONS
 # ================
@@ -47,6 +91,26 @@ def load_json(path):
     with open(path, "r") as f:
         return json.load(f)
 
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Generate flowchart PNGs from JSON definitions.")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-render every diagram, ignoring the render cache.")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Maximum diagrams rendered at once (default: CPU count).")
+    parser.add_argument("--only", nargs="+", metavar="NAME",
+                        help="Only process these diagram JSON file names.")
+    parser.add_argument("--timeout", type=float, default=RENDER_TIMEOUT,
+                        help=f"Per-diagram Graphviz timeout in seconds (default: {RENDER_TIMEOUT}).")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="Write per-diagram timing and size metrics to PATH as JSON lines.")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="Dump cProfile stats for the run to PATH.")
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
+
 def shape_for(type_, shape_map):
     """Return the shape for a given node type, defaulting to 'box'."""
     return shape_map.get(type_, "box")
@@ -68,13 +132,277 @@ def apply_class_styles(dot, class_definitions, class_map, node_style):
             # Merge with default styles and apply to node
             dot.node(node_id, _attributes={**node_style, **style_dict})
 
+# ============
+# RENDER CACHE
+# ============
+
+def file_sha256(path):
+    """Return the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_render_cache(path):
+    """Load the render cache, returning an empty one if missing or unreadable."""
+    empty = {"version": RENDER_CACHE_VERSION, "diagrams": {}}
+    if not os.path.isfile(path):
+        return empty
+    try:
+        with open(path, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[WARNING] Ignoring unreadable render cache {path}: {e}")
+        return empty
+    if cache.get("version") != RENDER_CACHE_VERSION:
+        return empty
+    return cache
+
+def save_render_cache(path, cache):
+    """Write the render cache atomically."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def render_key(dot_source, graphviz_version, fmt):
+    """
+    Hash everything that affects the rendered output. The DOT source already
+    holds the diagram JSON merged with FlowConfig defaults, styles and classes.
+    """
+    payload = json.dumps({"source": dot_source, "graphviz": graphviz_version, "format": fmt})
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def layout_key(dot_source, graphviz_version):
+    """
+    Hash only what affects the layout: topology, labels, fonts, shapes, sizes
+    and graph spacing. Visual attributes are stripped, so a colour or style
+    change keeps the same key. Quoted strings (labels) are never rewritten.
+
+    >>> layout_key('node [color=black shape=box]', "9") == layout_key('node [color=red shape=box]', "9")
+    True
+    >>> layout_key('a [label="color=red"]', "9") == layout_key('a [label="color=blue"]', "9")
+    False
+    """
+    attrs = "|".join(VISUAL_ATTRIBUTES)
+    stripped = re.sub(
+        rf'("(?:[^"\\]|\\.)*")|(?<=[\s\[,])(?:{attrs})=(?:"(?:[^"\\]|\\.)*"|[^\s\],]+)',
+        lambda m: m.group(1) or "",
+        dot_source
+    )
+    payload = json.dumps({"layout": stripped, "graphviz": graphviz_version})
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def cached_layout(cache, output_path, key):
+    """Return the stored layout for output_path if it was computed for this layout key."""
+    entry = cache["diagrams"].get(os.path.normpath(output_path))
+    if not entry or entry.get("layout_key") != key:
+        return None
+    return entry.get("layout")
+
+def is_cached(cache, output_path, svg_path, key):
+    """Return True if output_path and svg_path exist and are the files rendered for this key."""
+    entry = cache["diagrams"].get(os.path.normpath(output_path))
+    if not entry or entry["key"] != key:
+        return False
+    if not (os.path.isfile(output_path) and os.path.isfile(svg_path)):
+        return False
+    return (file_sha256(output_path) == entry["output_sha256"]
+            and file_sha256(svg_path) == entry.get("svg_sha256"))
+
+def record_render(cache, output_path, key, output_sha256, svg_sha256, layout_key, layout):
+    """Store the keys, output hashes and layout of a freshly rendered diagram."""
+    cache["diagrams"][os.path.normpath(output_path)] = {
+        "key": key,
+        "output_sha256": output_sha256,
+        "svg_sha256": svg_sha256,
+        "layout_key": layout_key,
+        "layout": layout
+    }
+
+# =======
+# METRICS
+# =======
+
+def open_metrics(path):
+    """Return the metrics state: collected records plus an optional JSON lines file."""
+    stream = open(path, "w") if path else None
+    return {"stream": stream, "records": []}
+
+def emit_metric(metrics, record):
+    """Record one diagram's metrics and append it to the JSON lines file, if any."""
+    metrics["records"].append(record)
+    if metrics["stream"]:
+        metrics["stream"].write(json.dumps(record) + "\n")
+        metrics["stream"].flush()
+
+def close_metrics(metrics):
+    """Print the slowest and largest diagrams and close the JSON lines file."""
+    records = metrics["records"]
+    if records:
+        print(f"\n[INFO] Slowest diagrams (of {len(records)}):")
+        for r in sorted(records, key=lambda r: r["seconds"], reverse=True)[:METRICS_SUMMARY_COUNT]:
+            stages = ", ".join(f"{k} {v:.2f}s" for k, v in r["stages"].items())
+            print(f"  {r['seconds']:.2f}s  {r['item']} ({stages})")
+        print("[INFO] Largest outputs:")
+        for r in sorted(records, key=lambda r: r["output_bytes"], reverse=True)[:METRICS_SUMMARY_COUNT]:
+            print(f"  {r['output_bytes'] / 1024:.0f} KB  {r['item']} "
+                  f"({r['width']}x{r['height']}, {r['compression_ratio']}:1)")
+    if metrics["stream"]:
+        metrics["stream"].close()
+
+def start_profiler(path):
+    """Profile the rest of this process and dump cProfile stats to path on exit."""
+    profiler = cProfile.Profile()
+
+    def dump():
+        profiler.disable()
+        profiler.dump_stats(path)
+        print(f"[INFO] cProfile stats written to {path}")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+
+    atexit.register(dump)
+    profiler.enable()
+
+def png_dimensions(data):
+    """Return (width, height) from PNG bytes, or (None, None) for other formats."""
+    if data[:8] != b"\x89PNG\r\n\x1a\n" or len(data) < 24:
+        return None, None
+    return struct.unpack(">II", data[16:24])
+
+# =========
+# RENDERING
+# =========
+
+def render_dot(source, engine, formats, timeout, extra_args=()):
+    """
+    Pipe DOT source through Graphviz once per requested format and return
+    {format: bytes} read straight from stdout; nothing intermediate is written
+    to disk. Graphviz lays out the same source identically every run, so all
+    formats share one layout. Each run is killed after timeout seconds.
+    """
+    rendered = {}
+    for fmt in formats:
+        try:
+            result = subprocess.run(
+                [CHECK_CMD, f"-K{engine}", f"-T{fmt}", *extra_args],
+                input=source.encode("utf-8"),
+                capture_output=True,
+                timeout=timeout,
+                check=False
+            )
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"timed out after {timeout:g}s")
+        if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", "replace").strip()
+            raise RuntimeError(f"{CHECK_CMD} exited {result.returncode}: {stderr}")
+        rendered[fmt] = result.stdout
+    return rendered
+
+def parse_layout(data):
+    """
+    Keep only the geometry of a json0 layout: the bounding box, each node's
+    position and, in edge order, each edge's tail and head node names with its
+    spline and label positions.
+    """
+    graph = json.loads(data)
+    objects = graph.get("objects", [])
+    names = {obj["_gvid"]: obj["name"] for obj in objects}
+    nodes = {obj["name"]: obj["pos"] for obj in objects if "pos" in obj}
+    edges = [
+        {
+            "tail": names[edge["tail"]],
+            "head": names[edge["head"]],
+            "geometry": {k: edge[k] for k in ("pos", "lp", "xlp", "head_lp", "tail_lp") if k in edge}
+        }
+        for edge in sorted(graph.get("edges", []), key=lambda e: e["_gvid"])
+    ]
+    return {"bb": graph.get("bb"), "nodes": nodes, "edges": edges}
+
+def unquote_id(value):
+    """Return a DOT ID as Graphviz names it, without the quotes the graphviz module adds."""
+    if value.startswith('"'):
+        return re.sub(r'\\(.)', r"\1", value[1:-1])
+    return value
+
+def positioned_source(dot, layout):
+    """
+    Return the diagram's current DOT source with the cached geometry pinned
+    onto it, ready for neato -n2. Node sizes are recomputed from the (unchanged)
+    labels and fonts. Each edge statement takes the next cached spline between
+    the same tail and head nodes; raises ValueError when an edge statement
+    has no cached spline (or cannot be read) or cached splines are left over.
+    """
+    splines = {}
+    for edge in layout["edges"]:
+        splines.setdefault((edge["tail"], edge["head"]), deque()).append(edge["geometry"])
+    positioned = dot.copy()
+    for i, line in enumerate(positioned.body):
+        match = EDGE_STATEMENT.fullmatch(line)
+        if not match:
+            if "->" in line.split("[", 1)[0]:
+                raise ValueError(f"cannot pin a cached layout onto edge statement {line.strip()!r}")
+            continue
+        tail, head = unquote_id(match.group("tail")), unquote_id(match.group("head"))
+        if not splines.get((tail, head)):
+            raise ValueError(f"cached layout has no spline for {tail} -> {head}")
+        geometry = " ".join(f'{k}="{v}"' for k, v in splines[(tail, head)].popleft().items())
+        attrs = f"{match.group('attrs')} {geometry}" if match.group("attrs") else geometry
+        positioned.body[i] = f"\t{match.group('tail')} -> {match.group('head')} [{attrs}]\n"
+    if any(splines.values()):
+        raise ValueError("cached layout has edges the diagram no longer draws")
+    for node_id, pos in layout["nodes"].items():
+        positioned.node(node_id, pos=pos)
+    if layout["bb"]:
+        positioned.attr("graph", bb=layout["bb"])
+    return positioned.source
+
+def render_flowchart(dot, layout, timeout):
+    """
+    Render a diagram and its SVG master. A cached layout (a style-only edit)
+    is re-rendered with neato -n2 from its fixed positions; without one, or
+    when the cached layout no longer matches the diagram or neato fails on
+    it, dot lays it out and
+    renders both files and the new layout, each piped from Graphviz.
+    Returns (rendered bytes, SVG bytes, layout, {stage: seconds}).
+    """
+    fmt = dot.format
+    if layout is not None:
+        started = time.perf_counter()
+        try:
+            source = positioned_source(dot, layout)
+        except (KeyError, IndexError, ValueError) as e:
+            print(f"[INFO] {dot.name}: cached layout does not fit ({e}); laying out again.")
+        else:
+            try:
+                rendered = render_dot(source, POSITIONED_ENGINE, [fmt, "svg"], timeout, POSITIONED_ARGS)
+            except RuntimeError as e:
+                print(f"[INFO] {dot.name}: {POSITIONED_ENGINE} could not reuse the cached layout ({e}); "
+                      "laying out again.")
+            else:
+                stages = {"positioned": time.perf_counter() - started}
+                return rendered[fmt], rendered["svg"], layout, stages
+    started = time.perf_counter()
+    rendered = render_dot(dot.source, dot.engine, [fmt, "svg", LAYOUT_FORMAT], timeout)
+    stages = {"render": time.perf_counter() - started}
+    return rendered[fmt], rendered["svg"], parse_layout(rendered[LAYOUT_FORMAT]), stages
+
+def write_output(path, data):
+    """Write rendered bytes via a temp file so a failed write never leaves a partial PNG."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
 # ===================
 # DIAGRAM PREPARATION
 # ===================
 
-def prepare_diagram(name, json_path, config_path):
+def prepare_diagram(name, json_path, config):
     """
-    Load the diagram definition and config, then initialize the Graphviz Digraph.
+    Load the diagram definition and initialize the Graphviz Digraph using
+    the already-loaded config.
     Returns:
     - the diagram object,
     - the raw node/connection/class data,
@@ -82,7 +410,6 @@ def prepare_diagram(name, json_path, config_path):
     """
     print(f"\n[INFO] Generating flowchart: {name}")
     data = load_json(json_path)
-    config = load_json(config_path)
 
     # Load styling/layout options from config
     defaults = config.get("defaults", {})
@@ -100,6 +427,7 @@ def prepare_diagram(name, json_path, config_path):
     dot.attr(arrowsize=defaults.get("arrowsize", "0.6"))
     dot.attr('graph',
              pad=defaults.get("pad", "0.2"),
+             bgcolor=defaults.get("bgcolor", "white"),
              dpi=defaults.get("dpi", "96"),
              splines=defaults.get("splines", "true"))
     dot.attr('node', shape='box', **node_style)
@@ -138,6 +466,36 @@ def add_edge_to_dot(dot, conn, edge_style):
 
     dot.edge(src, dst, **edge_args)
 
+def build_flowchart(name, json_path, config):
+    """Build the complete Graphviz Digraph for one diagram JSON file."""
+    dot, data, config, node_style, edge_style, label_wrap_width, shape_map = prepare_diagram(
+        name, json_path, config
+    )
+
+    # Load class styles from config and allow per-diagram override
+    global_classes = config.get("classes", {})
+    local_classes = data.get("classes", {})
+    classes = {**global_classes, **local_classes}
+
+    # Load flowchart data
+    nodes = data.get("nodes", {})
+    connections = data.get("connections", [])
+    class_map = data.get("class_map", {})
+
+    # Add all nodes with shape and wrapped labels
+    for node_id, props in nodes.items():
+        label = wrap_label(props.get("label", node_id), width=label_wrap_width)
+        shape = shape_for(props.get("shape", "box"), shape_map)
+        dot.node(node_id, label=label, shape=shape, **node_style)
+
+    # Add flowchart edges
+    for conn in connections:
+        add_edge_to_dot(dot, conn, edge_style)
+
+    # Apply class-based node styles
+    apply_class_styles(dot, classes, class_map, node_style)
+    return dot
+
 # =====
 # MAIN
 # =====
@@ -147,6 +505,10 @@ def main():
     Main routine: check requirements, load each diagram JSON from folder,
     and generate flowchart PNGs using base filenames.
     """
+    args = parse_args()
+    if args.profile:
+        start_profiler(args.profile)
+
     # Check that the required Graphviz binary and Python module are installed
     check_command(CHECK_CMD, CHECK_DES)
 
@@ -155,47 +517,85 @@ def main():
         print(f"[ERROR] Output directory does not exist: {OUTPUT_DIR}")
         sys.exit(1)
 
+    # Shared config, Graphviz version and render cache are loaded once per run
+    config = load_json(CONFIG_PATH)
+    graphviz_version = ".".join(str(part) for part in graphviz.version())
+    cache = load_render_cache(RENDER_CACHE_PATH)
+    metrics = open_metrics(args.metrics)
+    rendered, skipped, failed = 0, 0, 0
+    jobs = []
+
     # Loop through all JSON files in the flowchart directory
-    for filename in os.listdir(FLOWCHART_DIR):
+    for filename in sorted(os.listdir(FLOWCHART_DIR)):
         if not filename.endswith("Flow.json"):
             continue
+        if args.only and filename not in args.only:
+            continue
 
         # Derive paths and flow name
         json_path = os.path.join(FLOWCHART_DIR, filename)
         name = filename.removesuffix("Flow.json")
         output_png = os.path.join(OUTPUT_DIR, f"{name}Flow.png")
+        output_svg = os.path.join(SVG_MASTER_DIR, f"{name}Flow.svg")
+
+        # Load the diagram and build its DOT graph
+        dot = build_flowchart(name, json_path, config)
+
+        # Skip Graphviz entirely when this exact source was already rendered
+        key = render_key(dot.source, graphviz_version, dot.format)
+        if not args.force and is_cached(cache, output_png, output_svg, key):
+            print(f"[SKIP] {filename} unchanged → {output_png}")
+            skipped += 1
+            continue
+
+        # Reuse the stored layout when only visual attributes changed
+        lkey = layout_key(dot.source, graphviz_version)
+        layout = None if args.force else cached_layout(cache, output_png, lkey)
+        jobs.append((filename, output_png, output_svg, key, lkey, dot, layout))
 
-        # Load and prepare diagram
-        dot, data, config, node_style, edge_style, label_wrap_width, shape_map = prepare_diagram(
-            name, json_path, CONFIG_PATH
-        )
-
-        # Load class styles from config and allow per-diagram override
-        global_classes = config.get("classes", {})
-        local_classes = data.get("classes", {})
-        classes = {**global_classes, **local_classes}
-        
-        # Load flowchart data
-        nodes = data.get("nodes", {})
-        connections = data.get("connections", [])
-        class_map = data.get("class_map", {})
-
-        # Add all nodes with shape and wrapped labels
-        for node_id, props in nodes.items():
-            label = wrap_label(props.get("label", node_id), width=label_wrap_width)
-            shape = shape_for(props.get("shape", "box"), shape_map)
-            dot.node(node_id, label=label, shape=shape, **node_style)
-
-        # Add flowchart edges
-        for conn in connections:
-            add_edge_to_dot(dot, conn, edge_style)
-
-        # Apply class-based node styles
-        apply_class_styles(dot, classes, class_map, node_style)
-
-        # Export PNG to file path (strip .png from render path)
-        dot.render(filename=output_png.removesuffix(".png"), cleanup=True)
-        print(f"[SUCCESS] {filename} → {output_png}")
+    # Render changed diagrams concurrently; results are reported in order
+    if jobs:
+        relayouts = sum(1 for job in jobs if job[6] is None)
+        print(f"\n[INFO] Rendering {len(jobs)} diagram(s) ({relayouts} needing layout) "
+              f"with up to {args.jobs} worker(s)")
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [
+            executor.submit(render_flowchart, dot, layout, args.timeout)
+            for _, _, _, _, _, dot, layout in jobs
+        ]
+        for (filename, output_png, output_svg, key, lkey, dot, _), future in zip(jobs, futures):
+            try:
+                data, svg_data, layout, stages = future.result()
+            except (OSError, RuntimeError, ValueError, KeyError, IndexError) as e:
+                print(f"[ERROR] Failed to render {filename}: {e}")
+                failed += 1
+                continue
+            write_started = time.perf_counter()
+            write_output(output_png, data)
+            write_output(output_svg, svg_data)
+            stages["write"] = time.perf_counter() - write_started
+            width, height = png_dimensions(data)
+            emit_metric(metrics, {
+                "item": filename,
+                "seconds": round(sum(stages.values()), 4),
+                "stages": {stage: round(seconds, 4) for stage, seconds in stages.items()},
+                "input_bytes": len(dot.source.encode("utf-8")),
+                "output_bytes": len(data),
+                "width": width,
+                "height": height,
+                "compression_ratio": round(width * height * 4 / len(data), 2) if width and data else None,
+            })
+            record_render(cache, output_png, key, hashlib.sha256(data).hexdigest(),
+                          hashlib.sha256(svg_data).hexdigest(), lkey, layout)
+            rendered += 1
+            reused = " (cached layout)" if "positioned" in stages else ""
+            print(f"[SUCCESS] {filename} → {output_png}{reused}")
+
+    save_render_cache(RENDER_CACHE_PATH, cache)
+    close_metrics(metrics)
+    print(f"\n[INFO] Flowcharts rendered: {rendered}, skipped (unchanged): {skipped}, failed: {failed}")
+    if failed:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -5,10 +5,18 @@
 # =======
 # IMPORTS
 # =======
+import argparse
+import atexit
+import cProfile
 import json
+import pstats
+import queue
+import struct
 import subprocess
 import sys
 import shutil
+import threading
+import time
 from pathlib import Path
 
 # =========
@@ -18,6 +26,18 @@ SITEMAP_DIR = Path("../diagrams/siteMaps")
 OUTPUT_DIR = Path("../projects/images/main/original")
 CONFIG_FILE = "../diagrams/siteMermaidConfig.json"
 MMDC_COMMAND = str(shutil.which("mmdc") or "mmdc")
+PNG_SCALE = 4
+
+# Persistent renderer: one Node/Chromium process renders every diagram
+BATCH_RENDERER = Path("Mermaid-Batch-Renderer.mjs")
+MERMAID_CLI_PACKAGE = "@mermaid-js/mermaid-cli"
+
+# Seconds the batch renderer may spend on one diagram before it is stopped and
+# the remaining diagrams fall back to mmdc
+BATCH_JOB_TIMEOUT = 120
+
+# How many of the slowest/largest diagrams the end-of-run metrics summary lists
+METRICS_SUMMARY_COUNT = 5
 
 # Constants for Mermaid rendering
 MERMAID_STYLE_KEYS = [
@@ -57,6 +77,96 @@ def check_command(cmd, description=None):
         sys.exit(1)
     print(f"[OK] Found '{cmd}' at: {path}")
 
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Generate Mermaid site map diagrams.")
+    parser.add_argument("--no-batch", action="store_true",
+                        help="Run mmdc once per output instead of the persistent batch renderer.")
+    parser.add_argument("--only", nargs="+", metavar="NAME",
+                        help="Only process these site map JSON file names.")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="Write per-diagram timing and size metrics to PATH as JSON lines.")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="Dump cProfile stats for the run to PATH.")
+    return parser.parse_args()
+
+def find_mermaid_cli_dir(mmdc_cmd):
+    """Return the mermaid-cli package directory behind the mmdc command, or None."""
+    path = shutil.which(mmdc_cmd)
+    if path is None:
+        return None
+    for parent in Path(path).resolve().parents:
+        package_json = parent / "package.json"
+        if not package_json.is_file():
+            continue
+        try:
+            if json.loads(package_json.read_text()).get("name") == MERMAID_CLI_PACKAGE:
+                return parent
+        except ValueError:
+            continue
+    return None
+
+# =======
+# METRICS
+# =======
+def open_metrics(path):
+    """Return the metrics state: collected records plus an optional JSON lines file."""
+    stream = open(path, "w") if path else None
+    return {"stream": stream, "records": []}
+
+def emit_metric(metrics, record):
+    """Record one diagram's metrics and append it to the JSON lines file, if any."""
+    metrics["records"].append(record)
+    if metrics["stream"]:
+        metrics["stream"].write(json.dumps(record) + "\n")
+        metrics["stream"].flush()
+
+def close_metrics(metrics):
+    """Print the slowest and largest diagrams and close the JSON lines file."""
+    records = metrics["records"]
+    if records:
+        print(f"\n[INFO] Slowest diagrams (of {len(records)}):")
+        for r in sorted(records, key=lambda r: r["seconds"], reverse=True)[:METRICS_SUMMARY_COUNT]:
+            stages = ", ".join(f"{k} {v:.2f}s" for k, v in r["stages"].items())
+            print(f"  {r['seconds']:.2f}s  {r['item']} ({stages})")
+        print("[INFO] Largest outputs:")
+        for r in sorted(records, key=lambda r: r["output_bytes"], reverse=True)[:METRICS_SUMMARY_COUNT]:
+            print(f"  {r['output_bytes'] / 1024:.0f} KB  {r['item']} "
+                  f"({r['width']}x{r['height']}, {r['compression_ratio']}:1)")
+    if metrics["stream"]:
+        metrics["stream"].close()
+
+def start_profiler(path):
+    """Profile the rest of this process and dump cProfile stats to path on exit."""
+    profiler = cProfile.Profile()
+
+    def dump():
+        profiler.disable()
+        profiler.dump_stats(path)
+        print(f"[INFO] cProfile stats written to {path}")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+
+    atexit.register(dump)
+    profiler.enable()
+
+def diagram_metric(mmd_file, svg_file, png_file, stages):
+    """Build the metrics record for one rendered diagram from its files on disk."""
+    png_bytes = png_file.stat().st_size
+    with open(png_file, "rb") as f:
+        header = f.read(24)
+    width, height = struct.unpack(">II", header[16:24]) if header[:4] == b"\x89PNG" else (None, None)
+    return {
+        "item": mmd_file.name,
+        "seconds": round(sum(stages.values()), 4),
+        "stages": {k: round(v, 4) for k, v in stages.items()},
+        "input_bytes": mmd_file.stat().st_size,
+        "output_bytes": png_bytes,
+        "svg_bytes": svg_file.stat().st_size,
+        "width": width,
+        "height": height,
+        "compression_ratio": round(width * height * 4 / png_bytes, 2) if width and png_bytes else None,
+    }
+
 # =====================
 # MERMAID BUILD HELPERS
 # =====================
@@ -75,31 +185,155 @@ def write_mermaid_def(mermaid_lines, kind, key, value):
     """Write a single Mermaid style/class/classDef line."""
     mermaid_lines.append(f"  {kind} {key} {value}")
 
+def build_mermaid_lines(site_data):
+    """
+    Build the Mermaid source lines for one site map definition.
+    Returns None if the required meta keys are missing.
+    """
+    meta = site_data.get("meta", {})
+    if "key_main" not in meta or "key_links" not in meta:
+        return None
+
+    mermaid_lines = ["graph TD\n"]
+
+    # Build subgraphs (up to 4 levels)
+    for key_level in ("key_main", "key_second", "key_third", "key_fourth"):
+        if key_level in meta:
+            node_key = meta[key_level]
+            if node_key in site_data:
+                label = meta.get(key_level.replace("key_", "") + "_label", node_key)
+                title = meta.get(key_level.replace("key_", "") + "_title", label)
+                write_subgraph(mermaid_lines, label, title, site_data[node_key])
+
+    # Add links
+    for source, target in site_data.get(meta["key_links"], []):
+        write_link(mermaid_lines, source, target)
+
+    # Apply styles and classes
+    for kind, meta_key in MERMAID_STYLE_KEYS:
+        data_key = meta.get(meta_key)
+        if data_key and data_key in site_data:
+            for k, v in site_data[data_key].items():
+                write_mermaid_def(mermaid_lines, kind, k, v)
+    return mermaid_lines
+
 # =========
 # RENDERING
 # =========
-def render_mermaid_files(mmd_file, svg_file, png_file, mmdc_cmd, config_path=None):
+def render_mermaid_files(mmd_file, svg_file, png_file, mmdc_cmd, metrics, config_path=None):
     """Render Mermaid .mmd file to SVG and high-res PNG using Mermaid CLI."""
     base_cmd = [mmdc_cmd, "-i", str(mmd_file)]
     if config_path:
         base_cmd.extend(["-c", config_path])
 
     try:
+        started = time.perf_counter()
         subprocess.run(base_cmd + ["-o", str(svg_file)], check=True)
         print(f"[SUCCESS] SVG saved to: {svg_file}")
-        
-        subprocess.run(base_cmd + ["-o", str(png_file), "--scale", "4"], check=True)
+        svg_done = time.perf_counter()
+
+        subprocess.run(base_cmd + ["-o", str(png_file), "--scale", str(PNG_SCALE)], check=True)
         print(f"[SUCCESS] PNG saved to: {png_file}")
+        stages = {"svg": svg_done - started, "png": time.perf_counter() - svg_done}
+        emit_metric(metrics, diagram_metric(mmd_file, svg_file, png_file, stages))
 
     except subprocess.CalledProcessError as e:
         print(f"[ERROR] Failed to render Mermaid diagram: {e}")
         sys.exit(1)
 
+def start_reply_reader(proc):
+    """Queue every stdout line of the renderer from a thread; None marks its exit."""
+    replies = queue.Queue()
+
+    def read():
+        for line in proc.stdout:
+            replies.put(line)
+        replies.put(None)
+
+    threading.Thread(target=read, daemon=True).start()
+    return replies
+
+def wait_for_reply(replies, mmd_file, deadline):
+    """
+    Return the renderer's JSON result for the job in flight. Lines that are not
+    a result (Chromium or puppeteer chatter) are logged and skipped. Raises
+    RuntimeError if the renderer exits or the deadline passes first.
+    """
+    while True:
+        remaining = deadline - time.monotonic()
+        try:
+            line = replies.get(timeout=max(0, remaining))
+        except queue.Empty:
+            raise RuntimeError(f"no reply within {BATCH_JOB_TIMEOUT}s while rendering {mmd_file}")
+        if line is None:
+            raise RuntimeError(f"renderer exited while rendering {mmd_file}")
+        try:
+            result = json.loads(line)
+        except ValueError:
+            result = None
+        if isinstance(result, dict) and "ok" in result:
+            return result
+        print(f"[renderer] {line.rstrip()}")
+
+def render_mermaid_batch(jobs, renderer_cmd, metrics, config_path=None):
+    """
+    Render (mmd, svg, png) jobs through one persistent renderer process.
+    Jobs are sent one JSON line at a time and each reply is awaited for up to
+    BATCH_JOB_TIMEOUT seconds before the next is sent. Returns (failed job
+    count, jobs left unrendered): if the renderer cannot start, exits early or
+    misses a deadline, it is stopped and every job from that one on is left
+    for the mmdc fallback.
+    """
+    failures = 0
+    try:
+        proc = subprocess.Popen(renderer_cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    except OSError as e:
+        print(f"[WARNING] Batch renderer unavailable ({e}).")
+        return failures, list(jobs)
+    replies = start_reply_reader(proc)
+    try:
+        for index, (mmd_file, svg_file, png_file) in enumerate(jobs):
+            request = {
+                "input": str(mmd_file),
+                "svg": str(svg_file),
+                "png": str(png_file),
+                "scale": PNG_SCALE,
+                "config": config_path
+            }
+            started = time.perf_counter()
+            try:
+                proc.stdin.write(json.dumps(request) + "\n")
+                proc.stdin.flush()
+                result = wait_for_reply(replies, mmd_file, time.monotonic() + BATCH_JOB_TIMEOUT)
+            except (OSError, RuntimeError) as e:
+                print(f"[WARNING] Batch renderer stopped ({e}).")
+                return failures, list(jobs[index:])
+            if result.get("ok"):
+                print(f"[SUCCESS] SVG saved to: {svg_file}")
+                print(f"[SUCCESS] PNG saved to: {png_file}")
+                stages = {"render": time.perf_counter() - started}
+                emit_metric(metrics, diagram_metric(mmd_file, svg_file, png_file, stages))
+            else:
+                print(f"[ERROR] Failed to render {mmd_file}: {result.get('error')}")
+                failures += 1
+        proc.stdin.close()
+        proc.wait(timeout=BATCH_JOB_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired):
+        pass  # every job has its reply; a slow shutdown is not a failure
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+    return failures, []
+
 # =====
 # MAIN
 # =====
 def main():
     """Main routine to generate and render all Mermaid diagrams."""
+    args = parse_args()
+    if args.profile:
+        start_profiler(args.profile)
     print("[INFO] If rendering fails, try running this script from a terminal.")
     print("Example: python3 generate_site_maps.py\n")
 
@@ -114,48 +348,54 @@ def main():
         sys.exit(1)
 
     # Process all JSON files in the sitemap directory
+    jobs = []
     for json_file in sorted(SITEMAP_DIR.glob("*.json")):
+        if args.only and json_file.name not in args.only:
+            continue
         name = json_file.stem
         print(f"\n[INFO] Processing: {name}")
 
         site_data = load_json(json_file)
-        meta = site_data.get("meta", {})
+        mermaid_lines = build_mermaid_lines(site_data)
 
         # Validate required meta keys
-        if "key_main" not in meta or "key_links" not in meta:
+        if mermaid_lines is None:
             print(f"[WARNING] Skipping {json_file.name}: Missing required meta keys.")
             continue
 
-        mermaid_lines = ["graph TD\n"]
-
-        # Build subgraphs (up to 4 levels)
-        for key_level in ("key_main", "key_second", "key_third", "key_fourth"):
-            if key_level in meta:
-                node_key = meta[key_level]
-                if node_key in site_data:
-                    label = meta.get(key_level.replace("key_", "") + "_label", node_key)
-                    title = meta.get(key_level.replace("key_", "") + "_title", label)
-                    write_subgraph(mermaid_lines, label, title, site_data[node_key])
-
-        # Add links
-        for source, target in site_data.get(meta["key_links"], []):
-            write_link(mermaid_lines, source, target)
-
-        # Apply styles and classes
-        for kind, meta_key in MERMAID_STYLE_KEYS:
-            data_key = meta.get(meta_key)
-            if data_key and data_key in site_data:
-                for k, v in site_data[data_key].items():
-                    write_mermaid_def(mermaid_lines, kind, k, v)
-
         # Derive output paths
         mmd_file = json_file.with_suffix(".mmd")
         svg_file = json_file.with_suffix(".svg")
         png_file = OUTPUT_DIR / (json_file.stem + ".png")
 
-        # Write and render
+        # Write now, render all diagrams together below
         write_mermaid_file(mermaid_lines, mmd_file)
-        render_mermaid_files(mmd_file, svg_file, png_file, MMDC_COMMAND, config_path=CONFIG_FILE)
+        jobs.append((mmd_file, svg_file, png_file))
+
+    if not jobs:
+        print("[WARNING] No diagrams to render.")
+        return
+
+    # Render through the persistent renderer; whatever it leaves unrendered
+    # falls back to one mmdc call per output
+    metrics = open_metrics(args.metrics)
+    failures = 0
+    remaining = jobs
+    cli_dir = None if args.no_batch else find_mermaid_cli_dir(MMDC_COMMAND)
+    if cli_dir is not None:
+        print(f"\n[INFO] Rendering {len(jobs)} diagrams with one batch renderer ({cli_dir})")
+        renderer_cmd = ["node", str(BATCH_RENDERER), str(cli_dir)]
+        failures, remaining = render_mermaid_batch(jobs, renderer_cmd, metrics, config_path=CONFIG_FILE)
+        if remaining:
+            print(f"[WARNING] Falling back to mmdc per file for {len(remaining)} diagram(s).")
+    elif not args.no_batch:
+        print(f"[WARNING] Could not locate {MERMAID_CLI_PACKAGE} behind '{MMDC_COMMAND}'; using mmdc per file.")
+    for mmd_file, svg_file, png_file in remaining:
+        render_mermaid_files(mmd_file, svg_file, png_file, MMDC_COMMAND, metrics, config_path=CONFIG_FILE)
+    close_metrics(metrics)
+    if failures:
+        print(f"[ERROR] {failures} diagram(s) failed to render.")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
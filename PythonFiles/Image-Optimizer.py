@@ -5,9 +5,31 @@
 #========
 # IMPORTS
 #========
+import argparse
+import atexit
+import base64
+import contextlib
+import copy
+import cProfile
+import glob
+import hashlib
+import io
+import json
+import math
 import os
+import pstats
+import re
+import shutil
 import sys
-from PIL import Image, ImageOps
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image, ExifTags, ImageChops, ImageFilter, ImageMath, ImageOps, ImageStat, features
+
+try:
+    import cairosvg
+except (ImportError, OSError):
+    cairosvg = None
 
 #==========
 # CONSTANTS
@@ -19,24 +41,111 @@ IMAGE_PROFILES = {
         "input_dir": "../images/main/original",
         "output_base": "../images/main/optimized",
         "quality": 90,
+        "no_upscale": True,
+        "png_palette": {"max_source_colors": 8192, "max_error": 1.0},
+        "quality_search": {"target": 0.985, "min_quality": 40},
         "sizes": {
             "desktop": {"standard": 1280, "zoom": 1920},
             "laptop":  {"standard": 1024, "zoom": 1366},
             "mobile":  {"standard": 480,  "zoom": 768}
+        },
+        "formats": {
+            "avif": {"quality": 60},
+            "webp": {"quality": 82, "method": 6}
         }
     },
     "projects": {
         "input_dir": "../projects/images/main/original",
         "output_base": "../projects/images/main/optimized",
+        "image_manifest": "../projects/js/JSON/imageManifest.js",
+        "vector_masters": [{"dir": "../diagrams/flowCharts", "config": "../diagrams/FlowConfig.json"}],
+        "adaptive_widths": {
+            "output_dir": "../projects/images/main/optimized/adaptive",
+            "manifest": "../projects/js/JSON/srcsetManifest.js",
+            "pages": "../projects",
+            "min_width": 320,
+            "max_width": 1920,
+            "byte_delta": 20480,
+            "max_widths": 8,
+            "probe": {"format": "webp", "options": {"quality": 82, "method": 4}},
+            "replaces": "standard"
+        },
+        "deep_zoom": {
+            "output_dir": "../projects/images/main/optimized/tiles",
+            "manifest": "../projects/js/JSON/deepZoom.js",
+            "pages": "../projects",
+            "min_width": 3841,
+            "vector_scale": 2,
+            "tile_size": 256,
+            "overlap": 1,
+            "format": "webp",
+            "options": {"quality": 90, "method": 4}
+        },
         "quality": 90,
+        "no_upscale": True,
+        "png_palette": {"max_source_colors": 8192, "max_error": 1.0},
+        "quality_search": {"target": 0.985, "min_quality": 40},
         "sizes": {
             "desktop": {"standard": 1280, "zoom": 1920},
             "laptop":  {"standard": 1024, "zoom": 1366},
             "mobile":  {"standard": 480,  "zoom": 768}
+        },
+        "formats": {
+            "avif": {"quality": 60},
+            "webp": {"quality": 82, "method": 6}
         }
     }
 }
 
+# Any IMAGE_PROFILES or ASSET_SETS entry may add a "formats" map of extra
+# encodings (webp/avif) to Pillow save options; each is written next to the
+# source-format variant as <name>.<format>. "no_upscale" caps every variant
+# at the source width; slots that end up identical are hardlinked together.
+# "png_palette" lets low-colour PNGs (flowcharts, site maps) be saved as 8-bit
+# palette images when the blurred RMS colour error stays within "max_error".
+# An IMAGE_PROFILES "image_manifest" path gets a JS data file with each
+# source's intrinsic size, a tiny inline placeholder and the extra formats
+# whose variants were written at every size, read by js/responsiveImageLoader.js
+# and projects/js/carousel.js to reserve layout space before images load and to
+# offer only <source> types that exist.
+# "quality_search" replaces the fixed quality of lossy JPEG/WebP variants with
+# the lowest quality (and, for JPEG, chroma subsampling) whose SSIM against the
+# resized image still reaches "target", searched between "min_quality" and the
+# configured quality on the widest variant and cached per source hash. WebP
+# with transparency is compared with its alpha band.
+# An IMAGE_PROFILES "vector_masters" list names folders of SVG masters, each
+# with the diagram config they were drawn from: a source with a same-named .svg
+# there (the flowcharts Generate-Flowchart.py draws) is rasterized straight from
+# the SVG at every target width instead of resampling its PNG, so diagram text
+# stays sharp at any size. The canvas is painted in the config's background
+# colour. This needs the optional cairosvg module (pip install cairosvg, which
+# also needs the Cairo library); without it the PNGs are resampled as before.
+# An IMAGE_PROFILES "adaptive_widths" entry picks each source's own widths
+# instead of the fixed "sizes": starting at "min_width", the next width is the
+# largest one whose "probe" encode is at most "byte_delta" bytes bigger than the
+# last, up to the source width or "max_width". Variants are written as
+# <name>-<width>w.<ext> and listed per image as srcset strings in a JS data
+# file, which js/responsiveImageLoader.js and projects/js/carousel.js prefer
+# over their fixed breakpoints. The srcset covers the fixed widths of the
+# "replaces" version type, so a source with chosen widths gets no variants in
+# those folders (zoom variants are still written for the full-screen modal).
+# An IMAGE_PROFILES "deep_zoom" entry cuts every source wider than "min_width"
+# into a DZI tile pyramid (<name>.dzi plus <name>_files/<level>/<col>_<row>.<format>)
+# and lists them in a JS data file; projects/js/modalZoom.js then shows those
+# images in a tiled viewer that only fetches the tiles in view. "min_width" is
+# the 1920px zoom variant at the viewer's 2x maximum zoom: narrower rasters hold
+# no detail the plain zoom image does not already show. A source with an SVG
+# master (see "vector_masters", needs cairosvg) is tiled from the master
+# rendered at "vector_scale" times the source width instead, and that rendered
+# width is what is compared with "min_width".
+# An ASSET_SETS "sprite" packs the icons of the set into one sheet per scale
+# (icons@2x.png for scale 2, plus one per extra "formats" entry), with a CSS
+# file and a JS coordinate map that js/skillsLoader.js uses instead of one
+# request per icon. Cells are "display_width" CSS pixels wide (the .li-icon
+# size) times the sheet's scale; icons whose originals are narrower than the
+# largest scale needs are left out rather than upscaled, and keep their
+# individual file. Only pages showing the full skills grid (resume.html) load
+# the map; pages with a few icons, and the footer, keep individual files.
 ASSET_SETS = {
     "thumbs": {
         "main": {
@@ -57,7 +166,16 @@ ASSET_SETS = {
             "input_dir": "../images/icons/original",
             "output_dir": "../images/icons/optimized",
             "width": 100,
-            "quality": 85
+            "quality": 85,
+            "sprite": {
+                "sheet": "../images/icons/optimized/sprite/icons.png",
+                "css": "../images/icons/optimized/sprite/icons.css",
+                "map": "../js/JSON/iconSprite.js",
+                "display_width": 50,
+                "scales": [1, 2],
+                "padding": 2,
+                "formats": {"webp": {"lossless": True, "method": 6}}
+            }
         }
     }
 }
@@ -69,9 +187,84 @@ FAVICON_CONFIG = {
     "ico_sizes": [16, 32, 48]
 }
 
+# Content-hashed twins of optimized images, so hosts can cache them forever.
+# With "enabled", every image under "roots" (minus "exclude") gets a hardlinked
+# <name>.<hash><ext> copy, "map" lists plain -> hashed URLs (relative to "pages")
+# for the JS loaders, and image URLs in "data_files" are rewritten to the hashed
+# names. Superseded hashes are deleted; disabling removes every twin and
+# restores the plain names.
+FINGERPRINT_CONFIG = {
+    "enabled": False,
+    "roots": ["../projects/images/main/optimized", "../images/icons/optimized"],
+    "exclude": ["../projects/images/main/optimized/tiles", "../images/icons/optimized/sprite"],
+    "map": "../projects/js/JSON/imageFingerprints.js",
+    "pages": "../projects",
+    "data_files": ["../projects/js/JSON/*.js"],
+    "hash_length": 10
+}
+
+# Incremental build manifest (source hash + settings per output variant)
+MANIFEST_PATH = "../images/optimizer-manifest.json"
+MANIFEST_VERSION = 1
+
+# Partial manifest each --shard run writes for --merge to combine
+SHARD_MANIFEST_PATH = "../images/optimizer-manifest.shard-{index}-of-{count}.json"
+
+# Build manifest sections a shard can add to
+MANIFEST_SECTIONS = ("variants", "placeholders", "quality", "breakpoints")
+
+# Device folders, in output order
+DEVICES = ["desktop", "laptop", "mobile"]
+
+# A resized variant is reused as the source for a smaller one once it is at
+# least this many times wider; also passed to Pillow as reducing_gap
+REDUCING_GAP = 3.0
+
+# Memory ceiling per worker process, in MB. Parallel tasks are only started
+# while the estimated memory of everything in flight fits jobs x this value;
+# a single source larger than that runs on its own
+WORKER_MEMORY_MB = 1024
+
+# Box blur radius applied before comparing a palette PNG with its source
+PALETTE_BLUR_RADIUS = 2
+
+# Encodings quality_search tunes, and the block size of its SSIM windows
+SEARCHABLE_EXTS = (".jpg", ".jpeg", ".webp")
+SSIM_BLOCK = 8
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+
+# WebP method used for quality_search probe encodes. Quality, not method,
+# decides how close an encode stays to the source, so probing at a fast method
+# picks the same quality for a fraction of the cost. Bump QUALITY_SEARCH_VERSION
+# when the search changes so cached qualities are searched again
+SEARCH_WEBP_METHOD = 2
+QUALITY_SEARCH_VERSION = 2
+
+# Image info kept in encoded variants; EXIF, XMP and comments are dropped
+KEPT_METADATA = ("icc_profile", "transparency")
+
+# Canvas colour of an SVG master whose diagram config sets none (what Graphviz
+# paints by default, so masters match their PNG renders)
+DEFAULT_VECTOR_BACKGROUND = "white"
+
+# Adaptive widths are searched to this many pixels
+ADAPTIVE_WIDTH_STEP = 16
+
+# Longest side of the inline placeholder images in an image manifest
+PLACEHOLDER_SIZE = 16
+PLACEHOLDER_QUALITY = 40
+
+# How many of the slowest/largest tasks the end-of-run metrics summary lists
+METRICS_SUMMARY_COUNT = 5
+
 REQUIRED_PACKAGES = ["PIL"] 
 VALID_EXTS = ('.jpg', '.jpeg', '.png')
 
+# Output extensions fingerprinting covers, and the URLs it rewrites in data files
+FINGERPRINT_EXTS = VALID_EXTS + ('.webp', '.avif')
+IMAGE_URL_PATTERN = re.compile(r"[\w./-]+\.(?:png|jpe?g|webp|avif)\b", re.I)
+
 #=================
 # HELPER FUNCTIONS
 #=================
@@ -102,60 +295,787 @@ def gather_input_dirs(image_profiles, asset_sets):
             inputs.add(cfg["input_dir"])
     return sorted(inputs)
 
+def is_selected(path, only=None, exclude=None):
+    """Return True if a source file name passes the --only/--exclude filters."""
+    name = os.path.basename(path)
+    if only is not None and name not in only:
+        return False
+    return not (exclude and name in exclude)
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Create responsive website images.")
+    parser.add_argument("--force", action="store_true",
+                        help="Rebuild every variant, ignoring the build manifest.")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes (default: CPU count, 1 runs inline).")
+    parser.add_argument("--only", nargs="+", metavar="NAME",
+                        help="Only process sources with these file names.")
+    parser.add_argument("--exclude", nargs="+", metavar="NAME",
+                        help="Skip sources with these file names.")
+    parser.add_argument("--write-data", action="store_true",
+                        help="With --only, still write data files, sprites and fingerprints, listing the "
+                             "other sources from the build manifest (only when nothing else is writing "
+                             "sources, as in watch mode).")
+    parser.add_argument("--worker-memory", type=int, default=WORKER_MEMORY_MB, metavar="MB",
+                        help=f"Estimated memory ceiling per worker (default: {WORKER_MEMORY_MB} MB).")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="Write per-task timing and size metrics to PATH as JSON lines.")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="Dump cProfile stats to PATH (use --jobs 1 to include image work).")
+    parser.add_argument("--shard", metavar="I/N",
+                        help="Only build shard I of N (1-based): sources are split by a stable hash of "
+                             "their file name, and a partial manifest is written for --merge.")
+    parser.add_argument("--merge", type=int, metavar="N",
+                        help="Combine the partial manifests of shards 1..N, check they cover every "
+                             "source, then finish with a normal run (data files, sprites, cleanup).")
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.worker_memory < 1:
+        parser.error("--worker-memory must be at least 1")
+    if args.shard:
+        match = re.fullmatch(r"(\d+)/(\d+)", args.shard)
+        if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+            parser.error("--shard must be I/N with 1 <= I <= N, e.g. 2/4")
+        args.shard = (int(match.group(1)), int(match.group(2)))
+    if args.merge is not None and args.merge < 1:
+        parser.error("--merge must be at least 1")
+    if args.shard and args.merge:
+        parser.error("--shard and --merge cannot be combined")
+    if args.write_data and (args.shard or args.exclude):
+        parser.error("--write-data cannot be combined with --shard or --exclude")
+    return args
+
+#==========
+# EXECUTION
+#==========
+def create_executor(jobs):
+    """Return a process pool for jobs > 1, or a null context for inline runs."""
+    if jobs > 1:
+        return ProcessPoolExecutor(max_workers=jobs)
+    return contextlib.nullcontext()
+
+def run_calls(executor, calls, weights=None, budget=None):
+    """
+    Run (func, args) calls inline or on the pool and yield (result, error)
+    in submission order, so console output stays ordered. A failing call
+    yields its error text instead of stopping the remaining calls.
+    With weights and a budget, a call is only submitted once the weights
+    already in flight leave room for it (or nothing else is running).
+    """
+    if executor is None:
+        for func, args in calls:
+            try:
+                yield func(*args), None
+            except Exception as e:
+                yield None, f"{type(e).__name__}: {e}"
+        return
+    weights = weights or [0] * len(calls)
+    in_flight = deque()
+    in_flight_weight = 0
+    for (func, args), weight in zip(calls, weights):
+        while in_flight and budget is not None and in_flight_weight + weight > budget:
+            future, done_weight = in_flight.popleft()
+            in_flight_weight -= done_weight
+            yield collect(future)
+        in_flight.append((executor.submit(func, *args), weight))
+        in_flight_weight += weight
+    for future, _ in in_flight:
+        yield collect(future)
+
+def collect(future):
+    """Wait for a future and return (result, error) like run_calls."""
+    try:
+        return future.result(), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+#========
+# METRICS
+#========
+def open_metrics(path):
+    """Return the metrics state: collected records plus an optional JSON lines file."""
+    stream = open(path, "w") if path else None
+    return {"stream": stream, "records": []}
+
+def emit_metric(metrics, record):
+    """Record one task's metrics and append it to the JSON lines file, if any."""
+    metrics["records"].append(record)
+    if metrics["stream"]:
+        metrics["stream"].write(json.dumps(record) + "\n")
+        metrics["stream"].flush()
+
+def close_metrics(metrics):
+    """Print the slowest and largest tasks and close the JSON lines file."""
+    records = metrics["records"]
+    if records:
+        print(f"Slowest tasks (of {len(records)}):")
+        for r in sorted(records, key=lambda r: r["seconds"], reverse=True)[:METRICS_SUMMARY_COUNT]:
+            stages = ", ".join(f"{k} {v:.2f}s" for k, v in r["stages"].items())
+            print(f"  {r['seconds']:.2f}s  {r['item']} ({stages})")
+        print("Largest outputs:")
+        for r in sorted(records, key=lambda r: r["output_bytes"], reverse=True)[:METRICS_SUMMARY_COUNT]:
+            print(f"  {r['output_bytes'] / 1024:.0f} KB  {r['item']} "
+                  f"({r['width']}x{r['height']}, {r['compression_ratio']}:1)")
+    if metrics["stream"]:
+        metrics["stream"].close()
+
+def start_profiler(path):
+    """Profile the rest of this process and dump cProfile stats to path on exit."""
+    profiler = cProfile.Profile()
+
+    def dump():
+        profiler.disable()
+        profiler.dump_stats(path)
+        print(f"[INFO] cProfile stats written to {path}")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+
+    atexit.register(dump)
+    profiler.enable()
+
+#==================
+# INCREMENTAL BUILD
+#==================
+def hash_file(path, cache):
+    """Return the SHA-256 of a file, reusing a per-run cache keyed by path."""
+    if path not in cache:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        cache[path] = digest.hexdigest()
+    return cache[path]
+
+def load_manifest(path):
+    """Load the build manifest, returning an empty one if missing or stale."""
+    empty = {"version": MANIFEST_VERSION, "variants": {}, "placeholders": {}, "quality": {},
+             "breakpoints": {}}
+    if not os.path.isfile(path):
+        return empty
+    try:
+        with open(path, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[WARNING] Ignoring unreadable manifest {path}: {e}")
+        return empty
+    if manifest.get("version") != MANIFEST_VERSION:
+        return empty
+    manifest.setdefault("placeholders", {})
+    manifest.setdefault("quality", {})
+    manifest.setdefault("breakpoints", {})
+    return manifest
+
+def save_manifest(path, manifest):
+    """Write the build manifest atomically."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def variant_signature(source_hash, settings):
+    """Combine a source hash and its output settings into one signature."""
+    payload = json.dumps({"source": source_hash, "settings": settings}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def needs_rebuild(manifest, output_path, signature, force=False):
+    """Return True if the output is missing or was built from other inputs."""
+    if force or not os.path.isfile(output_path):
+        return True
+    return manifest["variants"].get(os.path.normpath(output_path)) != signature
+
+def record_variant(manifest, output_path, signature):
+    """Store the signature an output variant was built from."""
+    manifest["variants"][os.path.normpath(output_path)] = signature
+
+def select_stale_tasks(tasks, settings, manifest, hash_cache, stats, force=False):
+    """
+    Attach a signature to each pending variant and drop those already up to date.
+    Tasks are (input_path, [(output_path, width, options), ...]); images left
+    with no pending variants are dropped entirely so they are never decoded.
+    """
+    stale = []
+    for input_path, variants in tasks:
+        source_hash = hash_file(input_path, hash_cache)
+        pending = []
+        for output_path, width, options in variants:
+            variant_settings = {
+                **settings,
+                "width": width,
+                "format": os.path.splitext(output_path)[1].lower(),
+                "options": options
+            }
+            signature = variant_signature(source_hash, variant_settings)
+            if needs_rebuild(manifest, output_path, signature, force):
+                pending.append((output_path, width, options, signature))
+            else:
+                stats["skipped"] += 1
+        if pending:
+            stale.append((input_path, pending))
+    return stale
+
 #=================
 # IMAGE PROCESSING
 #=================
-def build_resize_tasks(input_dir, output_dir, target_width, valid_exts):
-    """Generate tasks for resizing images in one folder to a target width."""
+def list_images(input_dir, valid_exts):
+    """Return the sorted image filenames in a folder."""
+    return sorted(
+        f for f in os.listdir(input_dir)
+        if f and not f.startswith('.') and f.lower().endswith(valid_exts)
+    )
+
+def profile_targets(config, devices):
+    """List (output_dir, width) for every device/version of an image profile."""
+    targets = []
+    for device in devices:
+        for version_type, width in config["sizes"].get(device, {}).items():
+            targets.append((os.path.join(config["output_base"], device, version_type), width))
+    return targets
+
+def supported_formats(formats):
+    """Drop extra formats this Pillow build cannot encode, with a warning."""
+    usable = {}
+    for fmt, options in formats.items():
+        if features.check(fmt):
+            usable[fmt] = options
+        else:
+            print(f"[WARNING] Pillow has no {fmt} encoder; skipping {fmt} variants.")
+    return usable
+
+def search_formats(formats, quality_search):
+    """Return the extra formats with quality_search attached to lossy WebP."""
+    formats = dict(formats or {})
+    if quality_search and "webp" in formats and not formats["webp"].get("lossless"):
+        formats["webp"] = {**formats["webp"], "search": quality_search}
+    return formats
+
+def source_options(filename, quality, png_palette=None, quality_search=None):
+    """Return the encoder options for a source's own-format variants."""
+    ext = os.path.splitext(filename)[1].lower()
+    options = {"quality": quality}
+    if png_palette and ext == ".png":
+        options["palette"] = png_palette
+    if quality_search and ext in SEARCHABLE_EXTS:
+        options["search"] = quality_search
+    return options
+
+def build_resize_tasks(input_dir, targets, valid_exts, quality, formats=None, png_palette=None,
+                       quality_search=None):
+    """
+    Group every variant of each image in a folder into one task.
+    Each (output_dir, width) target gets the source-format file plus one
+    file per extra format, as (output_path, width, encoder options).
+    Lossy encodings carry the quality_search settings, if any.
+    """
     if not os.path.isdir(input_dir):
         return []
+    formats = search_formats(formats, quality_search)
     tasks = []
-    for filename in os.listdir(input_dir):
-        if not filename or filename.startswith('.') or not filename.lower().endswith(valid_exts):
-            continue
-        input_path = os.path.join(input_dir, filename)
-        output_path = os.path.join(output_dir, filename)
-        tasks.append((input_path, output_path, target_width))
+    for filename in list_images(input_dir, valid_exts):
+        base_name = os.path.splitext(filename)[0]
+        options = source_options(filename, quality, png_palette, quality_search)
+        variants = []
+        for output_dir, width in targets:
+            variants.append((os.path.join(output_dir, filename), width, options))
+            for fmt, fmt_options in formats.items():
+                variants.append((os.path.join(output_dir, f"{base_name}.{fmt}"), width, fmt_options))
+        tasks.append((os.path.join(input_dir, filename), variants))
     return tasks
 
-def process_assets(input_dir, output_dir, target_width, quality, valid_exts):
-    """Build resize tasks for asset images (thumbs/icons)."""
-    tasks = []
-    if not os.path.isdir(input_dir):
-        return tasks
-    for filename in os.listdir(input_dir):
-        if not filename or filename.startswith('.') or not filename.lower().endswith(valid_exts):
+def vector_background(config_path):
+    """Return the canvas colour a diagram config gives its renders (Graphviz "defaults" bgcolor)."""
+    try:
+        with open(config_path, "r") as f:
+            config = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[WARNING] Cannot read {config_path} ({e}); painting SVG masters {DEFAULT_VECTOR_BACKGROUND}.")
+        return DEFAULT_VECTOR_BACKGROUND
+    return config.get("defaults", {}).get("bgcolor", DEFAULT_VECTOR_BACKGROUND)
+
+def vector_backgrounds(vector_masters):
+    """Return {SVG master folder: canvas colour} for a profile's "vector_masters"."""
+    return {
+        os.path.normpath(master["dir"]): vector_background(master["config"])
+        for master in vector_masters or []
+    }
+
+def find_vector_master(input_path, vector_masters):
+    """
+    Return the SVG master for a source image, or None. SVGs that draw text
+    through <foreignObject> (HTML labels) are skipped: in-process rasterizers
+    cannot render them, so their PNG stays the source.
+    """
+    base_name = os.path.splitext(os.path.basename(input_path))[0]
+    for master in vector_masters:
+        svg_path = os.path.join(master["dir"], f"{base_name}.svg")
+        if not os.path.isfile(svg_path):
             continue
-        tasks.append((
-            os.path.join(input_dir, filename),
-            os.path.join(output_dir, filename),
-            target_width,
-            quality
-        ))
-    return tasks
+        with open(svg_path, "r", encoding="utf-8") as f:
+            if "<foreignObject" in f.read():
+                print(f"[WARNING] {svg_path} uses HTML labels; resampling {input_path} instead.")
+                return None
+        return svg_path
+    return None
+
+def use_vector_masters(tasks, vector_masters):
+    """
+    Point each task that has an SVG master at the SVG instead of its PNG.
+    Without cairosvg the PNGs stay the source, with one warning when any
+    master exists.
+    """
+    if not vector_masters:
+        return tasks
+    masters = [find_vector_master(input_path, vector_masters) for input_path, _ in tasks]
+    if cairosvg is None:
+        found = sum(1 for master in masters if master)
+        if found:
+            print(f"[WARNING] Python module 'cairosvg' not installed; resampling {found} diagram "
+                  "PNG(s) that have SVG masters (install with 'pip install cairosvg').")
+        return tasks
+    return [(master or input_path, variants) for master, (input_path, variants) in zip(masters, tasks)]
+
+def pick_source_level(levels, target_width):
+    """
+    Return the smallest already-resized level at least REDUCING_GAP times
+    wider than the target, falling back to the decoded original.
+    """
+    candidates = [lvl for lvl in levels[1:] if lvl.width >= target_width * REDUCING_GAP]
+    if not candidates:
+        return levels[0]
+    return min(candidates, key=lambda lvl: lvl.width)
+
+def encoder_settings(ext, options):
+    """Return Pillow save kwargs for an output extension and its options."""
+    if ext in (".jpg", ".jpeg"):
+        settings = {"optimize": True, "progressive": True, "quality": options["quality"]}
+        if "subsampling" in options:
+            settings["subsampling"] = options["subsampling"]
+        return settings
+    if ext == ".png":
+        return {"optimize": True}
+    # Extra formats (webp/avif) pass their options straight to Pillow
+    return {k: v for k, v in options.items() if k != "search"}
+
+def encode_image(img, ext, options):
+    """Encode an image in memory with only KEPT_METADATA, returning the BytesIO."""
+    img.info = {k: v for k, v in img.info.items() if k in KEPT_METADATA}
+    settings = encoder_settings(ext, options)
+    if "icc_profile" in img.info:
+        settings.setdefault("icc_profile", img.info["icc_profile"])
+    buffer = io.BytesIO()
+    img.save(buffer, format=Image.registered_extensions()[ext], **settings)
+    return buffer
+
+def channel_ssim(img_a, img_b):
+    """Return the mean SSIM of two same-size single-band images over SSIM_BLOCK px blocks."""
+    a, b = img_a.convert("F"), img_b.convert("F")
+    product = lambda x, y: ImageMath.lambda_eval(lambda v: v["x"] * v["y"], x=x, y=y)
+    ssim_map = ImageMath.lambda_eval(
+        lambda v: ((v["ma"] * v["mb"] * 2 + SSIM_C1) * ((v["ab"] - v["ma"] * v["mb"]) * 2 + SSIM_C2))
+        / ((v["ma"] * v["ma"] + v["mb"] * v["mb"] + SSIM_C1)
+           * (v["aa"] - v["ma"] * v["ma"] + v["bb"] - v["mb"] * v["mb"] + SSIM_C2)),
+        ma=a.reduce(SSIM_BLOCK), mb=b.reduce(SSIM_BLOCK),
+        aa=product(a, a).reduce(SSIM_BLOCK), bb=product(b, b).reduce(SSIM_BLOCK),
+        ab=product(a, b).reduce(SSIM_BLOCK)
+    )
+    return ssim_map.reduce(ssim_map.size).getpixel((0, 0))
+
+def comparison_channels(img):
+    """
+    Return the bands similarity() compares: YCbCr, plus alpha for images with
+    an alpha band, their colour premultiplied so hidden pixels compare equal.
+    """
+    if "A" not in img.getbands():
+        return img.convert("YCbCr").split()
+    img = premultiplied(img)
+    return (*img.convert("RGB").convert("YCbCr").split(), img.getchannel("A"))
+
+def similarity(reference, img):
+    """
+    Return the lowest per-channel SSIM of img against reference, a
+    comparison_channels() tuple, so lost chroma detail (e.g. from 4:2:0
+    subsampling) or alpha edges count as much as luma.
+    """
+    return min(channel_ssim(a, b) for a, b in zip(reference, comparison_channels(img)))
+
+def search_quality(img, ext, options):
+    """
+    Binary-search the lowest quality whose encode keeps similarity() at or
+    above options["search"]["target"], never above the configured quality.
+    Images are compared in the mode they are encoded in, so WebP keeps alpha.
+    WebP probes use SEARCH_WEBP_METHOD; the variant itself is encoded once
+    afterwards with the configured method. JPEG tries 4:2:0 and 4:4:4
+    subsampling and keeps the smaller result.
+    Returns the encoder options to override, e.g. {"quality": 62, "subsampling": 2}.
+    """
+    search = options["search"]
+    keeps_alpha = ext == ".webp" and img.has_transparency_data
+    mode = "RGBA" if keeps_alpha else "RGB"
+    img = img.convert(mode)
+    reference = comparison_channels(img)
+    probe = dict(options)
+    if ext == ".webp":
+        probe["method"] = min(options.get("method", SEARCH_WEBP_METHOD), SEARCH_WEBP_METHOD)
+    subsamplings = [2, 0] if ext in (".jpg", ".jpeg") else [None]
+    best = None
+    for subsampling in subsamplings:
+        extra = {} if subsampling is None else {"subsampling": subsampling}
+        low, high = search["min_quality"], options["quality"]
+        found = None
+        while low <= high:
+            quality = (low + high) // 2
+            buffer = encode_image(img, ext, {**probe, **extra, "quality": quality})
+            with Image.open(buffer) as decoded:
+                score = similarity(reference, decoded.convert(mode))
+            if score >= search["target"]:
+                found = (buffer.tell(), {**extra, "quality": quality})
+                high = quality - 1
+            else:
+                low = quality + 1
+        if found is None:
+            size = encode_image(img, ext, {**probe, **extra}).tell()
+            found = (size, {**extra, "quality": options["quality"]})
+        if best is None or found[0] < best[0]:
+            best = found
+    return best[1]
 
+def tuned_options(img, ext, options, tuned):
+    """
+    Return the encoder options for one variant with any searched quality
+    applied. The first (widest) variant of each searchable format runs the
+    search; tuned maps extension -> chosen settings and is filled in place.
+    """
+    if not options.get("search") or ext not in SEARCHABLE_EXTS:
+        return options
+    if ext not in tuned:
+        tuned[ext] = search_quality(img, ext, options)
+    return {**options, **tuned[ext]}
 
-def resize_image(input_path, output_path, target_width, quality):
-    """Resize and save an image at target width and quality."""
+def remove_output(output_path):
+    """
+    Delete an existing output before it is rewritten, so a file hardlinked
+    to other variants is replaced rather than modified in place.
+    """
+    if os.path.lexists(output_path):
+        os.remove(output_path)
+
+def premultiplied(img):
+    """Return an RGBA copy with colour premultiplied by alpha, so hidden pixels compare equal."""
+    img = img.convert("RGBA")
+    flattened = Image.alpha_composite(Image.new("RGBA", img.size, (0, 0, 0, 255)), img)
+    return Image.merge("RGBA", (*flattened.convert("RGB").split(), img.getchannel("A")))
+
+def perceptual_error(img_a, img_b):
+    """
+    Return the worst per-channel RMS difference between two images after a
+    small blur, so visible banding and colour shifts count but edge jitter
+    the eye averages out does not.
+    """
+    blur = ImageFilter.BoxBlur(PALETTE_BLUR_RADIUS)
+    diff = ImageChops.difference(
+        premultiplied(img_a).filter(blur), premultiplied(img_b).filter(blur)
+    )
+    return max(ImageStat.Stat(diff).rms)
+
+def quantize_if_lossless(img, palette):
+    """
+    Return an 8-bit palette version of a low-colour RGB/RGBA image when its
+    perceptual error stays within palette["max_error"], else the image unchanged.
+    """
+    if img.mode not in ("RGB", "RGBA"):
+        return img
+    if img.mode == "RGBA" and img.getchannel("A").getextrema() == (255, 255):
+        img = img.convert("RGB")
+    if img.getcolors(maxcolors=palette["max_source_colors"]) is None:
+        return img
+    method = Image.Quantize.FASTOCTREE if img.mode == "RGBA" else Image.Quantize.MEDIANCUT
+    quantized = img.quantize(colors=256, method=method, dither=Image.Dither.NONE)
+    if perceptual_error(img, quantized) > palette["max_error"]:
+        return img
+    return quantized
+
+def save_variant(img, output_path, options):
+    """
+    Save one resized variant using the encoder for its extension.
+    Returns (encode seconds, write seconds, bytes written).
+    """
+    started = time.perf_counter()
+    ext = os.path.splitext(output_path)[1].lower()
+    if ext == ".png" and options.get("palette"):
+        img = quantize_if_lossless(img, options["palette"])
+    buffer = encode_image(img, ext, options)
+    encoded = time.perf_counter()
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    remove_output(output_path)
+    with open(output_path, "wb") as f:
+        f.write(buffer.getbuffer())
+    return encoded - started, time.perf_counter() - encoded, buffer.tell()
+
+def link_variant(existing_path, output_path):
+    """Share an identical, already-written variant via a hardlink (copy if unsupported)."""
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    remove_output(output_path)
     try:
-        with Image.open(input_path) as img:
-            img = ImageOps.exif_transpose(img)
-            orig_width, orig_height = img.size
-            if orig_width == 0:
-                print(f"Skipping {input_path}: width is 0")
-                return
-            scale = target_width / orig_width
-            target_height = int(orig_height * scale)
-            img_resized = img.resize((target_width, target_height), Image.LANCZOS)
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        os.link(existing_path, output_path)
+    except OSError:
+        shutil.copyfile(existing_path, output_path)
+
+def display_size(img):
+    """Return an opened image's (width, height) after EXIF rotation, without decoding it."""
+    if img.getexif().get(ExifTags.Base.Orientation, 1) in (5, 6, 7, 8):
+        return img.height, img.width
+    return img.size
+
+def largest_target(variants, source_width, no_upscale=False):
+    """Return the widest output width a set of variants needs from a source."""
+    widest = max(width for _, width, _ in variants)
+    return min(widest, source_width) if no_upscale else widest
+
+def jpeg_draft_scale(source_width, needed_width):
+    """Return the 1/2/4/8 DCT scale JPEG draft mode can decode at and still cover needed_width."""
+    scale = 1
+    while scale < 8 and source_width / (scale * 2) >= needed_width:
+        scale *= 2
+    return scale
+
+def svg_size(svg_path):
+    """Return an SVG's intrinsic (width, height) from its viewBox, or its width/height attributes."""
+    with open(svg_path, "r", encoding="utf-8") as f:
+        root = re.search(r"<svg\b[^>]*>", f.read())
+    if not root:
+        raise ValueError("no <svg> element")
+    view_box = re.search(r'viewBox="([^"]+)"', root.group(0))
+    if view_box:
+        _, _, width, height = (float(v) for v in view_box.group(1).replace(",", " ").split())
+        return width, height
+    width = re.search(r'\swidth="([\d.]+)(?:px|pt)?"', root.group(0))
+    height = re.search(r'\sheight="([\d.]+)(?:px|pt)?"', root.group(0))
+    if not (width and height):
+        raise ValueError("SVG has no viewBox or absolute width/height")
+    return float(width.group(1)), float(height.group(1))
+
+def estimate_task_memory(input_path, variants, no_upscale=False):
+    """
+    Rough peak bytes resize_image needs for one source: the (possibly
+    reduced) decode plus the largest resized copy and its encode, at
+    Pillow's 4 bytes per pixel. SVG masters only hold the rasterized
+    widest variant (cairo surface plus its Pillow copy) and its encode.
+    """
+    if input_path.lower().endswith(".svg"):
+        width, height = svg_size(input_path)
+        target = max(w for _, w, _ in variants)
+        return 4 * 3 * int(target * target * height / width)
+    with Image.open(input_path) as img:
+        width, height = display_size(img)
+        fmt = img.format
+    if width == 0:
+        return 0
+    target = largest_target(variants, width, no_upscale)
+    decoded = width * height
+    if fmt == "JPEG":
+        decoded //= jpeg_draft_scale(width, target * REDUCING_GAP) ** 2
+    resized = target * target * height // width
+    return 4 * (decoded + 2 * resized)
+
+def resize_image(input_path, variants, no_upscale=False, tuned=None):
+    """
+    Decode an image once and save every (output_path, width, options) variant.
+    JPEGs are decoded in draft mode at the smallest DCT scale that still covers
+    the widest variant, and other formats are box-reduced by an integer factor
+    right after decoding, so the full-size pixels are never kept around.
+    Widths are resized once each, largest-first, from the cheapest source level,
+    then encoded to every format requested at that width. With no_upscale,
+    widths are capped at the source width and variants that would encode
+    identically are hardlinked to the first one written. Lossy formats with
+    quality_search use the settings in tuned (extension -> settings), searching
+    on their widest variant when none are cached yet.
+    Returns (saved output paths, metrics record); errors propagate to the caller.
+    """
+    saved = []
+    tuned = dict(tuned or {})
+    stages = {"decode": 0.0, "resize": 0.0, "search": 0.0, "encode": 0.0, "write": 0.0}
+    output_bytes = 0
+    raw_bytes = 0
+    started = time.perf_counter()
+    with Image.open(input_path) as img:
+        orig_width, orig_height = display_size(img)
+        if orig_width == 0:
+            raise ValueError("width is 0")
+        needed_width = largest_target(variants, orig_width, no_upscale) * REDUCING_GAP
+        if img.format == "JPEG":
+            scale = jpeg_draft_scale(orig_width, needed_width)
+            if scale > 1:
+                img.draft(None, (math.ceil(img.width / scale), math.ceil(img.height / scale)))
+        img.load()
+        img = ImageOps.exif_transpose(img)
+        factor = int(img.width // needed_width)
+        if factor > 1 and img.mode not in ("1", "P"):
+            img = img.reduce(factor)
+        stages["decode"] = time.perf_counter() - started
+        levels = [img]
+        resized_by_width = {}
+        written = {}
+        for output_path, target_width, options in sorted(variants, key=lambda v: v[1], reverse=True):
+            if no_upscale:
+                target_width = min(target_width, orig_width)
             ext = os.path.splitext(output_path)[1].lower()
-            save_kwargs = {"optimize": True}
-            if ext in (".jpg", ".jpeg"):
-                save_kwargs["quality"] = quality
-            img_resized.save(output_path, **save_kwargs)
+            encode_key = (target_width, ext, json.dumps(options, sort_keys=True))
+            if encode_key in written:
+                link_variant(written[encode_key], output_path)
+                saved.append(output_path)
+                continue
+            if target_width not in resized_by_width:
+                resize_started = time.perf_counter()
+                scale = target_width / orig_width
+                target_height = int(orig_height * scale)
+                source = pick_source_level(levels, target_width)
+                img_resized = source.resize(
+                    (target_width, target_height), Image.LANCZOS, reducing_gap=REDUCING_GAP
+                )
+                levels.append(img_resized)
+                resized_by_width[target_width] = img_resized
+                stages["resize"] += time.perf_counter() - resize_started
+            search_started = time.perf_counter()
+            options = tuned_options(resized_by_width[target_width], ext, options, tuned)
+            stages["search"] += time.perf_counter() - search_started
+            encode_s, write_s, size = save_variant(resized_by_width[target_width], output_path, options)
+            stages["encode"] += encode_s
+            stages["write"] += write_s
+            output_bytes += size
+            resized = resized_by_width[target_width]
+            raw_bytes += resized.width * resized.height * len(resized.getbands())
+            written[encode_key] = output_path
+            saved.append(output_path)
+    metrics = {
+        "item": input_path,
+        "seconds": round(time.perf_counter() - started, 4),
+        "stages": {k: round(v, 4) for k, v in stages.items()},
+        "input_bytes": os.path.getsize(input_path),
+        "output_bytes": output_bytes,
+        "outputs": len(saved),
+        "width": orig_width,
+        "height": orig_height,
+        "compression_ratio": round(raw_bytes / output_bytes, 2) if output_bytes else None,
+        "quality": tuned,
+    }
+    return saved, metrics
+
+def rasterize_svg(input_path, variants, background=DEFAULT_VECTOR_BACKGROUND, tuned=None):
+    """
+    Render an SVG master straight to every (output_path, width, options)
+    variant: each width is rasterized once by cairosvg on a background-coloured
+    canvas, then encoded to every format requested at that width. Vectors have
+    no resolution to lose, so no_upscale does not apply. Returns (saved output
+    paths, metrics record) in the same shape as resize_image, including its
+    quality_search handling.
+    """
+    saved = []
+    tuned = dict(tuned or {})
+    stages = {"rasterize": 0.0, "search": 0.0, "encode": 0.0, "write": 0.0}
+    output_bytes = 0
+    raw_bytes = 0
+    started = time.perf_counter()
+    svg_width, svg_height = svg_size(input_path)
+    with open(input_path, "rb") as f:
+        svg_data = f.read()
+    rasterized_by_width = {}
+    written = {}
+    for output_path, target_width, options in sorted(variants, key=lambda v: v[1], reverse=True):
+        ext = os.path.splitext(output_path)[1].lower()
+        encode_key = (target_width, ext, json.dumps(options, sort_keys=True))
+        if encode_key in written:
+            link_variant(written[encode_key], output_path)
+            saved.append(output_path)
+            continue
+        if target_width not in rasterized_by_width:
+            rasterize_started = time.perf_counter()
+            png_data = cairosvg.svg2png(
+                bytestring=svg_data,
+                output_width=target_width,
+                output_height=max(1, round(target_width * svg_height / svg_width)),
+                background_color=background
+            )
+            with Image.open(io.BytesIO(png_data)) as raster:
+                rasterized_by_width[target_width] = raster.convert("RGB")
+            stages["rasterize"] += time.perf_counter() - rasterize_started
+        rasterized = rasterized_by_width[target_width]
+        search_started = time.perf_counter()
+        options = tuned_options(rasterized, ext, options, tuned)
+        stages["search"] += time.perf_counter() - search_started
+        encode_s, write_s, size = save_variant(rasterized, output_path, options)
+        stages["encode"] += encode_s
+        stages["write"] += write_s
+        output_bytes += size
+        raw_bytes += rasterized.width * rasterized.height * 3
+        written[encode_key] = output_path
+        saved.append(output_path)
+    metrics = {
+        "item": input_path,
+        "seconds": round(time.perf_counter() - started, 4),
+        "stages": {k: round(v, 4) for k, v in stages.items()},
+        "input_bytes": len(svg_data),
+        "output_bytes": output_bytes,
+        "outputs": len(saved),
+        "width": round(svg_width),
+        "height": round(svg_height),
+        "compression_ratio": round(raw_bytes / output_bytes, 2) if output_bytes else None,
+        "quality": tuned,
+    }
+    return saved, metrics
+
+def quality_key(source_hash, variants):
+    """Return the cache key for a source's searched qualities, or None if nothing is searched."""
+    searches = sorted({json.dumps(v[2]["search"], sort_keys=True) for v in variants if v[2].get("search")})
+    if not searches:
+        return None
+    widest = max(v[1] for v in variants)
+    return variant_signature(source_hash, {"quality_search": searches, "width": widest,
+                                           "version": QUALITY_SEARCH_VERSION})
+
+def run_resize_tasks(tasks, manifest, hash_cache, stats, executor, metrics, memory_budget,
+                     no_upscale=False, backgrounds=None):
+    """
+    Resize each stale image into its pending variants and record them,
+    keeping the estimated memory of parallel tasks within memory_budget bytes.
+    SVG masters are rasterized per width rather than resized, on the canvas
+    colour backgrounds gives their folder. Qualities found by quality_search
+    are stored in the manifest per source hash and reused.
+    """
+    backgrounds = backgrounds or {}
+    calls = []
+    quality_keys = []
+    weights = []
+    for input_path, pending in tasks:
+        variants = [variant[:3] for variant in pending]
+        key = quality_key(hash_file(input_path, hash_cache), variants)
+        quality_keys.append(key)
+        tuned = manifest["quality"].get(key)
+        if input_path.lower().endswith(".svg"):
+            background = backgrounds.get(os.path.dirname(os.path.normpath(input_path)),
+                                         DEFAULT_VECTOR_BACKGROUND)
+            calls.append((rasterize_svg, (input_path, variants, background, tuned)))
+        else:
+            calls.append((resize_image, (input_path, variants, no_upscale, tuned)))
+        try:
+            weights.append(estimate_task_memory(input_path, variants, no_upscale))
+        except (OSError, ValueError):
+            weights.append(0)  # unreadable: the task itself reports the error
+    results = run_calls(executor, calls, weights, memory_budget)
+    for (input_path, pending), key, (result, error) in zip(tasks, quality_keys, results):
+        if error:
+            print(f"[ERROR] Failed processing {input_path}: {error}")
+            stats["failed"] += 1
+            continue
+        saved, record = result
+        emit_metric(metrics, record)
+        if key and record["quality"]:
+            manifest["quality"][key] = record["quality"]
+        signatures = {variant[0]: variant[3] for variant in pending}
+        for output_path in saved:
             print(f"Saved: {output_path}")
-    except Exception as e:
-        print(f"Error processing {input_path}: {e}")
+            record_variant(manifest, output_path, signatures[output_path])
+            stats["rebuilt"] += 1
 
 
 def generate_favicon_png(input_path, output_path, size):
@@ -165,7 +1085,6 @@ def generate_favicon_png(input_path, output_path, size):
         resized = img.resize((size, size), Image.LANCZOS)
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         resized.save(output_path, optimize=True)
-        print(f"Saved: {output_path}")
 
 
 def generate_favicon_ico(input_path, output_path, sizes):
@@ -174,13 +1093,870 @@ def generate_favicon_ico(input_path, output_path, sizes):
         img = img.convert("RGBA")
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         img.save(output_path, format="ICO", sizes=[(s, s) for s in sizes])
-        print(f"Saved: {output_path}")        
+
+#===============
+# IMAGE MANIFEST
+#===============
+def write_text_if_changed(path, content):
+    """Write a generated text file atomically; returns False if it was already current."""
+    if os.path.isfile(path):
+        with open(path, "r") as f:
+            if f.read() == content:
+                return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return True
+
+def write_data_file(path, content):
+    """
+    Write a JS data file that build_fingerprints may rewrite afterwards. A
+    file that differs from content only by content-hashed image names is left
+    alone, so an unchanged data file is not flipped to plain URLs and back on
+    every run. Returns False if nothing was written.
+    """
+    if os.path.isfile(path):
+        with open(path, "r") as f:
+            current = f.read()
+        pattern = fingerprint_pattern(FINGERPRINT_CONFIG["hash_length"])
+        if rewrite_image_urls(current, {}, pattern) == content:
+            return False
+    return write_text_if_changed(path, content)
+
+def make_placeholder(input_path):
+    """
+    Return (width, height, data URI) for a source: its displayed size and a
+    PLACEHOLDER_SIZE preview the browser blurs when stretching it.
+    """
+    with Image.open(input_path) as img:
+        width, height = display_size(img)
+        img.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE))
+        img = ImageOps.exif_transpose(img)
+        has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+        img = img.convert("RGBA" if has_alpha else "RGB")
+    fmt = "webp" if features.check("webp") else "png"
+    buffer = io.BytesIO()
+    img.save(buffer, format=fmt, **({"quality": PLACEHOLDER_QUALITY} if fmt == "webp" else {}))
+    data = base64.b64encode(buffer.getvalue()).decode("ascii")
+    return width, height, f"data:image/{fmt};base64,{data}"
+
+def collect_image_entries(input_dir, manifest, hash_cache):
+    """
+    Return {file name: {width, height, placeholder}} for every image in a
+    folder. Entries are cached in the build manifest by source hash, so only
+    new or changed sources are decoded.
+    """
+    entries = {}
+    for filename in list_images(input_dir, VALID_EXTS):
+        input_path = os.path.join(input_dir, filename)
+        key = os.path.normpath(input_path)
+        source_hash = hash_file(input_path, hash_cache)
+        cached = manifest["placeholders"].get(key)
+        if not cached or cached["source"] != source_hash:
+            try:
+                width, height, placeholder = make_placeholder(input_path)
+            except OSError as e:
+                print(f"[WARNING] No placeholder for {input_path}: {e}")
+                continue
+            cached = {"source": source_hash, "width": width, "height": height,
+                      "placeholder": placeholder}
+            manifest["placeholders"][key] = cached
+        entries[filename] = {k: cached[k] for k in ("width", "height", "placeholder")}
+    return entries
+
+def built_formats(filename, targets, formats):
+    """Return the extra formats (in preference order) with a variant in every target folder."""
+    base_name = os.path.splitext(filename)[0]
+    return [
+        fmt for fmt in formats
+        if all(os.path.isfile(os.path.join(output_dir, f"{base_name}.{fmt}")) for output_dir, _ in targets)
+    ]
+
+def write_image_manifest(path, entries):
+    """Write the image manifest as a JS data file; returns False if it was already current."""
+    lines = [
+        f"// {os.path.relpath(path, '..')}",
+        "// Generated by PythonFiles/Image-Optimizer.py; do not edit by hand.",
+        "// Intrinsic size, inline placeholder and built extra formats for each responsive image.",
+        "const IMAGE_MANIFEST = {",
+    ]
+    lines += [f"  {json.dumps(name)}: {json.dumps(entry)}," for name, entry in sorted(entries.items())]
+    lines.append("};\n")
+    return write_data_file(path, "\n".join(lines))
+
+#=============
+# SPRITE SHEET
+#=============
+def layout_sprite(sizes, padding):
+    """
+    Pack (name, width, height) cells into rows of a roughly square sheet.
+    Returns ({name: (x, y, w, h)}, sheet_width, sheet_height) at 1x.
+    """
+    columns = max(1, math.ceil(math.sqrt(len(sizes))))
+    cells = {}
+    x = y = row_height = sheet_width = 0
+    for index, (name, w, h) in enumerate(sorted(sizes, key=lambda c: (-c[2], c[0]))):
+        if index and index % columns == 0:
+            x, y, row_height = 0, y + row_height + padding, 0
+        cells[name] = (x, y, w, h)
+        x += w + padding
+        sheet_width = max(sheet_width, x - padding)
+        row_height = max(row_height, h)
+    return cells, sheet_width, y + row_height
+
+def scaled_sheet_path(sheet_path, scale, ext=None):
+    """Return the sheet path for a scale and format: icons.png, icons@2x.png, icons@2x.webp, ..."""
+    base, sheet_ext = os.path.splitext(sheet_path)
+    suffix = "" if scale == 1 else f"@{scale}x"
+    return f"{base}{suffix}{ext or sheet_ext}"
+
+def sprite_sheets(sprite):
+    """List (path, scale, MIME type, encoder options) for every sheet, extra formats first."""
+    sheets = []
+    for fmt, options in supported_formats(sprite.get("formats", {})).items():
+        for scale in sprite["scales"]:
+            sheets.append((scaled_sheet_path(sprite["sheet"], scale, f".{fmt}"), scale, f"image/{fmt}", options))
+    for scale in sprite["scales"]:
+        sheets.append((scaled_sheet_path(sprite["sheet"], scale), scale, "image/png", {}))
+    return sheets
+
+def site_path(path):
+    """Return a repo-relative path as used by the pages (no leading ../)."""
+    return os.path.relpath(path, "..").replace(os.sep, "/")
+
+def sprite_percent(offset, sheet_size, cell_size):
+    """Background-position percentage that puts a cell at the element's origin."""
+    if sheet_size == cell_size:
+        return 0
+    return round(offset / (sheet_size - cell_size) * 100, 4)
+
+def sprite_styles(cell, sheet_width, sheet_height):
+    """Size-independent background-size/position for one sprite cell, as CSS values."""
+    x, y, w, h = cell
+    size = f"{round(sheet_width / w * 100, 4)}% {round(sheet_height / h * 100, 4)}%"
+    position = f"{sprite_percent(x, sheet_width, w)}% {sprite_percent(y, sheet_height, h)}%"
+    return size, position
+
+def sprite_css(sprite, cells, sheet_width, sheet_height):
+    """Return the stylesheet for a sprite: one .sprite-<name> class per icon."""
+    image_set = ", ".join(
+        f'url("{os.path.basename(path)}") {scale}x type("{mime}")'
+        for path, scale, mime, _ in sprite_sheets(sprite)
+    )
+    lines = [
+        "/* Generated by PythonFiles/Image-Optimizer.py; do not edit by hand. */",
+        ".sprite-icon {",
+        "  display: block;",
+        "  width: 100%;",
+        "  height: 100%;",
+        "  background-repeat: no-repeat;",
+        f'  background-image: url("{os.path.basename(sprite["sheet"])}");',
+        f"  background-image: image-set({image_set});",
+        "}",
+    ]
+    for name, cell in sorted(cells.items()):
+        size, position = sprite_styles(cell, sheet_width, sheet_height)
+        css_name = os.path.splitext(name)[0].replace(".", "-")
+        lines += [
+            f".sprite-{css_name} {{ background-size: {size}; background-position: {position}; "
+            f"aspect-ratio: {cell[2]} / {cell[3]}; }}",
+        ]
+    return "\n".join(lines) + "\n"
+
+def sprite_map(sprite, cells, sheet_width, sheet_height):
+    """Return the JS coordinate map the icon loaders read (ICON_SPRITE)."""
+    sheets = [
+        {"src": site_path(path), "scale": scale, "type": mime}
+        for path, scale, mime, _ in sprite_sheets(sprite)
+    ]
+    lines = [
+        f"// {site_path(sprite['map'])}",
+        "// Generated by PythonFiles/Image-Optimizer.py; do not edit by hand.",
+        "// Icon sprite sheets and the 1x coordinates of every icon in them.",
+        "const ICON_SPRITE = {",
+        f'  "fallback": {json.dumps(site_path(sprite["sheet"]))},',
+        '  "sheets": [',
+        *[f"    {json.dumps(sheet)}," for sheet in sheets],
+        "  ],",
+        f'  "width": {sheet_width},',
+        f'  "height": {sheet_height},',
+        '  "icons": {',
+    ]
+    for name, cell in sorted(cells.items()):
+        size, position = sprite_styles(cell, sheet_width, sheet_height)
+        x, y, w, h = cell
+        entry = {"x": x, "y": y, "w": w, "h": h, "size": size, "position": position}
+        lines.append(f"    {json.dumps(name)}: {json.dumps(entry)},")
+    lines += ["  }", "};", ""]
+    return "\n".join(lines)
+
+def build_sprite(cfg, manifest, hash_cache, stats, force=False):
+    """
+    Pack the icons of an asset set into one sheet per scale, resized from the
+    originals to display_width times each scale, and write the CSS and JS map.
+    Icons too small for the largest scale are left out (never upscaled).
+    Skipped when no source or setting changed since the last build.
+    """
+    sprite = cfg["sprite"]
+    sources = [os.path.join(cfg["input_dir"], f) for f in list_images(cfg["input_dir"], VALID_EXTS)]
+    if not sources:
+        return
+    settings = {"sprite": sprite, "width": cfg["width"],
+                "sources": {os.path.basename(p): hash_file(p, hash_cache) for p in sources}}
+    signature = variant_signature("sprite", settings)
+    sheets = sprite_sheets(sprite)
+    outputs = [path for path, _, _, _ in sheets] + [sprite["css"], sprite["map"]]
+    if not any(needs_rebuild(manifest, path, signature, force) for path in outputs):
+        stats["skipped"] += len(outputs)
+        return
+
+    # Cell sizes are fixed at 1x so every scale shares the same layout
+    display_width = sprite.get("display_width", cfg["width"])
+    needed_width = display_width * max(sprite["scales"])
+    images = {}
+    sizes = []
+    for path in sources:
+        with Image.open(path) as img:
+            img = ImageOps.exif_transpose(img).convert("RGBA")
+        if img.width < needed_width:
+            print(f"[INFO] {path} is {img.width}px, under the {needed_width}px the sprite needs; "
+                  "keeping it as a separate icon.")
+            continue
+        height = max(1, round(img.height * display_width / img.width))
+        images[os.path.basename(path)] = img
+        sizes.append((os.path.basename(path), display_width, height))
+    cells, sheet_width, sheet_height = layout_sprite(sizes, sprite["padding"])
+
+    for scale in sprite["scales"]:
+        sheet = Image.new("RGBA", (sheet_width * scale, sheet_height * scale), (0, 0, 0, 0))
+        for name, (x, y, w, h) in cells.items():
+            icon = images[name].resize((w * scale, h * scale), Image.LANCZOS, reducing_gap=REDUCING_GAP)
+            sheet.paste(icon, (x * scale, y * scale))
+        for sheet_path, sheet_scale, _, options in sheets:
+            if sheet_scale == scale:
+                save_variant(sheet, sheet_path, options)
+                print(f"Saved: {sheet_path} ({len(cells)} icons, {sheet.width}x{sheet.height})")
+    write_text_if_changed(sprite["css"], sprite_css(sprite, cells, sheet_width, sheet_height))
+    print(f"Saved: {sprite['css']}")
+    write_text_if_changed(sprite["map"], sprite_map(sprite, cells, sheet_width, sheet_height))
+    print(f"Saved: {sprite['map']}")
+    for path in outputs:
+        record_variant(manifest, path, signature)
+    stats["rebuilt"] += len(outputs)
+
+#================
+# ADAPTIVE WIDTHS
+#================
+def probe_size(img, width, ext, options):
+    """Return the bytes an image takes once resized to width and encoded."""
+    height = max(1, round(img.height * width / img.width))
+    resized = img.resize((width, height), Image.LANCZOS, reducing_gap=REDUCING_GAP)
+    return encode_image(resized, ext, options).tell()
+
+def choose_widths(input_path, min_width, max_width, byte_delta, max_widths, fmt, options):
+    """
+    Pick the widths worth serving for one source. From the narrowest width,
+    each next width is the largest whose probe encode grows by at most
+    byte_delta bytes, found by bisection to ADAPTIVE_WIDTH_STEP pixels; the
+    widest (source width or max_width) always closes the list, and at most
+    max_widths are kept. Returns [(width, probe bytes), ...], narrowest first.
+    """
+    with Image.open(input_path) as img:
+        img.load()
+        img = ImageOps.exif_transpose(img)
+        has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+        img = img.convert("RGBA" if has_alpha else "RGB")
+    top = min(max_width, img.width)
+    if img.width > top:
+        img = img.resize((top, max(1, round(img.height * top / img.width))), Image.LANCZOS,
+                         reducing_gap=REDUCING_GAP)
+    ext = f".{fmt}"
+    sizes = {}
+    def size_at(width):
+        if width not in sizes:
+            sizes[width] = probe_size(img, width, ext, options)
+        return sizes[width]
+    widths = [min(min_width, top)]
+    while widths[-1] < top and len(widths) < max_widths - 1:
+        base = size_at(widths[-1])
+        if size_at(top) - base <= byte_delta:
+            break
+        low, high = widths[-1], top
+        while high - low > ADAPTIVE_WIDTH_STEP:
+            middle = (low + high) // 2
+            if size_at(middle) - base <= byte_delta:
+                low = middle
+            else:
+                high = middle
+        widths.append(low if low > widths[-1] else high)
+    if widths[-1] != top:
+        widths.append(top)
+    return [(width, size_at(width)) for width in widths]
+
+def adaptive_path(cfg, filename, width, ext):
+    """Return the output path of one adaptive-width variant."""
+    base_name = os.path.splitext(filename)[0]
+    return os.path.join(cfg["output_dir"], f"{base_name}-{width}w{ext}")
+
+def build_adaptive_tasks(cfg, input_dir, widths_by_name, quality, formats=None, png_palette=None,
+                         quality_search=None):
+    """
+    Like build_resize_tasks, but each source gets its own widths: every
+    width in widths_by_name[filename] is written in the source format and
+    every extra format under adaptive_path names.
+    """
+    formats = search_formats(formats, quality_search)
+    tasks = []
+    for filename, widths in sorted(widths_by_name.items()):
+        ext = os.path.splitext(filename)[1]
+        options = source_options(filename, quality, png_palette, quality_search)
+        variants = []
+        for width in widths:
+            variants.append((adaptive_path(cfg, filename, width, ext), width, options))
+            for fmt, fmt_options in formats.items():
+                variants.append((adaptive_path(cfg, filename, width, f".{fmt}"), width, fmt_options))
+        tasks.append((os.path.join(input_dir, filename), variants))
+    return tasks
+
+def replaced_dirs(cfg, targets):
+    """Return the fixed target folders an adaptive_widths srcset stands in for ("replaces" version type)."""
+    return {
+        os.path.normpath(output_dir) for output_dir, _ in targets
+        if os.path.basename(os.path.normpath(output_dir)) == cfg.get("replaces")
+    }
+
+def drop_replaced_variants(tasks, covered, replaced):
+    """Remove the variants in replaced folders from the tasks of sources whose srcset covers them."""
+    return [
+        (input_path, [
+            v for v in variants
+            if not (os.path.basename(input_path) in covered
+                    and os.path.normpath(os.path.dirname(v[0])) in replaced)
+        ])
+        for input_path, variants in tasks
+    ]
+
+def remove_replaced_variants(covered, formats, replaced, manifest):
+    """Delete the fixed-width variants (and manifest records) a source's srcset now covers."""
+    for filename in sorted(covered):
+        base_name = os.path.splitext(filename)[0]
+        for output_dir in sorted(replaced):
+            for name in [filename] + [f"{base_name}.{fmt}" for fmt in formats]:
+                path = os.path.normpath(os.path.join(output_dir, name))
+                if os.path.isfile(path):
+                    os.remove(path)
+                    manifest["variants"].pop(path, None)
+                    print(f"Removed: {path} (covered by its srcset)")
+
+def build_adaptive_widths(cfg, label, config, formats, manifest, hash_cache, stats, executor, metrics,
+                          memory_budget, only=None, exclude=None, force=False, write_data=True):
+    """
+    Choose widths per selected source (cached in the build manifest by source
+    hash and search settings) and write their variants. Unfiltered runs also
+    delete variants no longer chosen and, unless write_data is False (shard
+    and filtered runs), write the srcset manifest js/responsiveImageLoader.js
+    reads. A filtered run that writes data lists the other sources with
+    their cached widths. Returns the names of the sources that have chosen
+    widths.
+    """
+    in_dir = config["input_dir"]
+    probe_fmt = cfg["probe"]["format"] if features.check(cfg["probe"]["format"]) else "png"
+    search = {key: cfg[key] for key in ("min_width", "max_width", "byte_delta", "max_widths")}
+    search.update({"probe": {**cfg["probe"], "format": probe_fmt}, "step": ADAPTIVE_WIDTH_STEP})
+    widths_by_name, listed, pending = {}, {}, []
+    for filename in list_images(in_dir, VALID_EXTS):
+        input_path = os.path.join(in_dir, filename)
+        selected = is_selected(input_path, only, exclude)
+        if not selected and not write_data:
+            continue
+        key = os.path.normpath(input_path)
+        signature = variant_signature(hash_file(input_path, hash_cache), {"adaptive_widths": search})
+        cached = manifest["breakpoints"].get(key)
+        if not selected:
+            if cached and cached["signature"] == signature:
+                listed[filename] = cached["widths"]
+        elif cached and cached["signature"] == signature and not force:
+            widths_by_name[filename] = cached["widths"]
+        else:
+            pending.append((filename, input_path, key, signature))
+
+    calls = [
+        (choose_widths, (input_path, cfg["min_width"], cfg["max_width"], cfg["byte_delta"],
+                         cfg["max_widths"], probe_fmt, cfg["probe"]["options"]))
+        for _, input_path, _, _ in pending
+    ]
+    weights = []
+    for _, input_path, _, _ in pending:
+        try:
+            with Image.open(input_path) as img:
+                weights.append(4 * 3 * img.width * img.height)
+        except OSError:
+            weights.append(0)  # unreadable: the call itself reports the error
+    for (filename, input_path, key, signature), (result, error) in zip(
+        pending, run_calls(executor, calls, weights, memory_budget)
+    ):
+        if error:
+            print(f"[ERROR] Failed choosing widths for {input_path}: {error}")
+            stats["failed"] += 1
+            continue
+        widths = [width for width, _ in result]
+        sizes = ", ".join(f"{width}px {size / 1024:.0f} KB" for width, size in result)
+        print(f"Widths: {filename} -> {sizes}")
+        manifest["breakpoints"][key] = {"signature": signature, "widths": widths}
+        widths_by_name[filename] = widths
+
+    tasks = build_adaptive_tasks(
+        cfg, in_dir, widths_by_name, config["quality"], formats, config.get("png_palette"),
+        config.get("quality_search")
+    )
+    render_tasks = use_vector_masters(tasks, config.get("vector_masters"))
+    backgrounds = vector_backgrounds(config.get("vector_masters"))
+    settings = {"profile": label, "adaptive_widths": True, "vector_backgrounds": backgrounds}
+    stale = select_stale_tasks(render_tasks, settings, manifest, hash_cache, stats, force)
+    run_resize_tasks(stale, manifest, hash_cache, stats, executor, metrics, memory_budget,
+                     backgrounds=backgrounds)
+
+    # Drop variants of widths no longer chosen, or of removed sources
+    # (fingerprinted twins are left to build_fingerprints)
+    if only is None and not exclude and os.path.isdir(cfg["output_dir"]):
+        current = {os.path.normpath(v[0]) for _, variants in tasks for v in variants}
+        twin = fingerprint_pattern(FINGERPRINT_CONFIG["hash_length"])
+        for name in sorted(os.listdir(cfg["output_dir"])):
+            path = os.path.normpath(os.path.join(cfg["output_dir"], name))
+            if path not in current and not twin.search(name):
+                os.remove(path)
+                manifest["variants"].pop(path, None)
+                print(f"Removed: {path}")
+        names = {os.path.normpath(os.path.join(in_dir, name)) for name in list_images(in_dir, VALID_EXTS)}
+        for key in [k for k in manifest["breakpoints"] if os.path.dirname(k) == os.path.normpath(in_dir)]:
+            if key not in names:
+                del manifest["breakpoints"][key]
+    if not write_data:
+        return set(widths_by_name)
+
+    widths_by_name.update(listed)
+    tasks = build_adaptive_tasks(
+        cfg, in_dir, widths_by_name, config["quality"], formats, config.get("png_palette"),
+        config.get("quality_search")
+    )
+    output_url = os.path.relpath(cfg["output_dir"], cfg["pages"]).replace(os.sep, "/")
+    entries = {}
+    for input_path, variants in tasks:
+        srcsets = {}
+        for output_path, width, _ in variants:
+            ext = os.path.splitext(output_path)[1].lstrip(".").lower()
+            srcsets.setdefault(ext, []).append(f"{output_url}/{os.path.basename(output_path)} {width}w")
+        entries[os.path.basename(input_path)] = {
+            "widths": widths_by_name[os.path.basename(input_path)],
+            "srcset": {ext: ", ".join(items) for ext, items in srcsets.items()},
+        }
+    lines = [
+        f"// {os.path.relpath(cfg['manifest'], '..')}",
+        "// Generated by PythonFiles/Image-Optimizer.py; do not edit by hand.",
+        "// Content-adaptive widths and srcset per format for each responsive image.",
+        "const SRCSET_MANIFEST = {",
+    ]
+    lines += [f"  {json.dumps(name)}: {json.dumps(entry)}," for name, entry in sorted(entries.items())]
+    lines.append("};\n")
+    if write_data_file(cfg["manifest"], "\n".join(lines)):
+        print(f"Saved: {cfg['manifest']} ({len(entries)} images)")
+    return set(widths_by_name)
+
+#==========
+# DEEP ZOOM
+#==========
+def dzi_path(cfg, input_path):
+    """Return the .dzi descriptor path a source's tile pyramid is written to."""
+    base_name = os.path.splitext(os.path.basename(input_path))[0]
+    return os.path.join(cfg["output_dir"], f"{base_name}.dzi")
+
+def dzi_xml(width, height, tile_size, overlap, fmt):
+    """Return the Deep Zoom Image descriptor for a pyramid."""
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<Image xmlns="http://schemas.microsoft.com/deepzoom/2008" Format="{fmt}" '
+        f'Overlap="{overlap}" TileSize="{tile_size}">\n'
+        f'  <Size Width="{width}" Height="{height}"/>\n'
+        "</Image>\n"
+    )
+
+def load_tile_source(input_path, size=None, background=DEFAULT_VECTOR_BACKGROUND):
+    """
+    Return the image a pyramid is cut from: an SVG master rendered by
+    cairosvg at size (width, height) on a background-coloured canvas, or the
+    decoded raster in RGB/RGBA.
+    """
+    if input_path.lower().endswith(".svg"):
+        png_data = cairosvg.svg2png(url=input_path, output_width=size[0], output_height=size[1],
+                                    background_color=background)
+        with Image.open(io.BytesIO(png_data)) as raster:
+            return raster.convert("RGB")
+    with Image.open(input_path) as img:
+        img.load()
+        img = ImageOps.exif_transpose(img)
+        has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+        return img.convert("RGBA" if has_alpha else "RGB")
+
+def build_pyramid(input_path, output_path, tile_size, overlap, fmt, options, size=None,
+                  background=DEFAULT_VECTOR_BACKGROUND):
+    """
+    Cut a source (see load_tile_source) into a DZI pyramid: level max is the
+    full image, each level below it half the size (rounded up) down to 1x1,
+    every level split into tile_size tiles with overlap pixels shared with each
+    neighbour. Tiles are written to a temp folder that replaces the old one in
+    one step. Returns (width, height, tile count, bytes written).
+    """
+    img = load_tile_source(input_path, size, background)
+    width, height = img.size
+    max_level = math.ceil(math.log2(max(width, height)))
+    files_dir = os.path.splitext(output_path)[0] + "_files"
+    tmp_dir = files_dir + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tiles = size = 0
+    level_img = img
+    for level in range(max_level, -1, -1):
+        if level < max_level:
+            level_img = level_img.resize(
+                (math.ceil(level_img.width / 2), math.ceil(level_img.height / 2)), Image.LANCZOS
+            )
+        level_dir = os.path.join(tmp_dir, str(level))
+        os.makedirs(level_dir)
+        for col in range(math.ceil(level_img.width / tile_size)):
+            for row in range(math.ceil(level_img.height / tile_size)):
+                box = (
+                    max(0, col * tile_size - overlap),
+                    max(0, row * tile_size - overlap),
+                    min(level_img.width, (col + 1) * tile_size + overlap),
+                    min(level_img.height, (row + 1) * tile_size + overlap),
+                )
+                buffer = encode_image(level_img.crop(box), f".{fmt}", options)
+                with open(os.path.join(level_dir, f"{col}_{row}.{fmt}"), "wb") as f:
+                    f.write(buffer.getbuffer())
+                tiles += 1
+                size += buffer.tell()
+    shutil.rmtree(files_dir, ignore_errors=True)
+    os.replace(tmp_dir, files_dir)
+    write_text_if_changed(output_path, dzi_xml(width, height, tile_size, overlap, fmt))
+    return width, height, tiles, size
+
+def build_deep_zoom(cfg, input_dir, manifest, hash_cache, stats, executor, memory_budget,
+                    only=None, exclude=None, force=False, write_data=True, vector_masters=None):
+    """
+    Build tile pyramids for the wide sources of a profile, from their SVG
+    master when there is one, and write the JS map modalZoom.js reads (unless
+    write_data is False; a filtered run that writes it lists the other wide
+    sources without tiling them). Pyramids are rebuilt only when their source
+    or tiling settings change; pyramids of removed or narrowed sources are
+    deleted. Unreadable sources count as failed.
+    """
+    fmt = cfg["format"] if features.check(cfg["format"]) else "png"
+    settings = {key: cfg[key] for key in ("tile_size", "overlap", "options")}
+    settings["format"] = fmt
+    vector_masters = vector_masters if cairosvg is not None else None
+    backgrounds = vector_backgrounds(vector_masters)
+    zoomable, pending = {}, []
+    for filename in list_images(input_dir, VALID_EXTS):
+        input_path = os.path.join(input_dir, filename)
+        selected = is_selected(input_path, only, exclude)
+        if not selected and not write_data:
+            continue
+        try:
+            with Image.open(input_path) as img:
+                width, height = display_size(img)
+        except (OSError, Image.DecompressionBombError) as e:
+            print(f"[ERROR] Failed reading {input_path}: {e}")
+            stats["failed"] += 1
+            continue
+        tile_source = find_vector_master(input_path, vector_masters) if vector_masters else None
+        tile_settings = dict(settings)
+        if tile_source:
+            width, height = width * cfg["vector_scale"], height * cfg["vector_scale"]
+            background = backgrounds[os.path.dirname(os.path.normpath(tile_source))]
+            tile_settings.update({"size": [width, height], "background": background})
+        else:
+            tile_source, background = input_path, DEFAULT_VECTOR_BACKGROUND
+        if width < cfg["min_width"]:
+            continue
+        output_path = dzi_path(cfg, input_path)
+        zoomable[filename] = (output_path, width, height)
+        if not selected:
+            continue
+        signature = variant_signature(hash_file(tile_source, hash_cache), {"deep_zoom": tile_settings})
+        if needs_rebuild(manifest, output_path, signature, force):
+            pending.append((tile_source, output_path, signature, (width, height), background))
+        else:
+            stats["skipped"] += 1
+
+    calls = [
+        (build_pyramid, (tile_source, output_path, cfg["tile_size"], cfg["overlap"], fmt, cfg["options"],
+                         size, background))
+        for tile_source, output_path, _, size, background in pending
+    ]
+    weights = [4 * 2 * width * height for _, _, _, (width, height), _ in pending]
+    for (input_path, output_path, signature, _, _), (result, error) in zip(
+        pending, run_calls(executor, calls, weights, memory_budget)
+    ):
+        if error:
+            print(f"[ERROR] Failed tiling {input_path}: {error}")
+            stats["failed"] += 1
+            continue
+        width, height, tiles, size = result
+        print(f"Saved: {output_path} ({width}x{height}, {tiles} tiles, {size / 1024:.0f} KB)")
+        record_variant(manifest, output_path, signature)
+        stats["rebuilt"] += 1
+
+    # Drop pyramids whose source is gone or no longer wide enough
+    if only is None and not exclude and os.path.isdir(cfg["output_dir"]):
+        current = {os.path.normpath(path) for path, _, _ in zoomable.values()}
+        for name in os.listdir(cfg["output_dir"]):
+            path = os.path.normpath(os.path.join(cfg["output_dir"], name))
+            if name.endswith(".dzi") and path not in current:
+                os.remove(path)
+                shutil.rmtree(os.path.splitext(path)[0] + "_files", ignore_errors=True)
+                manifest["variants"].pop(path, None)
+                print(f"Removed: {path}")
+    if not write_data:
+        return
+
+    tiles_url = os.path.relpath(cfg["output_dir"], cfg["pages"]).replace(os.sep, "/")
+    entries = {
+        filename: {
+            "tiles": f"{tiles_url}/{os.path.splitext(filename)[0]}_files/",
+            "width": width,
+            "height": height,
+            "tileSize": cfg["tile_size"],
+            "overlap": cfg["overlap"],
+            "format": fmt,
+        }
+        for filename, (_, width, height) in zoomable.items()
+    }
+    lines = [
+        f"// {os.path.relpath(cfg['manifest'], '..')}",
+        "// Generated by PythonFiles/Image-Optimizer.py; do not edit by hand.",
+        "// Deep zoom tile pyramid (DZI layout) for each image too wide for one zoom file.",
+        "const DEEP_ZOOM = {",
+    ]
+    lines += [f"  {json.dumps(name)}: {json.dumps(entry)}," for name, entry in sorted(entries.items())]
+    lines.append("};\n")
+    if write_data_file(cfg["manifest"], "\n".join(lines)):
+        print(f"Saved: {cfg['manifest']} ({len(entries)} zoomable images)")
+
+#=============
+# FINGERPRINTS
+#=============
+def fingerprint_pattern(length):
+    """Return a regex matching the .<hash> part of a fingerprinted file name."""
+    return re.compile(rf"\.[0-9a-f]{{{length}}}(?=\.[^./]+$)")
+
+def scan_fingerprint_roots(cfg, pattern):
+    """Return (plain image paths, fingerprinted twin paths) under the configured roots."""
+    excluded = {os.path.normpath(path) for path in cfg["exclude"]}
+    plain, hashed = [], []
+    for root in cfg["roots"]:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(
+                d for d in dirnames if os.path.normpath(os.path.join(dirpath, d)) not in excluded
+            )
+            for filename in sorted(filenames):
+                if filename.lower().endswith(FINGERPRINT_EXTS):
+                    path = os.path.join(dirpath, filename)
+                    (hashed if pattern.search(filename) else plain).append(path)
+    return plain, hashed
+
+def page_url(cfg, path):
+    """Return a file's URL relative to the pages that reference it."""
+    return os.path.relpath(path, cfg["pages"]).replace(os.sep, "/")
+
+def rewrite_image_urls(text, fingerprints, pattern):
+    """Point every image URL in text at its current hashed name, or back at the plain one."""
+    def replace(match):
+        plain = pattern.sub("", match.group(0))
+        return fingerprints.get(plain, plain)
+    return IMAGE_URL_PATTERN.sub(replace, text)
+
+def build_fingerprints(cfg):
+    """
+    Hardlink a content-hashed twin next to every plain image (when enabled),
+    delete twins whose hash is no longer current, rewrite the data files'
+    image URLs and write the plain -> hashed map the JS loaders read.
+    """
+    pattern = fingerprint_pattern(cfg["hash_length"])
+    plain, hashed = scan_fingerprint_roots(cfg, pattern)
+    fingerprints = {}
+    created = 0
+    if cfg["enabled"]:
+        for path in plain:
+            stem, ext = os.path.splitext(path)
+            twin = f"{stem}.{hash_file(path, {})[:cfg['hash_length']]}{ext}"
+            if not os.path.isfile(twin):
+                link_variant(path, twin)
+                created += 1
+            fingerprints[page_url(cfg, path)] = page_url(cfg, twin)
+    current = {os.path.normpath(os.path.join(cfg["pages"], url)) for url in fingerprints.values()}
+    removed = 0
+    for path in hashed:
+        if os.path.normpath(path) not in current:
+            os.remove(path)
+            removed += 1
+
+    map_path = os.path.normpath(cfg["map"])
+    data_files = sorted({
+        os.path.normpath(path) for data_glob in cfg["data_files"] for path in glob.glob(data_glob)
+    } - {map_path})
+    for path in data_files:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        if write_text_if_changed(path, rewrite_image_urls(text, fingerprints, pattern)):
+            print(f"Rewrote image URLs: {path}")
+
+    lines = [
+        f"// {os.path.relpath(cfg['map'], '..')}",
+        "// Generated by PythonFiles/Image-Optimizer.py; do not edit by hand.",
+        "// Content-hashed URL for each optimized image (empty while fingerprinting is off).",
+        "const IMAGE_FINGERPRINTS = {",
+    ]
+    lines += [f"  {json.dumps(url)}: {json.dumps(twin)}," for url, twin in sorted(fingerprints.items())]
+    lines.append("};\n")
+    if write_text_if_changed(cfg["map"], "\n".join(lines)):
+        print(f"Saved: {cfg['map']} ({len(fingerprints)} images)")
+    if fingerprints or removed:
+        print(f"Fingerprints: {len(fingerprints)} current, {created} created, {removed} superseded removed")
+
+def hardlink_savings(root):
+    """
+    Return (total_bytes, on_disk_bytes) for the files under root, where
+    on_disk_bytes counts each hardlinked inode only once.
+    """
+    total = 0
+    inodes = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            st = os.stat(os.path.join(dirpath, filename))
+            total += st.st_size
+            inodes[(st.st_dev, st.st_ino)] = st.st_size
+    return total, sum(inodes.values())
+
+#=======
+# SHARDS
+#=======
+def shard_of(name, count):
+    """Return the 1-based shard a source file name belongs to, the same on every machine and run."""
+    return int(hashlib.sha256(name.encode("utf-8")).hexdigest(), 16) % count + 1
+
+def source_names(image_profiles, asset_sets, favicon_config):
+    """Return every source file name the optimizer reads: profile and asset images plus the favicon."""
+    names = set()
+    for input_dir in gather_input_dirs(image_profiles, asset_sets):
+        if os.path.isdir(input_dir):
+            names.update(list_images(input_dir, VALID_EXTS))
+    if os.path.isfile(favicon_config["input"]):
+        names.add(os.path.basename(favicon_config["input"]))
+    return sorted(names)
+
+def shard_manifest_path(index, count):
+    """Return the partial manifest path of one shard."""
+    return SHARD_MANIFEST_PATH.format(index=index, count=count)
+
+def file_digest(path):
+    """Return the SHA-256 of a file's bytes, or None if it does not exist."""
+    return hash_file(path, {}) if os.path.isfile(path) else None
+
+def manifest_changes(base, manifest):
+    """Return the manifest entries added or changed since base, per section."""
+    return {
+        section: {
+            key: value for key, value in manifest[section].items()
+            if base[section].get(key) != value
+        }
+        for section in MANIFEST_SECTIONS
+    }
+
+def save_shard_manifest(index, count, base_digest, sources, changes):
+    """Write one shard's partial manifest: what it was built from, covered and changed."""
+    path = shard_manifest_path(index, count)
+    save_manifest(path, {
+        "version": MANIFEST_VERSION,
+        "shard": index,
+        "count": count,
+        "base": base_digest,
+        "sources": sources,
+        "changes": changes,
+    })
+    total = sum(len(entries) for entries in changes.values())
+    print(f"Saved: {path} (shard {index}/{count}: {len(sources)} sources, {total} manifest entries)")
+
+def merge_shards(count, expected):
+    """
+    Fold the partial manifests of shards 1..count into the build manifest.
+    Every shard must be present and built from the current manifest, the
+    shards together must cover exactly the expected source names, no two
+    may record different values for one entry, and every variant they
+    recorded must be on disk. Problems are printed and exit the run
+    before anything is written; merged partial manifests are removed.
+    """
+    base_digest = file_digest(MANIFEST_PATH)
+    manifest = load_manifest(MANIFEST_PATH)
+    problems, partials = [], []
+    for index in range(1, count + 1):
+        path = shard_manifest_path(index, count)
+        try:
+            with open(path, "r") as f:
+                partial = json.load(f)
+        except (OSError, ValueError) as e:
+            problems.append(f"shard {index}/{count}: cannot read {path}: {e}")
+            continue
+        if partial.get("version") != MANIFEST_VERSION or (partial.get("shard"), partial.get("count")) != (index, count):
+            problems.append(f"shard {index}/{count}: {path} belongs to another build")
+        elif partial["base"] != base_digest:
+            problems.append(f"shard {index}/{count}: built from a different {MANIFEST_PATH}")
+        else:
+            partials.append((index, path, partial))
+
+    owners = {}
+    for index, _, partial in partials:
+        for name in partial["sources"]:
+            owners.setdefault(name, []).append(index)
+    if len(partials) == count:
+        missing = sorted(set(expected) - set(owners))
+        if missing:
+            problems.append(f"{len(missing)} source(s) built by no shard: {', '.join(missing)}")
+    for name, indexes in sorted(owners.items()):
+        if len(indexes) > 1:
+            problems.append(f"{name} built by shards {', '.join(map(str, indexes))}")
+
+    merged = {section: {} for section in MANIFEST_SECTIONS}
+    for index, _, partial in partials:
+        for section in MANIFEST_SECTIONS:
+            for key, value in partial["changes"].get(section, {}).items():
+                if key in merged[section] and merged[section][key] != value:
+                    problems.append(f"shards disagree on {section} entry {key}")
+                merged[section][key] = value
+    for path in sorted(merged["variants"]):
+        if not os.path.exists(path):
+            problems.append(f"missing output {path} (copy every shard's outputs into this tree first)")
+
+    if problems:
+        for problem in problems:
+            print(f"[ERROR] Merge: {problem}")
+        sys.exit(1)
+    for section in MANIFEST_SECTIONS:
+        manifest[section].update(merged[section])
+    save_manifest(MANIFEST_PATH, manifest)
+    for _, path, _ in partials:
+        os.remove(path)
+    total = sum(len(entries) for entries in merged.values())
+    print(f"[INFO] Merged {count} shard(s) covering {len(owners)} sources ({total} manifest entries).")
 
 #=====
 # MAIN
 #=====
 def main():
     """Run all setup, processing, and resizing tasks."""
+    args = parse_args()
+    if args.profile:
+        start_profiler(args.profile)
     for package in REQUIRED_PACKAGES:
         check_package(package)
     # Gather all candidate input dirs
@@ -195,62 +1971,182 @@ def main():
     if not any(dir_has_images(d, VALID_EXTS) for d in existing_inputs) and not favicon_exists:
         print("[ERROR] No images found in any existing input directory. Exiting.")
         sys.exit(1)
-    # --- Responsive images (no pre-creation of outputs) ---
-    for label, config in IMAGE_PROFILES.items():
-        in_dir = config["input_dir"]
-        if not os.path.isdir(in_dir):
-            print(f"[WARNING] Skipping profile '{label}': input dir not found -> {in_dir}")
-            continue
-        print(f"========= Processing profile: {label} =========")
-        for device in ["desktop", "laptop", "mobile"]:
-            versions = config["sizes"].get(device, {})
-            for version_type, width in versions.items():
-                output_dir = os.path.join(config["output_base"], device, version_type)
-                print(f"Profile: {label} → {device} → {version_type} @ {width}px")
-                tasks = build_resize_tasks(in_dir, output_dir, width, VALID_EXTS)
-                if not tasks:
-                    print("No images found.")
-                else:
-                    for task in tasks:
-                        resize_image(*task, config["quality"])
-            print()
-    # --- Assets (thumbs/icons) ---
-    for asset_type, sets in ASSET_SETS.items():
-        for label, cfg in sets.items():
-            in_dir = cfg["input_dir"]
+    # Shards build a disjoint slice of the sources; a merge folds them in first
+    only = args.only
+    if args.merge:
+        expected = [n for n in source_names(IMAGE_PROFILES, ASSET_SETS, FAVICON_CONFIG)
+                    if is_selected(n, args.only, args.exclude)]
+        merge_shards(args.merge, expected)
+    elif args.shard:
+        index, count = args.shard
+        only = [
+            n for n in source_names(IMAGE_PROFILES, ASSET_SETS, FAVICON_CONFIG)
+            if shard_of(n, count) == index and is_selected(n, args.only, args.exclude)
+        ]
+        print(f"[INFO] Shard {index}/{count}: {len(only)} source(s); data files, sprites and "
+              f"fingerprints are left to --merge {count}.")
+    full_run = not args.shard
+    # Filtered runs never read unselected sources (a generator may still be
+    # writing them), so data files that list every source wait for a full run
+    # unless --write-data says every source is settled
+    write_data = full_run and not args.exclude and (only is None or args.write_data)
+    if full_run and not write_data:
+        print("[INFO] Filtered run: data files, sprites and fingerprints are left to an "
+              "unfiltered run.")
+    # Load the build manifest so unchanged variants can be skipped
+    base_digest = file_digest(MANIFEST_PATH)
+    manifest = load_manifest(MANIFEST_PATH)
+    base_manifest = copy.deepcopy(manifest) if args.shard else None
+    hash_cache = {}
+    stats = {"rebuilt": 0, "skipped": 0, "failed": 0}
+    metrics = open_metrics(args.metrics)
+    if args.force:
+        print("[INFO] --force given: rebuilding every variant.")
+    memory_budget = args.jobs * args.worker_memory * 1024 * 1024
+    print(f"[INFO] Using {args.jobs} worker process(es), {args.worker_memory} MB each.")
+    with create_executor(args.jobs) as executor:
+        # --- Responsive images (no pre-creation of outputs) ---
+        for label, config in IMAGE_PROFILES.items():
+            in_dir = config["input_dir"]
             if not os.path.isdir(in_dir):
-                print(f"[WARNING] Skipping {asset_type} for '{label}': input dir not found -> {in_dir}")
+                print(f"[WARNING] Skipping profile '{label}': input dir not found -> {in_dir}")
                 continue
-            print(f"========= Processing {asset_type} for: {label} =========")
-            tasks = process_assets(in_dir, cfg["output_dir"], cfg["width"], cfg["quality"], VALID_EXTS)
+            print(f"========= Processing profile: {label} =========")
+            targets = profile_targets(config, DEVICES)
+            widths = ", ".join(f"{width}px" for _, width in targets)
+            print(f"Profile: {label} → {len(targets)} variants per image ({widths})")
+            formats = supported_formats(config.get("formats", {}))
+            if formats:
+                print(f"Extra formats: {', '.join(formats)}")
+            # Adaptive widths first: sources they cover skip the fixed widths they replace
+            covered, replaced = set(), set()
+            if config.get("adaptive_widths"):
+                covered = build_adaptive_widths(
+                    config["adaptive_widths"], label, config, formats, manifest, hash_cache, stats,
+                    executor, metrics, memory_budget, only, args.exclude, args.force, write_data
+                )
+                replaced = replaced_dirs(config["adaptive_widths"], targets)
+                remove_replaced_variants(covered, formats, replaced, manifest)
+            tasks = build_resize_tasks(
+                in_dir, targets, VALID_EXTS, config["quality"], formats, config.get("png_palette"),
+                config.get("quality_search")
+            )
+            tasks = [t for t in tasks if is_selected(t[0], only, args.exclude)]
+            tasks = drop_replaced_variants(tasks, covered, replaced)
+            tasks = use_vector_masters(tasks, config.get("vector_masters"))
             if not tasks:
                 print("No images found.")
             else:
-                for task in tasks:
-                    resize_image(*task)
+                no_upscale = config.get("no_upscale", False)
+                backgrounds = vector_backgrounds(config.get("vector_masters"))
+                settings = {"profile": label, "no_upscale": no_upscale, "vector_backgrounds": backgrounds}
+                stale = select_stale_tasks(tasks, settings, manifest, hash_cache, stats, args.force)
+                run_resize_tasks(stale, manifest, hash_cache, stats, executor, metrics, memory_budget,
+                                 no_upscale, backgrounds)
+            if config.get("image_manifest") and write_data:
+                entries = collect_image_entries(in_dir, manifest, hash_cache)
+                for filename, entry in entries.items():
+                    kept = [t for t in targets if filename not in covered or os.path.normpath(t[0]) not in replaced]
+                    entry["formats"] = built_formats(filename, kept, formats)
+                if write_image_manifest(config["image_manifest"], entries):
+                    print(f"Saved: {config['image_manifest']} ({len(entries)} images)")
+            if config.get("deep_zoom"):
+                build_deep_zoom(config["deep_zoom"], in_dir, manifest, hash_cache, stats, executor,
+                                memory_budget, only, args.exclude, args.force, write_data,
+                                config.get("vector_masters"))
             print()
-    # --- Favicons ---
-    favicon_input = FAVICON_CONFIG["input"]
-    favicon_output_dir = FAVICON_CONFIG["output_dir"]
-    if os.path.isfile(favicon_input):
-        print("========= Processing favicons =========")
-        # PNG sizes
-        for size in FAVICON_CONFIG["sizes"]:
-            output_path = os.path.join(
-                favicon_output_dir,
-                f"favicon-{size}x{size}.png"
-            )
-            generate_favicon_png(favicon_input, output_path, size)
-        # ICO
-        ico_path = os.path.join(favicon_output_dir, "favicon.ico")
-        generate_favicon_ico(
-            favicon_input,
-            ico_path,
-            FAVICON_CONFIG["ico_sizes"]
-        )
-        print()
+        # --- Assets (thumbs/icons) ---
+        for asset_type, sets in ASSET_SETS.items():
+            for label, cfg in sets.items():
+                in_dir = cfg["input_dir"]
+                if not os.path.isdir(in_dir):
+                    print(f"[WARNING] Skipping {asset_type} for '{label}': input dir not found -> {in_dir}")
+                    continue
+                print(f"========= Processing {asset_type} for: {label} =========")
+                formats = supported_formats(cfg.get("formats", {}))
+                tasks = build_resize_tasks(
+                    in_dir, [(cfg["output_dir"], cfg["width"])], VALID_EXTS, cfg["quality"], formats,
+                    cfg.get("png_palette"), cfg.get("quality_search")
+                )
+                tasks = [t for t in tasks if is_selected(t[0], only, args.exclude)]
+                if not tasks:
+                    print("No images found.")
+                else:
+                    no_upscale = cfg.get("no_upscale", False)
+                    settings = {"profile": f"{asset_type}/{label}", "no_upscale": no_upscale}
+                    stale = select_stale_tasks(tasks, settings, manifest, hash_cache, stats, args.force)
+                    run_resize_tasks(stale, manifest, hash_cache, stats, executor, metrics, memory_budget,
+                                     no_upscale)
+                if cfg.get("sprite") and write_data:
+                    build_sprite(cfg, manifest, hash_cache, stats, args.force)
+                print()
+        # --- Favicons ---
+        favicon_input = FAVICON_CONFIG["input"]
+        favicon_output_dir = FAVICON_CONFIG["output_dir"]
+        if not os.path.isfile(favicon_input):
+            print(f"[WARNING] Skipping favicons: source not found -> {favicon_input}")
+        elif is_selected(favicon_input, only, args.exclude):
+            print("========= Processing favicons =========")
+            favicon_hash = hash_file(favicon_input, hash_cache)
+            # PNG sizes, then the multi-size ICO
+            favicon_jobs = []
+            for size in FAVICON_CONFIG["sizes"]:
+                output_path = os.path.join(
+                    favicon_output_dir,
+                    f"favicon-{size}x{size}.png"
+                )
+                favicon_jobs.append((
+                    output_path,
+                    {"favicon": "png", "size": size},
+                    (generate_favicon_png, (favicon_input, output_path, size))
+                ))
+            ico_path = os.path.join(favicon_output_dir, "favicon.ico")
+            favicon_jobs.append((
+                ico_path,
+                {"favicon": "ico", "sizes": FAVICON_CONFIG["ico_sizes"]},
+                (generate_favicon_ico, (favicon_input, ico_path, FAVICON_CONFIG["ico_sizes"]))
+            ))
+            pending = []
+            for output_path, settings, call in favicon_jobs:
+                signature = variant_signature(favicon_hash, settings)
+                if needs_rebuild(manifest, output_path, signature, args.force):
+                    pending.append((output_path, signature, call))
+                else:
+                    stats["skipped"] += 1
+            results = run_calls(executor, [call for _, _, call in pending])
+            for (output_path, signature, _), (_, error) in zip(pending, results):
+                if error:
+                    print(f"[ERROR] Failed generating {output_path}: {error}")
+                    stats["failed"] += 1
+                    continue
+                print(f"Saved: {output_path}")
+                record_variant(manifest, output_path, signature)
+                stats["rebuilt"] += 1
+            print()
+    if full_run:
+        # --- Fingerprints (after every variant they twin is written) ---
+        if write_data:
+            print("========= Fingerprinting images =========")
+            build_fingerprints(FINGERPRINT_CONFIG)
+            print()
+        save_manifest(MANIFEST_PATH, manifest)
     else:
-        print(f"[WARNING] Skipping favicons: source not found -> {favicon_input}")
+        save_shard_manifest(*args.shard, base_digest, only, manifest_changes(base_manifest, manifest))
+    close_metrics(metrics)
+    # Report how much disk the hardlinked duplicates save per profile (other
+    # shards may still be writing, so shard runs skip it)
+    for label, config in (IMAGE_PROFILES.items() if full_run else []):
+        if not os.path.isdir(config["output_base"]):
+            continue
+        total, on_disk = hardlink_savings(config["output_base"])
+        mb = 1024 * 1024
+        print(f"Profile {label}: {total / mb:.1f} MB of variants, {on_disk / mb:.1f} MB on disk "
+              f"({(total - on_disk) / mb:.1f} MB saved by hardlinks) -> {config['output_base']}")
+    print(f"Variants rebuilt: {stats['rebuilt']}, skipped (unchanged): {stats['skipped']}, "
+          f"failed: {stats['failed']}")
+    if stats["failed"]:
+        print(f"[ERROR] {stats['failed']} image task(s) failed.")
+        sys.exit(1)
     print("Done. Responsive images and asset images generated.")
 
 if __name__ == "__main__":
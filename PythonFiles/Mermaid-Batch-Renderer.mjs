@@ -0,0 +1,106 @@
+// ======================================
+// PERSISTENT MERMAID RENDERER (BATCH MODE)
+// ======================================
+//
+// Used by Generate-SiteDiagrams.py so a whole run shares one headless browser
+// instead of cold-starting Node + Chromium for every mmdc call.
+//
+// Usage: node Mermaid-Batch-Renderer.mjs <mermaid-cli package dir>
+//
+// Reads one JSON job per stdin line:
+//   {"input": "x.mmd", "svg": "x.svg", "png": "x.png", "scale": 4, "config": "cfg.json"}
+// and writes one JSON result line per job:
+//   {"input": "x.mmd", "ok": true} or {"input": "x.mmd", "ok": false, "error": "..."}
+//
+// Each diagram is laid out once by Mermaid; the PNG is a screenshot of that
+// same SVG at the requested device scale factor.
+
+import { createRequire } from "node:module";
+import { readFile, writeFile } from "node:fs/promises";
+import { createInterface } from "node:readline";
+import { join } from "node:path";
+import { pathToFileURL } from "node:url";
+
+// Match mmdc defaults so output sizes stay the same as the per-file CLI
+const VIEWPORT = { width: 800, height: 600 };
+const BACKGROUND = "white";
+
+const cliDir = process.argv[2];
+if (!cliDir) {
+  console.error("Usage: node Mermaid-Batch-Renderer.mjs <mermaid-cli package dir>");
+  process.exit(2);
+}
+
+// Load mermaid-cli and its bundled puppeteer from the mmdc install
+const requireCli = createRequire(join(cliDir, "package.json"));
+const puppeteer = requireCli("puppeteer");
+const { renderMermaid } = await import(pathToFileURL(join(cliDir, "src", "index.js")).href);
+
+// Mermaid config files are shared by every job, so read each only once
+const configCache = new Map();
+async function loadConfig(path) {
+  if (!path) return {};
+  if (!configCache.has(path)) {
+    configCache.set(path, JSON.parse(await readFile(path, "utf8")));
+  }
+  return configCache.get(path);
+}
+
+// Render one diagram to SVG, then rasterize that SVG to PNG
+async function renderJob(browser, page, job) {
+  const definition = await readFile(job.input, "utf8");
+  const mermaidConfig = await loadConfig(job.config);
+  const { data } = await renderMermaid(browser, definition, "svg", {
+    viewport: VIEWPORT,
+    backgroundColor: BACKGROUND,
+    mermaidConfig
+  });
+  const svg = Buffer.from(data).toString("utf8");
+  await writeFile(job.svg, svg);
+
+  if (job.png) {
+    // As mmdc does: no body margin, and the viewport sized to the SVG's
+    // bounding box so wide diagrams are not clipped by the default 800x600
+    const deviceScaleFactor = job.scale || 1;
+    await page.setViewport({ ...VIEWPORT, deviceScaleFactor });
+    await page.setContent(`<!DOCTYPE html><html><body style="margin: 0; background: ${BACKGROUND}">${svg}</body></html>`);
+    const clip = await page.$eval("svg", (element) => {
+      const rect = element.getBoundingClientRect();
+      return {
+        x: Math.floor(rect.left),
+        y: Math.floor(rect.top),
+        width: Math.ceil(rect.width),
+        height: Math.ceil(rect.height)
+      };
+    });
+    await page.setViewport({
+      width: clip.x + clip.width,
+      height: clip.y + clip.height,
+      deviceScaleFactor
+    });
+    await writeFile(job.png, await page.screenshot({ clip, omitBackground: false }));
+  }
+}
+
+function reply(result) {
+  process.stdout.write(JSON.stringify(result) + "\n");
+}
+
+const browser = await puppeteer.launch({ headless: true });
+try {
+  const page = await browser.newPage();
+  const lines = createInterface({ input: process.stdin, crlfDelay: Infinity });
+  for await (const line of lines) {
+    if (!line.trim()) continue;
+    let job = {};
+    try {
+      job = JSON.parse(line);
+      await renderJob(browser, page, job);
+      reply({ input: job.input, ok: true });
+    } catch (err) {
+      reply({ input: job.input, ok: false, error: String(err?.message || err) });
+    }
+  }
+} finally {
+  await browser.close();
+}
@@ -2,17 +2,74 @@
 
 """Run diagram generators and image optimizer for the portfolio."""
 
+import argparse
+import ctypes
+import ctypes.util
+import importlib.util
 import os
+import queue
+import select
+import struct
 import subprocess
 import sys
+import threading
+import time
+from pathlib import Path
 
 # CONSTANTS
 WORKING_DIR = "PythonFiles"
 SCRIPTS = [
     "Generate-SiteDiagrams.py",
     "Generate-Flowchart.py",
-    "Image-Optimizer.py"
+    "Image-Optimizer.py",
+    "Compress-Assets.py"
 ]
+OPTIMIZER_SCRIPT = "Image-Optimizer.py"
+
+# Final stage: minify SVGs and precompress text assets once images are done
+COMPRESS_SCRIPT = "Compress-Assets.py"
+
+# Dependency graph: each generator turns diagram JSON into an original PNG
+# with the same stem, which the optimizer turns into responsive variants
+GENERATORS = {
+    "sitemaps": {
+        "script": "Generate-SiteDiagrams.py",
+        "source_dir": "../diagrams/siteMaps",
+        "pattern": "*.json",
+        "config": "../diagrams/siteMermaidConfig.json"
+    },
+    "flowcharts": {
+        "script": "Generate-Flowchart.py",
+        "source_dir": "../diagrams/flowCharts",
+        "pattern": "*Flow.json",
+        "config": "../diagrams/FlowConfig.json"
+    }
+}
+ORIGINALS_DIR = "../projects/images/main/original"
+
+# Seconds between checks for newly written originals
+POLL_INTERVAL = 0.5
+
+# Watch mode: quiet period that ends a burst of changes, and the polling
+# interval used when inotify is unavailable
+WATCH_DEBOUNCE = 0.3
+WATCH_POLL_INTERVAL = 1.0
+
+# inotify event masks (linux/inotify.h)
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_DELETE = 0x200
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Update all generated webpage images.")
+    parser.add_argument("--sequential", action="store_true",
+                        help="Run the scripts one after another instead of as a pipeline.")
+    parser.add_argument("--watch", action="store_true",
+                        help="After the first build, keep watching sources and rebuild what changes.")
+    return parser.parse_args()
 
 
 def run_script(script_name):
@@ -25,13 +82,327 @@ def run_script(script_name):
     print(f"\nFinished: {script_name}\n")
 
 
+# ==================
+# PIPELINE EXECUTION
+# ==================
+def build_dependency_graph(generators, originals_dir):
+    """Map each generator label to the original PNG paths its diagram JSON files produce."""
+    graph = {}
+    for label, cfg in generators.items():
+        sources = sorted(Path(cfg["source_dir"]).glob(cfg["pattern"]))
+        graph[label] = [os.path.join(originals_dir, f"{src.stem}.png") for src in sources]
+    return graph
+
+
+def file_signature(path):
+    """Return (size, mtime_ns) for a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def start_script(label, script_name, args, print_lock):
+    """Start a script with its output streamed line by line under a [label] prefix."""
+    proc = subprocess.Popen(
+        [sys.executable, "-u", script_name, *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True
+    )
+
+    def relay():
+        for line in proc.stdout:
+            with print_lock:
+                print(f"[{label}] {line.rstrip()}", flush=True)
+
+    thread = threading.Thread(target=relay, daemon=True)
+    thread.start()
+    return proc, thread
+
+
+def optimizer_dispatcher(batches, print_lock, failures):
+    """
+    Run queued optimizer batches one at a time, so the build manifest has a
+    single writer. Batches are (flag, names), or (None, []) for an unfiltered
+    run; --only batches queued back to back are merged into one run. None
+    stops the loop.
+    """
+    batch = batches.get()
+    while batch is not None:
+        flag, names = batch
+        held = []
+        while flag == "--only":
+            try:
+                extra = batches.get_nowait()
+            except queue.Empty:
+                break
+            if extra is None or extra[0] != "--only":
+                held.append(extra)
+                break
+            names = names + extra[1]
+        args = [flag, *names] if flag else []
+        with print_lock:
+            scope = f"{flag} {len(names)} file(s)" if flag else "all files"
+            print(f"\n=== Optimizing ({scope}) ===\n", flush=True)
+        proc, thread = start_script("optimizer", OPTIMIZER_SCRIPT, args, print_lock)
+        proc.wait()
+        thread.join()
+        if proc.returncode != 0:
+            step = f"{OPTIMIZER_SCRIPT} {flag}" if flag else OPTIMIZER_SCRIPT
+            failures.append(f"{step} (exit {proc.returncode})")
+        batch = held[0] if held else batches.get()
+
+
+def run_pipeline():
+    """
+    Run both generators concurrently and optimize each original as soon as it
+    is written. Everything not produced by a generator is optimized first;
+    filtered runs never read the other sources, so a last unfiltered run
+    (every variant already current) writes the data files over all of them.
+    Returns the list of failed steps.
+    """
+    print_lock = threading.Lock()
+    graph = build_dependency_graph(GENERATORS, ORIGINALS_DIR)
+    diagram_names = sorted({os.path.basename(p) for paths in graph.values() for p in paths})
+    baseline = {p: file_signature(p) for paths in graph.values() for p in paths}
+
+    failures = []
+    batches = queue.Queue()
+    dispatcher = threading.Thread(target=optimizer_dispatcher, args=(batches, print_lock, failures))
+    dispatcher.start()
+    batches.put(("--exclude", diagram_names))
+
+    running = {
+        label: start_script(label, cfg["script"], [], print_lock)
+        for label, cfg in GENERATORS.items()
+    }
+    pending = {label: set(paths) for label, paths in graph.items()}
+    last_seen = {}
+    while running:
+        ready = []
+        # An original is ready once it changed and then stayed the same for one poll
+        for label, paths in pending.items():
+            for path in sorted(paths):
+                signature = file_signature(path)
+                if signature is not None and signature != baseline[path] and last_seen.get(path) == signature:
+                    ready.append(path)
+                last_seen[path] = signature
+        # When a generator exits, everything it owns is final
+        for label, (proc, thread) in list(running.items()):
+            if proc.poll() is None:
+                continue
+            thread.join()
+            if proc.returncode != 0:
+                failures.append(f"{GENERATORS[label]['script']} (exit {proc.returncode})")
+            ready.extend(pending[label])
+            del running[label]
+        for label in pending:
+            pending[label].difference_update(ready)
+        if ready:
+            batches.put(("--only", sorted({os.path.basename(p) for p in ready})))
+        if running:
+            time.sleep(POLL_INTERVAL)
+
+    batches.put((None, []))
+    batches.put(None)
+    dispatcher.join()
+    return failures
+
+
+# ==========
+# WATCH MODE
+# ==========
+def load_script(script_name):
+    """Import one of the hyphen-named scripts as a module (its main() is not run)."""
+    spec = importlib.util.spec_from_file_location(Path(script_name).stem.replace("-", "_").lower(), script_name)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_image_inputs():
+    """Return (input dirs, valid extensions) from Image-Optimizer.py's config."""
+    optimizer = load_script(OPTIMIZER_SCRIPT)
+    dirs = optimizer.gather_input_dirs(optimizer.IMAGE_PROFILES, optimizer.ASSET_SETS)
+    dirs.append(os.path.dirname(optimizer.FAVICON_CONFIG["input"]))
+    return sorted({os.path.normpath(d) for d in dirs}), optimizer.VALID_EXTS
+
+
+def snapshot_dirs(dirs):
+    """Return {path: (size, mtime_ns)} for the files directly inside dirs."""
+    snapshot = {}
+    for directory in dirs:
+        if not os.path.isdir(directory):
+            continue
+        for entry in os.scandir(directory):
+            if entry.is_file():
+                st = entry.stat()
+                snapshot[os.path.normpath(entry.path)] = (st.st_size, st.st_mtime_ns)
+    return snapshot
+
+
+def open_watcher(dirs):
+    """
+    Start watching dirs with inotify where available (Linux), else by polling.
+    Returns a dict describing the watcher for wait_for_changes().
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd >= 0:
+                watches = {}
+                for directory in dirs:
+                    if os.path.isdir(directory):
+                        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_DELETE
+                        wd = libc.inotify_add_watch(fd, os.fsencode(directory), mask)
+                        if wd >= 0:
+                            watches[wd] = directory
+                return {"kind": "inotify", "fd": fd, "watches": watches}
+        except (OSError, AttributeError):
+            pass
+    return {"kind": "poll", "dirs": dirs, "snapshot": snapshot_dirs(dirs)}
+
+
+def read_inotify(watcher, timeout):
+    """Return the paths named by inotify events arriving within timeout seconds."""
+    ready, _, _ = select.select([watcher["fd"]], [], [], timeout)
+    if not ready:
+        return set()
+    paths = set()
+    try:
+        buffer = os.read(watcher["fd"], 65536)
+    except BlockingIOError:
+        return paths
+    offset = 0
+    while offset < len(buffer):
+        wd, _, _, length = INOTIFY_EVENT.unpack_from(buffer, offset)
+        offset += INOTIFY_EVENT.size
+        name = buffer[offset:offset + length].rstrip(b"\0").decode("utf-8", "replace")
+        offset += length
+        if name and wd in watcher["watches"]:
+            paths.add(os.path.normpath(os.path.join(watcher["watches"][wd], name)))
+    return paths
+
+
+def poll_changes(watcher, timeout):
+    """Return the paths added, changed or removed since the last poll."""
+    time.sleep(timeout)
+    current = snapshot_dirs(watcher["dirs"])
+    previous = watcher["snapshot"]
+    watcher["snapshot"] = current
+    return {p for p in current.keys() | previous.keys() if current.get(p) != previous.get(p)}
+
+
+def wait_for_changes(watcher):
+    """Block until something changes, then keep collecting until a quiet WATCH_DEBOUNCE."""
+    read = read_inotify if watcher["kind"] == "inotify" else poll_changes
+    changed = set()
+    while not changed:
+        changed = read(watcher, WATCH_POLL_INTERVAL)
+    while True:
+        more = read(watcher, WATCH_DEBOUNCE)
+        if not more:
+            return changed
+        changed |= more
+
+
+def plan_rebuild(changed, image_dirs, valid_exts):
+    """
+    Map changed paths to work: {generator label: set of JSON names or None for
+    all}, plus the image file names the optimizer should rebuild.
+    """
+    generators = {}
+    images = set()
+    for path in sorted(changed):
+        directory, name = os.path.split(path)
+        for label, cfg in GENERATORS.items():
+            if path == os.path.normpath(cfg["config"]):
+                generators[label] = None
+            elif directory == os.path.normpath(cfg["source_dir"]) and Path(name).match(cfg["pattern"]):
+                if label not in generators:
+                    generators[label] = set()
+                if generators[label] is not None:
+                    generators[label].add(name)
+        if directory in image_dirs and name.lower().endswith(valid_exts) and os.path.isfile(path):
+            images.add(name)
+    return generators, images
+
+
+def snapshot_assets(compressor):
+    """Return {path: (size, mtime_ns)} for every text asset Compress-Assets.py handles."""
+    return {path: file_signature(path) for path in compressor.find_assets(compressor.ASSET_PATTERNS)}
+
+
+def run_step(script_name, args):
+    """Run one script in the foreground and return its exit code."""
+    print(f"\n=== {script_name} {' '.join(args)} ===\n", flush=True)
+    return subprocess.run([sys.executable, script_name, *args], check=False).returncode
+
+
+def watch():
+    """
+    Rebuild only what changes: a diagram JSON re-runs its generator for that
+    file, a config JSON re-runs its whole generator, and a changed original
+    (including ones a generator just wrote) is re-optimized on the next event.
+    Only the text assets those steps changed are recompressed.
+    """
+    image_dirs, valid_exts = load_image_inputs()
+    compressor = load_script(COMPRESS_SCRIPT)
+    watch_dirs = sorted({
+        os.path.normpath(d)
+        for cfg in GENERATORS.values()
+        for d in (cfg["source_dir"], os.path.dirname(cfg["config"]))
+    } | set(image_dirs))
+    watcher = open_watcher(watch_dirs)
+    print(f"\n[WATCH] Watching {len(watch_dirs)} directories using {watcher['kind']}. Ctrl+C to stop.")
+    try:
+        while True:
+            generators, images = plan_rebuild(wait_for_changes(watcher), image_dirs, valid_exts)
+            if not generators and not images:
+                continue
+            before = snapshot_assets(compressor)
+            for label, names in generators.items():
+                args = ["--only", *sorted(names)] if names else []
+                if run_step(GENERATORS[label]["script"], args) != 0:
+                    print(f"[WATCH] {GENERATORS[label]['script']} failed; waiting for the next change.")
+            # Every source is settled between events, so the targeted run can
+            # also refresh the data files (each written only if it changed)
+            if images:
+                if run_step(OPTIMIZER_SCRIPT, ["--only", *sorted(images), "--write-data"]) != 0:
+                    print(f"[WATCH] {OPTIMIZER_SCRIPT} failed; waiting for the next change.")
+            after = snapshot_assets(compressor)
+            outputs = sorted(p for p in after if after[p] != before.get(p))
+            if outputs and run_step(COMPRESS_SCRIPT, ["--only", *outputs]) != 0:
+                print(f"[WATCH] {COMPRESS_SCRIPT} failed; waiting for the next change.")
+            print("\n[WATCH] Up to date. Waiting for changes...", flush=True)
+    except KeyboardInterrupt:
+        print("\n[WATCH] Stopped.")
+
+
 def main():
-    """Run all webpage image update scripts in sequence."""
+    """Run all webpage image update scripts as a streaming pipeline (or in sequence)."""
+    args = parse_args()
     print("\nStarting webpage image update process...\n")
     os.chdir(WORKING_DIR)
-    for script_name in SCRIPTS:
-        run_script(script_name)
+    if args.sequential:
+        for script_name in SCRIPTS:
+            run_script(script_name)
+    else:
+        failures = run_pipeline()
+        if run_step(COMPRESS_SCRIPT, []) != 0:
+            failures.append(COMPRESS_SCRIPT)
+        if failures:
+            print("\nFailed steps:")
+            for failure in failures:
+                print(f"  - {failure}")
+            if not args.watch:
+                sys.exit(1)
     print("\nAll webpage images updated successfully.\n")
+    if args.watch:
+        watch()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,55 @@
+// js/JSON/iconSprite.js
+// Generated by PythonFiles/Image-Optimizer.py; do not edit by hand.
+// Icon sprite sheets and the 1x coordinates of every icon in them.
+const ICON_SPRITE = {
+  "fallback": "images/icons/optimized/sprite/icons.png",
+  "sheets": [
+    {"src": "images/icons/optimized/sprite/icons.webp", "scale": 1, "type": "image/webp"},
+    {"src": "images/icons/optimized/sprite/icons@2x.webp", "scale": 2, "type": "image/webp"},
+    {"src": "images/icons/optimized/sprite/icons.png", "scale": 1, "type": "image/png"},
+    {"src": "images/icons/optimized/sprite/icons@2x.png", "scale": 2, "type": "image/png"},
+  ],
+  "width": 362,
+  "height": 314,
+  "icons": {
+    "3D_Design.png": {"x": 208, "y": 0, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "66.6667% 0.0%"},
+    "Azurecloud.png": {"x": 260, "y": 0, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "83.3333% 0.0%"},
+    "CV.png": {"x": 52, "y": 0, "w": 50, "h": 54, "size": "724.0% 581.4815%", "position": "16.6667% 0.0%"},
+    "CollabTest.png": {"x": 312, "y": 0, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "100.0% 0.0%"},
+    "CoverLetter.png": {"x": 52, "y": 217, "w": 50, "h": 49, "size": "724.0% 640.8163%", "position": "16.6667% 81.8868%"},
+    "Galaga.png": {"x": 52, "y": 269, "w": 50, "h": 44, "size": "724.0% 713.6364%", "position": "16.6667% 99.6296%"},
+    "Office365.png": {"x": 0, "y": 61, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "0.0% 23.1061%"},
+    "Pacman.png": {"x": 52, "y": 61, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "16.6667% 23.1061%"},
+    "SharePoint.png": {"x": 260, "y": 217, "w": 50, "h": 45, "size": "724.0% 697.7778%", "position": "83.3333% 80.6691%"},
+    "SketchFabIcon.png": {"x": 104, "y": 61, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "33.3333% 23.1061%"},
+    "SketchupIcon.png": {"x": 104, "y": 0, "w": 50, "h": 53, "size": "724.0% 592.4528%", "position": "33.3333% 0.0%"},
+    "Webpage.PNG": {"x": 156, "y": 269, "w": 50, "h": 40, "size": "724.0% 785.0%", "position": "50.0% 98.1752%"},
+    "automation.png": {"x": 104, "y": 217, "w": 50, "h": 49, "size": "724.0% 640.8163%", "position": "33.3333% 81.8868%"},
+    "cert.png": {"x": 156, "y": 61, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "50.0% 23.1061%"},
+    "cloud.png": {"x": 208, "y": 61, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "66.6667% 23.1061%"},
+    "debugging.png": {"x": 260, "y": 61, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "83.3333% 23.1061%"},
+    "degree.png": {"x": 312, "y": 61, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "100.0% 23.1061%"},
+    "githubBlack.png": {"x": 0, "y": 113, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "0.0% 42.803%"},
+    "gpsIntegration.png": {"x": 52, "y": 113, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "16.6667% 42.803%"},
+    "gps_tracking.png": {"x": 104, "y": 113, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "33.3333% 42.803%"},
+    "libvrt.png": {"x": 156, "y": 113, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "50.0% 42.803%"},
+    "linkedin.png": {"x": 208, "y": 113, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "66.6667% 42.803%"},
+    "linux.png": {"x": 0, "y": 0, "w": 50, "h": 59, "size": "724.0% 532.2034%", "position": "0.0% 0.0%"},
+    "network.png": {"x": 260, "y": 113, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "83.3333% 42.803%"},
+    "permissions.png": {"x": 312, "y": 113, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "100.0% 42.803%"},
+    "powerShell.png": {"x": 156, "y": 0, "w": 50, "h": 52, "size": "724.0% 603.8462%", "position": "50.0% 0.0%"},
+    "problem-solving.png": {"x": 0, "y": 165, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "0.0% 62.5%"},
+    "programing.png": {"x": 52, "y": 165, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "16.6667% 62.5%"},
+    "python.png": {"x": 104, "y": 165, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "33.3333% 62.5%"},
+    "qemu.png": {"x": 312, "y": 217, "w": 50, "h": 45, "size": "724.0% 697.7778%", "position": "100.0% 80.6691%"},
+    "repair.png": {"x": 156, "y": 165, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "50.0% 62.5%"},
+    "search.png": {"x": 104, "y": 269, "w": 50, "h": 44, "size": "724.0% 713.6364%", "position": "33.3333% 99.6296%"},
+    "teamwork.png": {"x": 208, "y": 165, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "66.6667% 62.5%"},
+    "tools.png": {"x": 0, "y": 269, "w": 50, "h": 45, "size": "724.0% 697.7778%", "position": "0.0% 100.0%"},
+    "ubuntu.png": {"x": 156, "y": 217, "w": 50, "h": 48, "size": "724.0% 654.1667%", "position": "50.0% 81.5789%"},
+    "user_experience.png": {"x": 260, "y": 165, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "83.3333% 62.5%"},
+    "virtual.png": {"x": 312, "y": 165, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "100.0% 62.5%"},
+    "woodwork.png": {"x": 0, "y": 217, "w": 50, "h": 50, "size": "724.0% 628.0%", "position": "0.0% 82.197%"},
+    "zip.png": {"x": 208, "y": 217, "w": 50, "h": 48, "size": "724.0% 654.1667%", "position": "66.6667% 81.5789%"},
+  }
+};
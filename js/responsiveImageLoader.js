@@ -1,3 +1,36 @@
+// Intrinsic sizes, placeholders and built formats written by Image-Optimizer.py
+// (projects/js/JSON/imageManifest.js); pages without the manifest still work,
+// just without reserved space or modern formats
+const RESPONSIVE_IMAGE_MANIFEST = typeof IMAGE_MANIFEST !== "undefined" ? IMAGE_MANIFEST : {};
+
+// Per-image widths chosen by Image-Optimizer.py (projects/js/JSON/srcsetManifest.js);
+// images missing from it fall back to the fixed device breakpoints below
+const RESPONSIVE_SRCSETS = typeof SRCSET_MANIFEST !== "undefined" ? SRCSET_MANIFEST : {};
+
+// Content-hashed names written by Image-Optimizer.py (projects/js/JSON/imageFingerprints.js)
+// while fingerprinting is on; URLs missing from it are used unchanged
+const RESPONSIVE_FINGERPRINTS = typeof IMAGE_FINGERPRINTS !== "undefined" ? IMAGE_FINGERPRINTS : {};
+
+// Return the fingerprinted URL of an optimized image, if it has one
+function responsiveImageUrl(url) {
+  return RESPONSIVE_FINGERPRINTS[url] || url;
+}
+
+// Rendered width of a responsive image (picture.zoomable is 90% wide), for srcset selection
+const RESPONSIVE_IMAGE_SIZES = "90vw";
+
+// Widest candidate of a srcset string, used as the plain src fallback
+function widestCandidate(srcset) {
+  return srcset.split(",").pop().trim().split(/\s+/)[0];
+}
+
+// Fetch the zoom variant into the cache once, ahead of openFullScreen()
+function warmZoomImage(img) {
+  if (img.dataset.zoomWarmed) return;
+  img.dataset.zoomWarmed = "true";
+  new Image().src = img.dataset.full;
+}
+
 document.addEventListener("DOMContentLoaded", () => {
   // Loop through all elements marked for responsive image replacement
   document.querySelectorAll('.responsive-image').forEach(container => {
@@ -7,8 +40,7 @@ document.addEventListener("DOMContentLoaded", () => {
 
     if (!fileName) return; // Skip if no image name is provided
 
-    const baseName = fileName.split('.')[0];       // Get filename without extension
-    const ext = fileName.split('.').pop();         // Get file extension
+    const baseName = fileName.replace(/\.[^.]+$/, ""); // Get filename without extension
 
     // Create a <picture> element with a zoomable class and click handler
     const picture = document.createElement("picture");
@@ -22,19 +54,70 @@ document.addEventListener("DOMContentLoaded", () => {
       { media: "(min-width: 480px)",  folder: "mobile" }
     ];
 
-    // Create <source> elements for each responsive image size
-    breakpoints.forEach(bp => {
+    // Modern encodings the manifest lists as built for this image, in order of
+    // preference; the browser picks the first type it supports
+    const info = RESPONSIVE_IMAGE_MANIFEST[fileName];
+    const builtFormats = info?.formats || [];
+    const modernFormats = [
+      { ext: "avif", type: "image/avif" },
+      { ext: "webp", type: "image/webp" }
+    ].filter(fmt => builtFormats.includes(fmt.ext));
+
+    // Images with adaptive widths get one srcset per format and let the
+    // browser pick the width; the rest get one <source> per fixed breakpoint
+    const srcsets = RESPONSIVE_SRCSETS[fileName]?.srcset;
+    const fileExt = fileName.split(".").pop().toLowerCase();
+    if (srcsets) {
+      modernFormats.forEach(fmt => {
+        if (!srcsets[fmt.ext]) return;
+        const source = document.createElement("source");
+        source.setAttribute("type", fmt.type);
+        source.setAttribute("srcset", srcsets[fmt.ext]);
+        source.setAttribute("sizes", RESPONSIVE_IMAGE_SIZES);
+        picture.appendChild(source);
+      });
+    }
+
+    // Create <source> elements for each responsive image size,
+    // modern formats first and the original format as the fallback
+    (srcsets ? [] : breakpoints).forEach(bp => {
+      modernFormats.forEach(fmt => {
+        const source = document.createElement("source");
+        source.setAttribute("media", bp.media);
+        source.setAttribute("type", fmt.type);
+        source.setAttribute("srcset", responsiveImageUrl(`images/main/optimized/${bp.folder}/standard/${baseName}.${fmt.ext}`));
+        picture.appendChild(source);
+      });
+
       const source = document.createElement("source");
       source.setAttribute("media", bp.media);
-      source.setAttribute("srcset", `images/main/optimized/${bp.folder}/standard/${fileName}`);
+      source.setAttribute("srcset", responsiveImageUrl(`images/main/optimized/${bp.folder}/standard/${fileName}`));
       picture.appendChild(source);
     });
 
-    // Create the default <img> element
+    // Create the default <img> element, lazy-loaded below the fold
+    // (images with adaptive widths have no fixed standard variants)
     const img = document.createElement("img");
-    img.src = `images/main/optimized/desktop/standard/${fileName}`;
+    if (srcsets?.[fileExt]) {
+      img.src = widestCandidate(srcsets[fileExt]);
+      img.srcset = srcsets[fileExt];
+      img.sizes = RESPONSIVE_IMAGE_SIZES;
+    } else {
+      img.src = responsiveImageUrl(`images/main/optimized/desktop/standard/${fileName}`);
+    }
     img.alt = altText;
     img.className = imgClass;
+    img.loading = "lazy";
+    img.decoding = "async";
+
+    // Reserve layout space and show the blurred placeholder until the image arrives
+    if (info) {
+      img.width = info.width;
+      img.height = info.height;
+      img.style.backgroundImage = `url("${info.placeholder}")`;
+      img.style.backgroundSize = "cover";
+      img.addEventListener("load", () => { img.style.backgroundImage = ""; }, { once: true });
+    }
 
     // Determine appropriate zoom image folder based on current screen width
     const screenWidth = Math.max(
@@ -49,16 +132,13 @@ document.addEventListener("DOMContentLoaded", () => {
       zoomFolder = "laptop";
     }
 
-    // Set zoom image path for full-screen viewing
-    img.setAttribute("data-full", `images/main/optimized/${zoomFolder}/zoom/${fileName}`);
+    // Set zoom image path for full-screen viewing; it is only fetched once the
+    // user shows intent (hover, focus, touch) or openFullScreen() loads it
+    img.setAttribute("data-full", responsiveImageUrl(`images/main/optimized/${zoomFolder}/zoom/${fileName}`));
     img.addEventListener("click", () => openFullScreen(img));
-
-    // Preload the zoomed version of the image for smoother experience
-    const preloadZoom = document.createElement("link");
-    preloadZoom.rel = "preload";
-    preloadZoom.as = "image";
-    preloadZoom.href = `images/main/optimized/${zoomFolder}/zoom/${fileName}`;
-    document.head.appendChild(preloadZoom);
+    ["pointerenter", "focusin", "touchstart"].forEach(type => {
+      picture.addEventListener(type, () => warmZoomImage(img), { once: true, passive: true });
+    });
 
     // Final assembly: add image to <picture> and replace original container
     picture.appendChild(img);
@@ -1,5 +1,32 @@
 // js/skillsLoader.js
 
+// Build a sprite-backed icon from ICON_SPRITE (js/JSON/iconSprite.js), or null
+// when the page has no sprite map or the icon is not in the sheet
+function createSpriteIcon(src, alt, className, pathPrefix) {
+  if (typeof ICON_SPRITE === "undefined") return null;
+  const cell = ICON_SPRITE.icons[src.split("/").pop()];
+  if (!cell) return null;
+
+  const icon = document.createElement("span");
+  icon.className = className;
+  icon.setAttribute("role", "img");
+  icon.setAttribute("aria-label", alt);
+  icon.style.aspectRatio = `${cell.w} / ${cell.h}`;
+
+  // Percent size/position keep the cell aligned at any displayed size
+  const sprite = document.createElement("span");
+  sprite.className = "sprite-icon";
+  sprite.style.backgroundImage = `url("${pathPrefix}${ICON_SPRITE.fallback}")`;
+  sprite.style.backgroundImage = "image-set(" + ICON_SPRITE.sheets
+    .map(s => `url("${pathPrefix}${s.src}") ${s.scale}x type("${s.type}")`)
+    .join(", ") + ")";
+  sprite.style.backgroundSize = cell.size;
+  sprite.style.backgroundPosition = cell.position;
+
+  icon.appendChild(sprite);
+  return icon;
+}
+
 // Wait for the DOM to fully load
 document.addEventListener("DOMContentLoaded", () => {
   // Ensure ICON_REGISTRY is available (defined in iconRegistry.js)
@@ -36,10 +63,14 @@ document.addEventListener("DOMContentLoaded", () => {
       const item = document.createElement("div");
       item.className = "icon-item";
 
-      const img = document.createElement("img");
-      img.className = "li-icon";
-      img.src = icon.src;
-      img.alt = icon.alt;
+      // Prefer the sprite sheet on pages that load it (full skills grids)
+      let img = createSpriteIcon(icon.src, icon.alt, "li-icon", ICON_PATH_PREFIX);
+      if (!img) {
+        img = document.createElement("img");
+        img.className = "li-icon";
+        img.src = icon.src;
+        img.alt = icon.alt;
+      }
 
       const span = document.createElement("span");
       span.textContent = icon.label;
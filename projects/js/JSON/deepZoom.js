@@ -0,0 +1,7 @@
+// projects/js/JSON/deepZoom.js
+// Generated by PythonFiles/Image-Optimizer.py; do not edit by hand.
+// Deep zoom tile pyramid (DZI layout) for each image too wide for one zoom file.
+const DEEP_ZOOM = {
+  "DebianConstantsFlow.png": {"tiles": "images/main/optimized/tiles/DebianConstantsFlow_files/", "width": 4067, "height": 336, "tileSize": 256, "overlap": 1, "format": "webp"},
+  "DebianStateMachineFlow.png": {"tiles": "images/main/optimized/tiles/DebianStateMachineFlow_files/", "width": 4133, "height": 336, "tileSize": 256, "overlap": 1, "format": "webp"},
+};
@@ -0,0 +1,5 @@
+// projects/js/JSON/imageFingerprints.js
+// Generated by PythonFiles/Image-Optimizer.py; do not edit by hand.
+// Content-hashed URL for each optimized image (empty while fingerprinting is off).
+const IMAGE_FINGERPRINTS = {
+};
@@ -0,0 +1,156 @@
+// projects/js/JSON/imageManifest.js
+// Generated by PythonFiles/Image-Optimizer.py; do not edit by hand.
+// Intrinsic size, inline placeholder and built extra formats for each responsive image.
+const IMAGE_MANIFEST = {
+  "Arcade-Cabinet1.png": {"width": 498, "height": 592, "placeholder": "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAADwAQCdASoNABAAA4BaJYwCw7EQUH2Y7iAA/rhdlxOKIBDl0OeZG6snig+z65I2uaF4yNRTsEcoqNGDozCAbLzJ2IwCFgqF+N+JF1OCqqTXoJjayuiHx3ihD8PP5HXNWAiPRpRKAAA=", "formats": ["avif", "webp"]},
+  "Arcade-Cabinet2.png": {"width": 498, "height": 592, "placeholder": "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAAAwAgCdASoNABAAA4BaJQBYdsXI326MzfhPAAD+9nZ0nnu9PklO5hJznnsaj4iZztNwQvylnYbUyDp9oSUHKvE3qavTYMND33ByXcMvqtPLpM4RF0XpUG7eU7TGGU/skgRjlQAA", "formats": ["avif", "webp"]},
+  "ArcadeCabinetSketchUp1.png": {"width": 514, "height": 577, "placeholder": "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAADwAQCdASoOABAAA4BaJZQAAvoWWoI9cAAA/sqz/Fv/f9L502G0XQjSdG4PtY5Q4lT9vqv4sY6S+87M/GtABwadkycVGtWgv6gS93h/b7movRju0MPe6kx7AAA=", "formats": ["avif", "webp"]},
+  "ArcadeCabinetSketchUp2.png": {"width": 568, "height": 551, "placeholder": "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAAAwAgCdASoQABAAA4BaJZwAAusU5cDqHD2MAAD+8/zgEszUZBarSGedGBPPRkRGRxz8hE15UhNDMLMcY5/aq+8BbfX2SUfDRhakc3dCrRe3T92V1nkfKpvVDDNhzX5wAAA=", "formats": ["avif", "webp"]},
+  "ArcadeCabinetSketchUp3.png": {"width": 581, "height": 783, "placeholder": "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAAAQAgCdASoMABAAA4BaJaQAAvrepfuG/6cAAP0D5FPN/rxDQaf0h64D87NZJvde1cldaOAVMVRX9JEAxL1/icdtf+4gwdx6grSaxPhBegyqRUf+M95TNx8yqKu0ETduqZtAAA==", "formats": ["avif", "webp"]},
+  "AutomationTools.png": {"width": 1024, "height": 1024, "placeholder": "data:image/webp;base64,UklGRowAAABXRUJQVlA4IIAAAABwAgCdASoQABAAA4BaJQBOj+AQVBl1FjIZA6EAAP71Wb2TdRT6t5ixb0FG53EvH0wZL9Q0nfDUYNIVaswRjlmLesi2Eu44efzAgTj+mBi7z2eEphPSYTHniSGKfTQI1hcaJxqVE/ZLNQgBxCmpW5RXZaoSAUd7cAfhLf4L8CHgAA==", "formats": ["avif", "webp"]},
+  "AutomationToolsConfigLink.png": {"width": 830, "height": 614, "placeholder": "data:image/webp;base64,UklGRigAAABXRUJQVlA4IBwAAABQAQCdASoQAAwAA4BaJZwABDOAAP7w2n9KQAAA", "formats": ["avif", "webp"]},
+  "AutomationToolsConstantsFlow.png": {"width": 3568, "height": 336, "placeholder": "data:image/webp;base64,UklGRmgAAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSA0AAAABD3Dl74gIsYAR/Q8FAFZQOCA0AAAA8AEAnQEqEAACAAOAWiWgAnS6AAIzUFAAAP6zRv8c8Fmk2VQzxPjL/wfUa2Nczw2qsloAAA==", "formats": ["avif", "webp"]},
+  "AutomationToolsGeneralFlow.png": {"width": 2639, "height": 336, "placeholder": "data:image/webp;base64,UklGRnwAAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSBgAAAABFyAWTPzV9kWURkSEhkAghW1+RP8jjgFWUDggPgAAAJACAJ0BKhAAAgADgFoloAJ0ugEt/tv/dAAONN6wAP7EI+PMR/0LCJKSu/tPNnuAppYOPYeedA9GBVz8IAAA", "formats": ["avif", "webp"]},
+  "AutomationToolsPipelineFlow.png": {"width": 3069, "height": 336, "placeholder": "data:image/webp;base64,UklGRmoAAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSA0AAAABD3Dl7IgIsYAR/Q8FAFZQOCA2AAAA8AEAnQEqEAACAAOAWiWgAnS6AAIzUFAAAP7EFnTczV+wWQ49iwfX9sJHxbFIWr818QLcAAAA", "formats": ["avif", "webp"]},
+  "AutomationToolsStateMachineFlow.png": {"width": 2639, "height": 336, "placeholder": "data:image/webp;base64,UklGRnwAAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSBgAAAABFyAWTPzV9kWURkSEhkAghW1+RP8jjgFWUDggPgAAAJACAJ0BKhAAAgADgFoloAJ0ugEt/tv/dAAONN6wAP7EI+PMR/0LCJKSu/tPNnuAppYOPYeedA9GBVz8IAAA", "formats": ["avif", "webp"]},
+  "AutomationToolsStructure.png": {"width": 3136, "height": 1604, "placeholder": "data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAADQAQCdASoQAAgAA4BaJYgCdAEOum5oAAD+8/d4Y8a1ig25y0C8j6w5y7Sybpm2sILshytByBlqAP4AAAA=", "formats": ["avif", "webp"]},
+  "BackupButtons.png": {"width": 710, "height": 433, "placeholder": "data:image/webp;base64,UklGRkQAAABXRUJQVlA4IDgAAADQAQCdASoQAAoAA4BaJYwCdAEOtWZiAAD+86xjauOL8FMD905Vy+35Kyw0iRiEYEVLMkZDJNsAAA==", "formats": ["avif", "webp"]},
+  "BackupConfigFlow.png": {"width": 1660, "height": 336, "placeholder": "data:image/webp;base64,UklGRpIAAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSCEAAAABH6CQbQQ4lJmdyBsRYXEQZNv4TPI6zxyfa0T0P6rsTxUAVlA4IEoAAAAwAgCdASoQAAMAA4BaJZACdEf/7oACbsOThAD+668BrdBFhsNqqihsZsKOgS8tLz3cIzOvY3XOGtONxYq2DX0RnuJto7UfXMSwAA==", "formats": ["avif", "webp"]},
+  "BackupCoreFlow.png": {"width": 2631, "height": 336, "placeholder": "data:image/webp;base64,UklGRnwAAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSBgAAAABFyAWTPzV9kWURkSEhkAghW1+RP8jjgFWUDggPgAAALACAJ0BKhAAAgADgFoloAJ0ugEt/tv/dAAONOCMAAD+1r+LH6H1E6kBxEeyxt763pwPncs83nQPRgVc/CAA", "formats": ["avif", "webp"]},
+  "BackupFileSystemUIFlow.png": {"width": 2097, "height": 336, "placeholder": "data:image/webp;base64,UklGRo4AAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSCQAAAABJ0CQbRvMNGYxids8IuLJQKBhMQ3oIoHpn+ohIvqfDrSjDgRWUDggRAAAAFACAJ0BKhAAAwADgFoliAJ0Bign/8wNdqDkAAD+5/kv29IJKMcMFSCmWZvJOuKpo1q2oBJ4P31em39WbibaO0WPgAAA", "formats": ["avif", "webp"]},
+  "BackupLaunch.png": {"width": 705, "height": 973, "placeholder": "data:image/webp;base64,UklGRj4AAABXRUJQVlA4IDIAAACwAQCdASoMABAAA4BaJaQAAudGNAwAAP7zgEwogNtx9n4gZVEHoUJ9UewGY6z7ZlgAAA==", "formats": ["avif", "webp"]},
+  "BackupLogOutput.png": {"width": 780, "height": 460, "placeholder": "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAACwAQCdASoQAAkAA4BaJaQAAvh2kWNAAP7yUNkU+UstqGHa3XcwAAAA", "formats": ["avif", "webp"]},
+  "BackupMainPS1Flow.png": {"width": 2604, "height": 336, "placeholder": "data:image/webp;base64,UklGRnIAAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSA0AAAABD3Bl6IgIsYAR/Q8FAFZQOCA+AAAAkAIAnQEqEAACAAOAWiWgAnS6AS3+2/90AA403rAA/ta/ixUoKvhheli1nVrFz4xsSnLxHQ/YS8sNiYbEAAA=", "formats": ["avif", "webp"]},
+  "BackupModeRobocopy.png": {"width": 633, "height": 318, "placeholder": "data:image/webp;base64,UklGRigAAABXRUJQVlA4IBwAAAAwAQCdASoQAAgAA4BaJZwAA3AA/vITJgB8AAAA", "formats": ["avif", "webp"]},
+  "BackupModeZip.png": {"width": 670, "height": 372, "placeholder": "data:image/webp;base64,UklGRigAAABXRUJQVlA4IBwAAAAwAQCdASoQAAkAA4BaJaQAA3AA/vKchsIqegAA", "formats": ["avif", "webp"]},
+  "BackupSchedule.png": {"width": 706, "height": 375, "placeholder": "data:image/webp;base64,UklGRj4AAABXRUJQVlA4IDIAAACQAQCdASoQAAkAA4BaJZwAAuaL4MgA/vYLEC3sQLjaZSDYnSjpBcVL8VNWvG5/4yGgAA==", "formats": ["avif", "webp"]},
+  "BackupSourceDest.png": {"width": 708, "height": 709, "placeholder": "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAADQAQCdASoQABAAA4BaJaQAAp27Ky71gAD+84MdbBAZdaQy4Czsa7mfjFWOQFB+3x2vCg/0AAA=", "formats": ["avif", "webp"]},
+  "BackupStructure.png": {"width": 3136, "height": 1328, "placeholder": "data:image/webp;base64,UklGRj4AAABXRUJQVlA4IDIAAADQAQCdASoQAAcAA4BaJQBOgCHf5cFd4AD+8jvNyOveNyjYFEN2oryJDBzib6IZPt/4AA==", "formats": ["avif", "webp"]},
+  "BackupUIFlow.png": {"width": 2601, "height": 336, "placeholder": "data:image/webp;base64,UklGRnQAAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSA0AAAABD3Bl6IgIsYAR/Q8FAFZQOCBAAAAAcAIAnQEqEAACAAOAWiWgAnRtf7b/3QADjTgEAAD+07llCo18NuO7KgaHDIipvGOOyKuNsPejsJqmobrTXhAAAA==", "formats": ["avif", "webp"]},
+  "ChineseTranslatorStructure.png": {"width": 3136, "height": 836, "placeholder": "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAACwAQCdASoQAAQAA4BaJQBOgCHe8Uv4AP7vvarqhx8EbKKLA55YgAAA", "formats": ["avif", "webp"]},
+  "DataAnalysisFlow.png": {"width": 3099, "height": 336, "placeholder": "data:image/webp;base64,UklGRmgAAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSA0AAAABD3Dl7IgIsYAR/Q8FAFZQOCA0AAAA8AEAnQEqEAACAAOAWiWgAnS6AAK6fJRAAP7EFnTczV+s8U/Fojnayd8WGhOZ+u8WkpAAAA==", "formats": ["avif", "webp"]},
+  "DataAnalysisStructure.png": {"width": 3136, "height": 1476, "placeholder": "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAADQAQCdASoQAAgAA4BaJQBdgCFnjen+CAD++LMNpdQRNzdAjQwJIPMInAEkABM1D6RcUYAA", "formats": ["avif", "webp"]},
+  "DataAnalysisTool.png": {"width": 1350, "height": 899, "placeholder": "data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAABQAgCdASoQAAsAA4BaJbACdAdwB6X11Dc9AAAA/vCzjskFSyTeP1hEA1fL/Y5CcFUHXOYvtYeYhTrxlD3/l8yGb1RGM+FxGsXemm2tjXNZfbudhoLw7f3/6+mHrA7HSfzbIQBbIm7gDyREAAA=", "formats": ["avif", "webp"]},
+  "DataAnalysisToolDataEntryPage.png": {"width": 1212, "height": 841, "placeholder": "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAABwAQCdASoQAAsAA4BaJYwCw7FAAAD+83v+q6hIPyxjkbJTTtxN33HyAAA=", "formats": ["avif", "webp"]},
+  "DataAnalysisToolDatabaseSettingsPage.png": {"width": 1148, "height": 790, "placeholder": "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAADwAQCdASoQAAsAA4BaJQBOgCHfcTCQDoAA/ve8XeIzBgCBwuuy20Xgzo8/Q2+pF/CdM6IHs1ah4cszg6dKlM89j+AZgAAA", "formats": ["avif", "webp"]},
+  "DataAnalysisToolRelationshipsPage.png": {"width": 1148, "height": 723, "placeholder": "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAAAQAgCdASoQAAoAA4BaJYwCdAEQUO8DNx0AAP73fGwgnbqoNDw/Fmle4d55sk4gAAA=", "formats": ["avif", "webp"]},
+  "DataAnalysisToolSummarySettingsPage.png": {"width": 1148, "height": 723, "placeholder": "data:image/webp;base64,UklGRj4AAABXRUJQVlA4IDIAAADQAQCdASoQAAoAA4BaJQBOgCIKDAZkAAD+94DO5p2Tdg0HPm2UJaFHaidfHYUUtMZAAA==", "formats": ["avif", "webp"]},
+  "DataAnalysisToolSummaryTablePage.png": {"width": 1881, "height": 658, "placeholder": "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAADwAQCdASoQAAYAA4BaJYgCdAEPAUJCOwAA/vaGPFC6GwSbLZE/m1rTgAA=", "formats": ["avif", "webp"]},
+  "Debian-SetupSuite.png": {"width": 1024, "height": 1024, "placeholder": "data:image/webp;base64,UklGRooAAABXRUJQVlA4IH4AAACwAgCdASoQABAAA4BaJagCsH8GJ/i2CdxP3hxA5uAA/vP3RVV05Nhz8w0gUWu8/NodP28QKWqf7R4h5JKsrK8Wu1WKj89q7u7CkjBB9eID8MY+LhUl1AXYLfAmLbHbSoVopfBVfjO0QNW7JtCx+xfRwDUvwPrENOLnLN+gAAA=", "formats": ["avif", "webp"]},
+  "DebianConstantsFlow.png": {"width": 4067, "height": 336, "placeholder": "data:image/webp;base64,UklGRmIAAABXRUJQVlA4WAoAAAAQAAAADwAAAAAAQUxQSA0AAAABD3Bj8ogIsYAR/Q8BAFZQOCAuAAAAEAIAnQEqEAABAAOAWiWgAnS6AAK6gBh7AAD+r60RDOWBp9uVoSWfNfEC3AAAAA==", "formats": ["avif", "webp"]},
+  "DebianEditAppConfig.png": {"width": 593, "height": 607, "placeholder": "data:image/webp;base64,UklGRjIAAABXRUJQVlA4ICYAAAAwAQCdASoQABAAA4BaJaQAA3AA/vDKSjOb+HcjzxUtHmmSqXIAAA==", "formats": ["avif", "webp"]},
+  "DebianGeneralFlow.png": {"width": 2637, "height": 336, "placeholder": "data:image/webp;base64,UklGRnIAAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSA0AAAABD3Dl6IgIsYAR/Q8FAFZQOCA+AAAAMAIAnQEqEAACAAOAWiWgAnS6AMr/AslNkwAA/sQjnTCI89VJriGcAaggKYni+Vvgwsbtpsi4/rvFpKQAAAA=", "formats": ["avif", "webp"]},
+  "DebianStateMachineFlow.png": {"width": 4133, "height": 336, "placeholder": "data:image/webp;base64,UklGRmQAAABXRUJQVlA4WAoAAAAQAAAADwAAAAAAQUxQSA0AAAABD3Dj8ogIsYAR/Q8BAFZQOCAwAAAA8AEAnQEqEAABAAOAWiWgAnS6AAIzUFAAAP6vrRFMPgFzpbPKzxYa/ik818QLcAAA", "formats": ["avif", "webp"]},
+  "DebianSuiteStructure.png": {"width": 3136, "height": 564, "placeholder": "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAABQAQCdASoQAAMAA4BaJQBOgCgAAP7wLer8PmA+vbn1pFbKAYuUMAAA", "formats": ["avif", "webp"]},
+  "FactorAnalysisWeb.png": {"width": 1233, "height": 606, "placeholder": "data:image/webp;base64,UklGRj4AAABXRUJQVlA4IDIAAACwAQCdASoQAAgAA4BaJZwAAudNbjr4AP70/d1xQironEBJTa/cRVQlh28DBhgZkwR4AA==", "formats": ["avif", "webp"]},
+  "FactorInput.png": {"width": 1300, "height": 300, "placeholder": "data:image/webp;base64,UklGRjoAAABXRUJQVlA4IC4AAADQAQCdASoQAAQAA4BaJZQAAtz3bqLQAAD+7bO7w3YEL/tK58NLQSuHwJ/005AA", "formats": ["avif", "webp"]},
+  "GenerateFlowchartFlow.png": {"width": 2072, "height": 336, "placeholder": "data:image/webp;base64,UklGRoYAAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSB4AAAABHyAQIGMdNlSIERGxBIIAEorMjnez14jof0TZ3yhWUDggQgAAABACAJ0BKhAAAwADgFoliAJ0Bif5gazb3AAA/uf5L9vSF9z1jDWFUQIkm8POQ9lOEjOHoPd/wzaH+VyrcqFmN8vAAA==", "formats": ["avif", "webp"]},
+  "GenerateSiteDiagramsFlow.png": {"width": 2620, "height": 336, "placeholder": "data:image/webp;base64,UklGRnIAAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSA0AAAABD3Bl6IgIsYAR/Q8FAFZQOCA+AAAAcAIAnQEqEAACAAOAWiWgAnRtf7b/3QADjTgEAAD+1r+LH6Ae4EK/XG7kcwyg8Y47Iq42w96OwmtLZ5QGAAA=", "formats": ["avif", "webp"]},
+  "Glossary.png": {"width": 1067, "height": 559, "placeholder": "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAAAQAgCdASoQAAgAA4BaJYgCdEf/geiemMBIAP5ojqyvf7esw+twkXdS+2jvasu0BNpGsomfFax6WQB2xHZMZHAA", "formats": ["avif", "webp"]},
+  "GreenhousePlanterBox1.png": {"width": 309, "height": 409, "placeholder": "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAACwAQCdASoMABAAA4BaJQBOgBttqC6AAP6wtMoTsUo8aOVykGA6Qu+vw8pXfmk0HvjLUHRsiVMkKN/Z5Vr0eWOiviNQGAnwAAA=", "formats": ["avif", "webp"]},
+  "GreenhousePlanterBox2.png": {"width": 309, "height": 409, "placeholder": "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAAAQAgCdASoMABAAA4BaJZAAAsaLsc958b4AAOHoOzfrtUsOrOk9jd15wzYovHk0VIJ7liRvn/EWdnW/0vaInVWuuDZDkwS7c1HDCenmEbAJAAAA", "formats": ["avif", "webp"]},
+  "GreenhousePlanterBox3.png": {"width": 309, "height": 409, "placeholder": "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAAAwAgCdASoMABAAA4BaJZAC7AEUN88j6bcAAAD+xdcxRjKmJ0xgym1WD1uN/SMj9Iz3sKq49RLgC/2usm56IhJe/vIOTREeBhgzhxHgAAA=", "formats": ["avif", "webp"]},
+  "GreenhousePlanterBox4.png": {"width": 868, "height": 655, "placeholder": "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAACwAQCdASoQAAwAA4BaJZgAAcXdQnvgAP6U0Xf5jKG10g46cWOErCGc1adXxUVZ5E1IWGhOhtObkkXN+Zur3zBLBx2cuFb/BioY6DNzMsAAAA==", "formats": ["avif", "webp"]},
+  "GreenhousePlanterBoxesSketchUp1.png": {"width": 878, "height": 425, "placeholder": "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAAAQAgCdASoQAAgAA4BaJYwCdAD2BiV88zzAAP4LSmgQokO+W/LbX+34JlaX0zQvQFQoFua2jvtapFfFQQKMxRtR4MzqgLxaZiNoimAspQOsKUpLwAA=", "formats": ["avif", "webp"]},
+  "GreenhousePlanterBoxesSketchUp2.png": {"width": 897, "height": 379, "placeholder": "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAAAwAgCdASoQAAcAA4BaJZQCdAYtBbSueGK8AAD+t7foCg3e4Z64HT0ePP/9n/oC4zmSQytXvfuE+sCMgMMFlR5yylyWnCnTZxT/kAAA", "formats": ["avif", "webp"]},
+  "GreenhousePlanterBoxesSketchUp3.png": {"width": 877, "height": 464, "placeholder": "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAAAwAgCdASoQAAgAA4BaJZQCdAYrd2woZH4MGAD+8nOTAUvPs88pMNv8tTnpc2tbwPtb0Q1MGZdGhJvj0OA1Tll8kQOR3IWt1E40KyfBS+LFJRrm4EWQAA==", "formats": ["avif", "webp"]},
+  "GreenhousePlanterBoxesSketchUp4.png": {"width": 877, "height": 384, "placeholder": "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAADwAQCdASoQAAcAA4BaJZQCdAEfbCRJ0QAA/psfUSpObqudY2fMyoDROr9ubwoI68jbOzx78cZ2X7c23kiF6WMWOnS9K9uPdQ+KEAAA", "formats": ["avif", "webp"]},
+  "GroupAnalysisWeb.png": {"width": 1701, "height": 768, "placeholder": "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAAAQAgCdASoQAAcAA4BaJYwCxC8AGBrqYMLAAP71BVq2zcskHcUf6w7mWPVUd4FaaqffFCk4RVWaDRXGUyJ3ZIAA", "formats": ["avif", "webp"]},
+  "GroupingsWeb.png": {"width": 1249, "height": 515, "placeholder": "data:image/webp;base64,UklGRjoAAABXRUJQVlA4IC4AAADwAQCdASoQAAcAA4BaJZQCdAEPDIReUuAA/vHrpEyhzyug4PJr4UQBgIARwcAA", "formats": ["avif", "webp"]},
+  "ImageOptimizerFlow.png": {"width": 2083, "height": 336, "placeholder": "data:image/webp;base64,UklGRooAAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSCQAAAABL0CQbRvMMIYxiss8IuIkA4GGxaYJHTShf5mHiOh/OtCOOhBWUDggQAAAANABAJ0BKhAAAwADgFoliAJ0AQ7+A44AAP7oZUtFCcxy/HXtukvll8WV7FKrD3Rs4P2f7ueofG6LLvJ+5SWQAAA=", "formats": ["avif", "webp"]},
+  "KVM-Top.drawio.png": {"width": 1383, "height": 778, "placeholder": "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAADwAQCdASoQAAkAA4BaJYwCdAD0rRkWGYAA/vPJbBD/fqVwY7XfqM8GFoW+nZfEdaX1gqBYvn8XNCDR6jJLEUCAAAA=", "formats": ["avif", "webp"]},
+  "LanguageTranslator.png": {"width": 1024, "height": 1024, "placeholder": "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAADQAQCdASoQABAAA4BaJZwAAuQE/0gAAAD+9hKLUYF+9qv0FXP3AFAua32k3EWzMZw1Xv/DgAA=", "formats": ["avif", "webp"]},
+  "LanguageTranslatorFlow.png": {"width": 2117, "height": 336, "placeholder": "data:image/webp;base64,UklGRowAAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSCUAAAABL0CQbRvMOCYxieM8IuIkA0GGiUMELZcIWv4yh4jofzrQjjoQAFZQOCBAAAAAEAIAnQEqEAADAAOAWiWIAnQGJ/mBrNvcAAD+6zCYShK3GuFD2dg+1nZx3Fay1XDprWnDxVLs5Hl3k/cpOcAAAA==", "formats": ["avif", "webp"]},
+  "LanguageTranslatorHTMLStructure.png": {"width": 2856, "height": 1712, "placeholder": "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAADQAQCdASoQAAoAA4BaJZACdAEPglYKAAD+9UiZXu7Zuwu3D0uHfyxc+05DkuqQx5yDMAY2qBNT1iWARbAAAA==", "formats": ["avif", "webp"]},
+  "NetworkScannerFlow.png": {"width": 3069, "height": 336, "placeholder": "data:image/webp;base64,UklGRmoAAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSA0AAAABD3Dl7IgIsYAR/Q8FAFZQOCA2AAAA8AEAnQEqEAACAAOAWiWgAnS6AAIzUFAAAP7EFnTczV+wWQ49iwfX9sJHxYa/ik818QLcAAAA", "formats": ["avif", "webp"]},
+  "PopulateGlossary.png": {"width": 1300, "height": 300, "placeholder": "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAADwAQCdASoQAAQAA4BaJZQCw7ELX8011AAA/uryQl7yRGPTEzxv7dGnL6HRpHf9gAA=", "formats": ["avif", "webp"]},
+  "PortfolioWebsiteProjectPage.png": {"width": 855, "height": 545, "placeholder": "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAADQAQCdASoQAAoAA4BaJYgC7AEDcFL4AAD+1+13DF7Px7U8cxMCvkEE/2QGgM2zeGsw7AvhbQ+bTVGM4cfHFpMc1zmaQAAA", "formats": ["avif", "webp"]},
+  "PowerShell-CloudBackup.png": {"width": 1536, "height": 1024, "placeholder": "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAABwAgCdASoQAAsAA4BaJbACdLoAngDeNgWH1cDgAP3bwu8Mi/ZP6RkEoEGkjHjNaoiYxkpHxGs6uOZZyNSaYDQv/oZ5v3jaNR/m3QqdX5ggbsyRcFU+MooPfGBUwg3qDVvKgAAA", "formats": ["avif", "webp"]},
+  "PromptForgeApiFlow.png": {"width": 2072, "height": 1112, "placeholder": "data:image/webp;base64,UklGRqQAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSDAAAAABJ6CQjSQ4ti/SYpzNRUT8moNCRpKYnMG9wyM8QfGn6gYR/Z8ASonI0rzSv6iMUgJWUDggTgAAABACAJ0BKhAACQADgFolkAJ0R/+B5lzSjQAA/vf/CPW6c1pFZKwYUvyHSqvGK26CnzVwjvP0tdNkshLKOGtvfcjxQId1GNAE80vqOgAAAA==", "formats": ["avif", "webp"]},
+  "PromptForgeBatch.png": {"width": 1114, "height": 707, "placeholder": "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAABwAQCdASoQAAoAA4BaJZQCdAFAAAD+8erdTzW2G/lu6H8uo6IALwAA", "formats": ["avif", "webp"]},
+  "PromptForgeFlow.png": {"width": 2571, "height": 336, "placeholder": "data:image/webp;base64,UklGRn4AAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSBoAAAABF6CQbQTIX233IZ1GRAQ7BAIpbPMj+h9xDFZQOCA+AAAAkAIAnQEqEAACAAOAWiWgAnS6AS3+2/90AA403rAA/tO5ZQqUFXwwvSxazr8BkfGNiVICJWKc6B6MCrn4QAA=", "formats": ["avif", "webp"]},
+  "PromptForgeForm.png": {"width": 1397, "height": 444, "placeholder": "data:image/webp;base64,UklGRioAAABXRUJQVlA4IB4AAABwAQCdASoQAAUAA4BaJZQCdAGIQAD+8i49RE5gAAA=", "formats": ["avif", "webp"]},
+  "PromptForgeGenerateFlow.png": {"width": 2603, "height": 336, "placeholder": "data:image/webp;base64,UklGRnwAAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSBgAAAABFyAWTPzVdmWURkSEhkAghW1+RP8jjgFWUDggPgAAAJACAJ0BKhAAAgADgFoloAJ0ugEt/tv/dAAONN6wAP7EI+QDGL3AhX643cjmGUHjGxKkBErFOdA9GBVz8IAA", "formats": ["avif", "webp"]},
+  "PromptForgeIndexStructure.png": {"width": 3136, "height": 1140, "placeholder": "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAACwAQCdASoQAAYAA4BaJYgCdADx9qVAAP71Ikg3hDKXw2Sbw46wteaARqPixVmRiiEKSAAA", "formats": ["avif", "webp"]},
+  "PromptForgePreview.png": {"width": 1114, "height": 745, "placeholder": "data:image/webp;base64,UklGRjIAAABXRUJQVlA4ICYAAACQAQCdASoQAAsAA4BaJZWM+RgAqkAA/vHztobN/idGORWUcwAAAA==", "formats": ["avif", "webp"]},
+  "PromptForgeProfileLoader.png": {"width": 1397, "height": 390, "placeholder": "data:image/webp;base64,UklGRjAAAABXRUJQVlA4ICQAAADQAQCdASoQAAUAA4BaJYwCdAEO/1HNgAD+9oKlVv7CrpLgAAA=", "formats": ["avif", "webp"]},
+  "PromptForgeProfileStructure.png": {"width": 3136, "height": 916, "placeholder": "data:image/webp;base64,UklGRjoAAABXRUJQVlA4IC4AAADQAQCdASoQAAUAA4BaJQBOgCICooxySAD+8jo0fPwxC4G9KzRn8iE0GEACBMAA", "formats": ["avif", "webp"]},
+  "Quiz-web.png": {"width": 470, "height": 467, "placeholder": "data:image/webp;base64,UklGRqIAAABXRUJQVlA4IJYAAAAQAwCdASoQABAAA4BaJbACdLoAs5LqAOeqIKYrmwyLgYAA/vCvvro4SOQixbe3JotKQoOv4bDTUqKJdHANR2TXj8cqsICMqZtZ8qrMZgw/yu96+7HbF3xPFP6taBWRbLRMab9AskYt0X3BiQWC/fU17/I4VRspuefENLFIkv4FQ5oRroqyzobvBfn71pJte45bwrUIAAA=", "formats": ["avif", "webp"]},
+  "QuizCleanFlow.png": {"width": 2749, "height": 353, "placeholder": "data:image/webp;base64,UklGRnAAAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSBMAAAABD0CQbeMvt+2ni4jgWMCI/ocCAFZQOCA2AAAAsAEAnQEqEAACAAOAWiWYAnQAxig2AAD+07kb85TQQw5OHh7LDI8jxDBzZ3CDP4f69Utcm4AA", "formats": ["avif", "webp"]},
+  "QuizCreatorScreenShot-Excel.png": {"width": 1172, "height": 289, "placeholder": "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAADwAQCdASoQAAQAA4BaJZQCdH8AGBLwduAA/vIWu/QRkChr9m3T9288bzDeI7+AAAA=", "formats": ["avif", "webp"]},
+  "QuizCreatorScreenShot-QuizExcelSheetDefine.png": {"width": 884, "height": 882, "placeholder": "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAABwAQCdASoQABAAA4BaJZACdAFAAAD+8WSfPDyMuCKvV6Mrqo7U12AA", "formats": ["avif", "webp"]},
+  "QuizCreatorScreenShot-QuizIndex.png": {"width": 891, "height": 388, "placeholder": "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAAAwAgCdASoQAAcAA4BaJbACdFkAAbQBY7f7AAD+8Epewoh1AHfEnYVOMFmu9Rm6CgPpzD2YESits6qzw7HaStYpY0G8ojqEzQAAAA==", "formats": ["avif", "webp"]},
+  "QuizCreatorScreenShot-QuizPostAns.png": {"width": 852, "height": 480, "placeholder": "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAADQAQCdASoQAAkAA4BaJbACdAEO+M2yYAD+646VqqOSYPVrKTYqOjYo27Ul20OTOH/bfZ9/K9IfE4H3fszEQP99M+1pEgAA", "formats": ["avif", "webp"]},
+  "QuizCreatorScreenShot-QuizRedsults.png": {"width": 835, "height": 545, "placeholder": "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAADwAQCdASoQAAoAA4BaJagCdAEOwWEU4IQA/ge2eC5Xib44LLvVvju81XZzXjfh49Yfuc8mrhMsAToM1oeg/k5M/k3zPQfycmfyXS5nF+AAAA==", "formats": ["avif", "webp"]},
+  "QuizCreatorStructure.png": {"width": 3136, "height": 1328, "placeholder": "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAACwAQCdASoQAAcAA4BaJQBOgCHe7oHYAP7wNTJYaGlchuE9ftD6JYu7yqKKPxSM8bnVYgAA", "formats": ["avif", "webp"]},
+  "QuizImportFlow.png": {"width": 2707, "height": 353, "placeholder": "data:image/webp;base64,UklGRnYAAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSBkAAAABF0CQbeMvt+1E14iIYIdAIIVtfkT/I44BAFZQOCA2AAAAsAEAnQEqEAACAAOAWiWgAnQAxig2AAD+yE73pzxqn26pXf48Cg5HYRCePjGQCePw7c3IXYAA", "formats": ["avif", "webp"]},
+  "RiskModelCreatorWeb.png": {"width": 1150, "height": 590, "placeholder": "data:image/webp;base64,UklGRjgAAABXRUJQVlA4ICwAAACwAQCdASoQAAgAA4BaJQBdgCHfZmmgAP73CVENwyCR94Mq2GLNwl3smURgAA==", "formats": ["avif", "webp"]},
+  "SearchToolHTMLStructure.png": {"width": 1876, "height": 1712, "placeholder": "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAADQAQCdASoQAA8AA4BaJYgCdADwB/Wa2AD+9VcPraEI1Ny7BpjEQOMGIafhTMbVU5tZ9K2o9cwyhGbdI2LGKNpiCHjMNxkAd7ALLABYAAA=", "formats": ["avif", "webp"]},
+  "SiteHTMLStructure.png": {"width": 3136, "height": 576, "placeholder": "data:image/webp;base64,UklGRi4AAABXRUJQVlA4ICIAAABQAQCdASoQAAMAA4BaJQBOgC6gAP7vz8YZ/omygT1h44AA", "formats": ["avif", "webp"]},
+  "SiteJSMainPages.png": {"width": 3136, "height": 916, "placeholder": "data:image/webp;base64,UklGRjgAAABXRUJQVlA4ICwAAADQAQCdASoQAAUAA4BaJQBOgCHfcQRIAAD+8i7YNe9MHsGqeBtibvyMzpHwAA==", "formats": ["avif", "webp"]},
+  "SiteJSProjectPages.png": {"width": 3136, "height": 736, "placeholder": "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAADQAQCdASoQAAQAA4BaJQBOgCIKDsaywAD+78+STyzKNGzhQ6ygFJOPgAA=", "formats": ["avif", "webp"]},
+  "SpanishTranslatorStructure.png": {"width": 3136, "height": 836, "placeholder": "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAACwAQCdASoQAAQAA4BaJQBOgCHe8Uv4AP7vvarqhx8EbKKLA55YgAAA", "formats": ["avif", "webp"]},
+  "SubGroupAnalysisWeb.png": {"width": 1698, "height": 848, "placeholder": "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAABQAgCdASoQAAgAA4BaJYgCdH8EwAApSAKejJAA/vUGHqNptLh/RW1RXsO4C8THJWuI9EJAAUczEaa6g/arWEfcWZNJM2K0WicgAA==", "formats": ["avif", "webp"]},
+  "TACleanFlow.png": {"width": 3161, "height": 353, "placeholder": "data:image/webp;base64,UklGRmoAAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSA0AAAABD3Dn7IgIsYAR/Q8FAFZQOCA2AAAA8AEAnQEqEAACAAOAWiWgAnS6AAIzUFAAAP7Tr9enilfCxn1ehQs7+bGPyMiWzHsMUwT1L+4A", "formats": ["avif", "webp"]},
+  "TAImportFlow.png": {"width": 1620, "height": 336, "placeholder": "data:image/webp;base64,UklGRpYAAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSCIAAAABH6AmAAE2ZvUSxCUiYs1BkG3jM8nrPHN8rhHR/6iyP1UAVlA4IE4AAAAQAgCdASoQAAMAA4BaJZACdEf/geh7TycAAP7rrwG4ALsonZB8xvFUfTsb9N1K5Ntuz1q7R0r0hSnDLrTjka2owHVwbMu9PGWHj9VlMAA=", "formats": ["avif", "webp"]},
+  "TAWebUpdateFlow.png": {"width": 1656, "height": 395, "placeholder": "data:image/webp;base64,UklGRqAAAABXRUJQVlA4WAoAAAAQAAAADwAAAwAAQUxQSCoAAAABJ0AmbRukby1VxjwsImLhYSCSjPlPQAMjgwb0T3U6RPR/AqrRezhfJApWUDggUAAAAJACAJ0BKhAABAADgFoloAJ0bX+2/90ABGFNEM0AAP7rrFfsLn9got9j7VcKd0MeL8k6J7N3uMvQ75Xsnhyru33f4enpMtLL387DyUkIoAAA", "formats": ["avif", "webp"]},
+  "TerraceGardensSketchUp1.png": {"width": 1777, "height": 781, "placeholder": "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAADQAQCdASoQAAcAA4BaJZwAAxPAw+5Y4AD8srfEBR50mebi6WXbETV1v1rNyOYe6+bsaJDb1pYp028zeGAgAA==", "formats": ["avif", "webp"]},
+  "TerraceGardensSketchUp2.png": {"width": 1786, "height": 766, "placeholder": "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAAAQAgCdASoQAAcAA4BaJZQCw7D1euKm71gAAPZ3dl57a4g8D1yLo4yveYogsFf2ya+S+dRHe6XvC2RMSp8sc0H/YuyAGvaYwNNIkgAA", "formats": ["avif", "webp"]},
+  "TerraceGardensSketchUp3.png": {"width": 1016, "height": 523, "placeholder": "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAAAQAgCdASoQAAgAA4BaJYwCdAEOADeVOTigAPlqGXzo0FUwGfFe63KeA7+gQrftO/+OZiJ/fKCVedfxEsWRETQW+BMB5qmZKed179q9FhArzRl+gAA=", "formats": ["avif", "webp"]},
+  "TerraceGardensSketchUp4.png": {"width": 1016, "height": 523, "placeholder": "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAAAQAgCdASoQAAgAA4BaJZwAAxZqkify87mAAP7ijbUR1sAgGDzvbweSgdLRpeTLSK2Uf4cDQLIAUlMCms3TvypfF3S93/U+j7rsgAAA", "formats": ["avif", "webp"]},
+  "TestingTools.png": {"width": 1024, "height": 1024, "placeholder": "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAAAwAgCdASoQABAAA4BaJYwAD4/Pv/daIqwk0AD+9mpolEQJLp7H7odx95ii2xi2iBCTHiwoEbSIfjnK8qEY0OG/bngkCSF04UVF6YI2uSOAo32EEGM6T0ejaKn5OiVM80z6pMUh+pbeZNE73gJvpNoC7SJkEP2r8XQAAA==", "formats": ["avif", "webp"]},
+  "TestingToolsConfigLink.png": {"width": 900, "height": 263, "placeholder": "data:image/webp;base64,UklGRioAAABXRUJQVlA4IB4AAABQAQCdASoQAAUAA4BaJaQABAAAAP7wxnaCl6jgAAA=", "formats": ["avif", "webp"]},
+  "TestingToolsConstantsFlow.png": {"width": 3568, "height": 336, "placeholder": "data:image/webp;base64,UklGRmgAAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSA0AAAABD3Dl74gIsYAR/Q8FAFZQOCA0AAAA8AEAnQEqEAACAAOAWiWgAnS6AAIzUFAAAP6zRv8c8Fmk2VQzxPjL/wfUa2Nczw2qsloAAA==", "formats": ["avif", "webp"]},
+  "TestingToolsGeneralFlow.png": {"width": 2603, "height": 336, "placeholder": "data:image/webp;base64,UklGRn4AAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSBgAAAABFyAWTPzVdmWURkSEhkAghW1+RP8jjgFWUDggQAAAALACAJ0BKhAAAgADgFoloAJ0ugEt/tv/dAAONOAQAAD+xCPkAxi9wIV+uN3I5ivzXjG8GHGY6yPEqAp06/MEAAA=", "formats": ["avif", "webp"]},
+  "TestingToolsStateMachineFlow.png": {"width": 2603, "height": 336, "placeholder": "data:image/webp;base64,UklGRn4AAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSBgAAAABFyAWTPzVdmWURkSEhkAghW1+RP8jjgFWUDggQAAAALACAJ0BKhAAAgADgFoloAJ0ugEt/tv/dAAONOAQAAD+xCPkAxi9wIV+uN3I5ivzXjG8GHGY6yPEqAp06/MEAAA=", "formats": ["avif", "webp"]},
+  "TestingToolsStructure.png": {"width": 3136, "height": 1268, "placeholder": "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAADQAQCdASoQAAcAA4BaJYgCdAEOusoeAAD+8jVNrZEsc17HouKwMJUmoAuE/fG82WxLAAAA", "formats": ["avif", "webp"]},
+  "TextCreator.png": {"width": 1024, "height": 1024, "placeholder": "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAAAQAgCdASoQABAAA4BaJagCdH8AE5e+LHsAAP7w386bqWqURUHrYQ344tFil5AO+weNz44uZKunIpkgOKkBHCYB3XoT2JkEYWB9rYOwBxsMnsydyj58ryb5h4YbBsszTAjAAA==", "formats": ["avif", "webp"]},
+  "TextCreatorExport.png": {"width": 938, "height": 628, "placeholder": "data:image/webp;base64,UklGRigAAABXRUJQVlA4IBwAAAAwAQCdASoQAAsAA4BaJaQAA3AA/vEPlFsWSAAA", "formats": ["avif", "webp"]},
+  "TextCreatorFlow.png": {"width": 2072, "height": 336, "placeholder": "data:image/webp;base64,UklGRoQAAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSB4AAAABHyAQIGMdNlSIERGxBIIAEorMjnez14jof0TZ3yhWUDggQAAAANABAJ0BKhAAAwADgFoliAJ0AQ7+A44AAP7n+S/b0xe3MxiFdw8/DPHduasYkRAOh2eGtOHiqXZyPLvJ+5SWQAA=", "formats": ["avif", "webp"]},
+  "TextCreatorForm.png": {"width": 1149, "height": 588, "placeholder": "data:image/webp;base64,UklGRioAAABXRUJQVlA4IB4AAABwAQCdASoQAAgAA4BaJZQCdAGIQAD+8mFYV24AAAA=", "formats": ["avif", "webp"]},
+  "TextCreatorIndexStructure.png": {"width": 3136, "height": 644, "placeholder": "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAADQAQCdASoQAAMAA4BaJYwCdAEPDhx/oAD+8CrVI8o5XFqyd6YzK2mAAAA=", "formats": ["avif", "webp"]},
+  "TextCreatorPiper.png": {"width": 1402, "height": 228, "placeholder": "data:image/webp;base64,UklGRjAAAABXRUJQVlA4ICQAAADQAQCdASoQAAMAA4BaJZQCdAEO/gPIAAD+9o47zpCk+iJzAAA=", "formats": ["avif", "webp"]},
+  "TextCreatorPreview.png": {"width": 1149, "height": 692, "placeholder": "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAAAQAgCdASoQAAoAA4BaJZQCdAEfbf1vM4sAAP71ldMelSXAy8ZOWFAA", "formats": ["avif", "webp"]},
+  "TextCreatorProfileBuilder.png": {"width": 1420, "height": 817, "placeholder": "data:image/webp;base64,UklGRiwAAABXRUJQVlA4ICAAAABwAQCdASoQAAkAA4BaJZQCdAFAAAD+8eyrccN0tGksAA==", "formats": ["avif", "webp"]},
+  "TextCreatorProfileLoader.png": {"width": 1420, "height": 396, "placeholder": "data:image/webp;base64,UklGRiwAAABXRUJQVlA4ICAAAABwAQCdASoQAAUAA4BaJZQCdAFAAAD+8jA+y44bVBFAAA==", "formats": ["avif", "webp"]},
+  "TextCreatorProfileStructure.png": {"width": 3136, "height": 680, "placeholder": "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAACwAQCdASoQAAQAA4BaJYwCdAEO+mBgAP7wMa5Ld3M3gF9DR+WoEhAA", "formats": ["avif", "webp"]},
+  "Thematic-WebApp.png": {"width": 1024, "height": 1024, "placeholder": "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAADQAQCdASoQABAAA4BaJQBdgCGrDP9dgAD+0l6UvN2Gi+cAEqUMm/mKbToeI6l0K5i6cqKdpOko9qZDRyDz3DzSe8DIzHwc6U6hY19QIUW+8c7HpaVVozSL98dTI+ZggAA=", "formats": ["avif", "webp"]},
+  "ThematicAnalysisDataFlow.png": {"width": 3136, "height": 1256, "placeholder": "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAACwAQCdASoQAAYAA4BaJQBOgCKcm5vAAP7z9ruv8Q+M3bXoRTO8dfpgOyHKz74AAAA=", "formats": ["avif", "webp"]},
+  "ThematicAnalysisHTMLStructure.png": {"width": 3136, "height": 668, "placeholder": "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAADQAQCdASoQAAMAA4BaJQBOgCKV/FpcAAD+8EBghgK5zSrGygT1fFAA", "formats": ["avif", "webp"]},
+  "ThematicAnalysisIntial.png": {"width": 1853, "height": 651, "placeholder": "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAABQAgCdASoQAAYAA4BaJbACdDXAAWbbe1jc7AAA/u/liZMJbxJm9j5Xu+UCAiwE1FELx8M6oo7/82WMfwcmKjz2fePuVOjf/jyPHvuTat8ZZ/1jz38qx9Fd+AA=", "formats": ["avif", "webp"]},
+  "ThematicAnalysisJSPages.png": {"width": 3136, "height": 756, "placeholder": "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAADQAQCdASoQAAQAA4BaJQBOgCPtv4sxgAD+8EN5VNzFE6dj3Am87oAA", "formats": ["avif", "webp"]},
+  "ThematicAnalysisStructureEDR.png": {"width": 917, "height": 708, "placeholder": "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAAAwAgCdASoQAAwAA4BaJaQAD4SQcCkAvwRxAAD++LmEpGQFV0EcGPDpHCZuHDcz7S6UVGiUe1imDzXkCUJ/QxGujom0KIy5c1qHk8AWv+YAAA==", "formats": ["avif", "webp"]},
+  "ThematicWebResults.png": {"width": 1181, "height": 590, "placeholder": "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAADQAQCdASoQAAgAA4BaJZwCdAEPAcsuYgD+84vySsj1an//oAqNjARlMdXsILIAAAA=", "formats": ["avif", "webp"]},
+  "TranslatorPlayback.png": {"width": 1134, "height": 593, "placeholder": "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAADwAQCdASoQAAgAA4BaJZQCdAEPAm0j14AA/vaHyhNpA3oxVkt8nwAA", "formats": ["avif", "webp"]},
+  "TranslatorTranslate.png": {"width": 1279, "height": 943, "placeholder": "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAADwAQCdASoQAAwAA4BaJZQCdAEf/qZ3dHwA/vWew2cRQcdQRw16SwAA", "formats": ["avif", "webp"]},
+  "UpdateCatSubCat.png": {"width": 1149, "height": 435, "placeholder": "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAADQAQCdASoQAAYAA4BaJZwCdAEO/FhoAAD+8Bs9jEZdK66Kg9hMzgAA", "formats": ["avif", "webp"]},
+  "UpdateGroupSubGroup.png": {"width": 1823, "height": 607, "placeholder": "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAADQAQCdASoQAAUAA4BaJbACdAEO/gOOAAD+8BE79XwXiJfQUe7+IcXj5f/nagv/ByYqPQTRJ9/J/F/+cfhZ9f/yb1+7wAAA", "formats": ["avif", "webp"]},
+  "UpdateSearchTool.png": {"width": 742, "height": 300, "placeholder": "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADwAQCdASoQAAcAA4BaJbAC7AEU9vBIwAAA/uhR70UIllQx9GbodLE3V8zNC8vedaHcbLyw3npR+/Tep99hvf44F/gJlbQHUAA=", "formats": ["avif", "webp"]},
+  "VegeGardenBoxesSketchUp1.png": {"width": 1245, "height": 681, "placeholder": "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADQAQCdASoQAAkAA4BaJZwAAveBbiOGAAD+8E1HMvTBTOb0M5f9cB9zQ9RDMPAHnfYB+0bPR3UEYfLzjhVMV4PPlw5c+OzoFAAAAA==", "formats": ["avif", "webp"]},
+  "VegeGardenBoxesSketchUp2.png": {"width": 1251, "height": 758, "placeholder": "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAAAQAgCdASoQAAoAA4BaJZwAD4eRahyt7dtYAP7wkAZS6S3uanPUBRB/oku3qzQLjwNoAzakNqhnOGz/PauKnO2dp6XH55fv6hSYckYGF0kAAA==", "formats": ["avif", "webp"]},
+  "VegeGardenBoxesSketchUp3.png": {"width": 1227, "height": 741, "placeholder": "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAAAQAgCdASoQAAoAA4BaJZwAD4owb0hLm3AAAP7rkZuV7yCx+4Ka3R5TNZh2KU1zr9uX4Ob7+oXAQXIuzc3RUa84PvLCSKkA6/feBQACkExoQAAA", "formats": ["avif", "webp"]},
+  "VegeGardenBoxesSketchUp4.png": {"width": 1122, "height": 720, "placeholder": "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAAAwAgCdASoQAAoAA4BaJZwAD4zQjlWYKARgAAD+2CPsSdhvvuaWNvIlfOgR2SPd8iwHh9rNCJf3ZbvStPzNegnedBMmFXWdLLGtUB9fLIU4zNK0JfIQAA==", "formats": ["avif", "webp"]},
+  "VerticalGreenhouseSketchUp1.png": {"width": 745, "height": 533, "placeholder": "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAAAQAgCdASoQAAsAA4BaJaQAD4Tw+y8+lFAAAP74ubtB0BVffepfYBsJ2hBtrtjq2KEUitlWB0LgW8sQpjkvFc98R09DQAAA", "formats": ["avif", "webp"]},
+  "VerticalGreenhouseSketchUp2.png": {"width": 1080, "height": 758, "placeholder": "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAADQAQCdASoQAAsAA4BaJaQAAwAZK5gJgAD++Ln2pspp6yqo8fbXMeUfOA/Fdzga/ApwJHJuzDm4kwo1W66CigAA", "formats": ["avif", "webp"]},
+  "VerticalGreenhouseSketchUp3.png": {"width": 1022, "height": 754, "placeholder": "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAADQAQCdASoQAAwAA4BaJaQAAvwctE6YaAD++Lk1zfNjPQwKCfomfCM2cUlrOgdFEYgAdbSf24hiTH7Zt3JqtWhyAAA=", "formats": ["avif", "webp"]},
+  "WebSearchTool.png": {"width": 1061, "height": 530, "placeholder": "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAAAwAgCdASoQAAgAA4BaJYgCdEf/geiBIz7+AAD+ATCUoxlNymks+qm8vfGchbZhaBR9z8xZD3PzL6A89FofbyCBQAA=", "formats": ["avif", "webp"]},
+  "WiFiScannerFlow.png": {"width": 2571, "height": 336, "placeholder": "data:image/webp;base64,UklGRn4AAABXRUJQVlA4WAoAAAAQAAAADwAAAQAAQUxQSBoAAAABF6CQbQTIX233IZ1GRAQ7BAIpbPMj+h9xDFZQOCA+AAAAkAIAnQEqEAACAAOAWiWgAnS6AS3+2/90AA403rAA/tO5ZQqUFX32xsFd3wPnPHqd7IKATgG+wl5YbEw2IAA=", "formats": ["avif", "webp"]},
+  "carouselFlow.png": {"width": 1597, "height": 336, "placeholder": "data:image/webp;base64,UklGRp4AAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSCgAAAABL6CobRs41pNWeey5iIjj2IdiSJIYiVW5fyRI/jIDEdH/9IbmYd4QVlA4IFAAAAAwAgCdASoQAAMAA4BaJZACdEf/7oACbsOThAD+668CdADsne72sLP7LFpJj42+XXdUkLpQu1GuiaS26043FirYNieLZNy7zuqV0fbl67sAAA==", "formats": ["avif", "webp"]},
+  "embedSketchfabFlow.png": {"width": 1635, "height": 336, "placeholder": "data:image/webp;base64,UklGRqAAAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSCYAAAABJ0AmYBkcggniEhGxKoeCSDaohwqC/BoY/VNdiIj+Zy3iHlmLAFZQOCBUAAAAUAIAnQEqEAADAAOAWiWQAnRH/+6AAoCatiZIAP7okbGA/yp9g0j8BXRoBepI5MS2T5h9FqtMXZbwtJFHHj27/m2fpj2f+5DQ1blgbuNr+xIUrgAA", "formats": ["avif", "webp"]},
+  "footerIconLoaderFlow.png": {"width": 1596, "height": 336, "placeholder": "data:image/webp;base64,UklGRpQAAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSB8AAAABHyAkIGPNLTtEERHJIMi28ZnkdZ45PteI6H9U2Z8qAFZQOCBOAAAAMAIAnQEqEAADAAOAWiWQAnRH/+6AAm7Dk4QA/uuvAa3QRZsOu/vp04WmK/037rm8Ku4QGY91fC73f82z9Mez/3IaGrcsDdxtf2JClcAA", "formats": ["avif", "webp"]},
+  "githubAppLoaderFlow.png": {"width": 1573, "height": 336, "placeholder": "data:image/webp;base64,UklGRp4AAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSCcAAAABL0AmbRukV1XVx95FRIzwUAxJEiOxKvePBMlfZiAi+p/e0DzMGwIAVlA4IFAAAAAwAgCdASoQAAMAA4BaJZACdEf/7oACbsOThAD+668CdADsne76l99OnF3EM+uaAZAdGaa1dpMd7zCYrj8H8LyX7x4W5dS13E3qRk4byTrwAA==", "formats": ["avif", "webp"]},
+  "initFlow.png": {"width": 1604, "height": 336, "placeholder": "data:image/webp;base64,UklGRpQAAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSB8AAAABHyAkIGPJLj80ERHJIMi28ZnkdZ45PteI6H9U2Z8qAFZQOCBOAAAAUAIAnQEqEAADAAOAWiWQAnRH/+6AAm7K1AXAAP7okbCVw4neQbaaKN/AGkPpMS6/xDswD1elivj6A0a043FirYNieLZNy7yfuW8JfOAA", "formats": ["avif", "webp"]},
+  "mainTextLoaderFlow.png": {"width": 1573, "height": 336, "placeholder": "data:image/webp;base64,UklGRp4AAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSCcAAAABL0AmbRukV1XVx95FRIzwUAxJEiOxKvePBMlfZiAi+p/e0DzMGwIAVlA4IFAAAAAwAgCdASoQAAMAA4BaJYgCdEf/7oACbsOThAD+668CdADsne76l99OnF3EM+uaAZAdGaa1dpMd7zCYrj8H8LyX7x4W5dS13E3qRk4byTrwAA==", "formats": ["avif", "webp"]},
+  "menuToggleFlow.png": {"width": 1075, "height": 336, "placeholder": "data:image/webp;base64,UklGRpoAAABXRUJQVlA4WAoAAAAQAAAADwAABAAAQUxQSCkAAAABJyAQQZpjj/3N1oiI2AAKGUlivhmcwCM0f7uFiOj/BOyjynCSumj2UQBWUDggSgAAAPABAJ0BKhAABQADgFolAE6HEAApMksm8AD+68HchJd5zE9greOIiMlanz1LAad13vKxhviKaAfmAKqrcXreb30l+P1BZcZCAAAA", "formats": ["avif", "webp"]},
+  "modalZoomFlow.png": {"width": 1616, "height": 336, "placeholder": "data:image/webp;base64,UklGRpYAAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSCIAAAABH6AmAAE2ZvUSxCUiYs1BkG3jM8nrPHN8rhHR/6iyP1UAVlA4IE4AAABQAgCdASoQAAMAA4BaJZgCdEf/7oACgJq2JkgA/uiRsX2UxJj1GcjSXNm8WLu+VQBVvSwWPAnYkvrv+bZ+mPZ/7kNDVuWBu42v3ruwAAA=", "formats": ["avif", "webp"]},
+  "projectLinksLoaderFlow.png": {"width": 1608, "height": 336, "placeholder": "data:image/webp;base64,UklGRpYAAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSB8AAAABHyAkIGPJLj80ERHJIMi28ZnkdZ45PteI6H9U2Z8qAFZQOCBQAAAAcAIAnQEqEAADAAOAWiWQAnRH/+6ADYWwb+A44AD+6JGwlb5O3ffW9aRS5wWojrr+uKtk9gLi60HTDZ/vVZSiw1LwRxcxIxNk8RQOHZUsAAA=", "formats": ["avif", "webp"]},
+  "projectListLoaderFlow.png": {"width": 2072, "height": 336, "placeholder": "data:image/webp;base64,UklGRoIAAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSB4AAAABHyAQIGMdNlSIERGxBIIAEorMjnez14jof0TZ3yhWUDggPgAAANABAJ0BKhAAAwADgFoliAJ0AQ7+A44AAP7n+S/b0xe3MxiFdw8/CSCK2XKFTOX0Jn+7nqHxuiy7yfuUlkAA", "formats": ["avif", "webp"]},
+  "projectStepsDataFlow.png": {"width": 1584, "height": 336, "placeholder": "data:image/webp;base64,UklGRpYAAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSB8AAAABHyAkIGPRKz9EERHJIMi28ZnkdZ45PteI6H9U2Z8qAFZQOCBQAAAAMAIAnQEqEAADAAOAWiWQAnRH/+6AAm7Dk4QA/uiRsX2UxHbChVhZ/ZYtJSV43p9INrTWrtTVFolcfjHu/5tn6Y9n/uQ0NW5YG7ja/a4AAAA=", "formats": ["avif", "webp"]},
+  "promptForge.png": {"width": 1536, "height": 1024, "placeholder": "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAADQAQCdASoQAAsAA4BaJbACdAD2HxYoAAD+63DcW1t9mgw54O6gSjNOlTux86XNDRtVl+8g4JWWqMxBKrr+kvjHQi5mrkoDHQBZFaQDm8QIEAAA", "formats": ["avif", "webp"]},
+  "quizWebUpdateFlow.png": {"width": 1595, "height": 353, "placeholder": "data:image/webp;base64,UklGRqQAAABXRUJQVlA4WAoAAAAQAAAADwAAAwAAQUxQSCwAAAABN0CQbRtMGQ5zhMM8ImIqDgMNZGxf4QuYBqaDJvQPcTpE9H8CIlF7OF81GlZQOCBSAAAAMAMAnQEqEAAEAAOAWiWgAnRtf7b/3QAc4zP/mWmNgWpDgAD+6I5vvOsQmpf9Q16bhETpZ8D6XLxzAZe1qtDxROjvAPaYenpMtLnDOT36ZfWkAA==", "formats": ["avif", "webp"]},
+  "responsiveImageLoaderFlow.png": {"width": 1577, "height": 336, "placeholder": "data:image/webp;base64,UklGRqIAAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSCcAAAABL0AmbRukV1XVx95FRIzwUAxJEiOxKvePBMlfZiAi+p/e0DzMGwIAVlA4IFQAAABQAgCdASoQAAMAA4BaJZACdEf/7oACbr+cEgAA/uuvAbgAuyddp1Rr3Z43/vk4GJded3S9CAzPxEhUeHFlErO7/m2fpj2f+5DQ1blgbuNr967sAAA=", "formats": ["avif", "webp"]},
+  "resumeLoaderFlow.png": {"width": 1575, "height": 336, "placeholder": "data:image/webp;base64,UklGRqAAAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSCcAAAABJ0AmbRukX03Vx95FRCw8FESyQT1UEOTXwOif6kJE9D9rEffIWgQAVlA4IFIAAAAwAgCdASoQAAMAA4BaJZACdEf/7oACbsOThAD+668CdADsne76l99OnF3EM+ua8MHPLSuTkvT706U6TEpMH8LyX7x4W5dS13E3qRk4byTrwAAA", "formats": ["avif", "webp"]},
+  "sharepointGPS.png": {"width": 512, "height": 512, "placeholder": "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAADQAgCdASoQABAAA4BaJYwC7O/9R/gWVPI2PxvI2zwAAP7z+4Nj77QG5u0IBbGIFVllqHg5+y0yV2BjPeeL9twlqYbvs1aRt24FjHQ0ukospKzrWNRz7nIsekMXa0/F73vFTEclDzYZNasPAAoMcKHhyACNFFSiB0kAAA==", "formats": ["avif", "webp"]},
+  "skillsLoaderFlow.png": {"width": 1573, "height": 336, "placeholder": "data:image/webp;base64,UklGRqAAAABXRUJQVlA4WAoAAAAQAAAADwAAAgAAQUxQSCcAAAABL0AmbRukV1XVx95FRIzwUAxJEiOxKvePBMlfZiAi+p/e0DzMGwIAVlA4IFIAAABQAgCdASoQAAMAA4BaJZACdEf/7oACbr+cEgAA/uuvAnQA7J3u+pffTpxdxDPrmvDBzy0rk5Lzuj4lTlmbNacbixVsGxPFsm5d53VK6PrmJYAA", "formats": ["avif", "webp"]},
+  "themeToggleFlow.png": {"width": 1669, "height": 613, "placeholder": "data:image/webp;base64,UklGRrIAAABXRUJQVlA4WAoAAAAQAAAADwAABQAAQUxQSDEAAAABR0CQbRtMc6x7nOAREVMRB4LaNtOBAo4GjjKiCMC24G8dIvo/AZGo52EP1e9Qm6MAAFZQOCBaAAAAEAIAnQEqEAAGAAOAWiWoAnQBEM1m2Yys+AD+7lwCbqLDQY2hMQd6V3WWif9+zKfEV99LZnB3HT8V182hfDVc0ml9tqBCdBv6ucig9ql0RHEN1cVF6LsAFAAA", "formats": ["avif", "webp"]},
+};
@@ -0,0 +1,156 @@
+// projects/js/JSON/srcsetManifest.js
+// Generated by PythonFiles/Image-Optimizer.py; do not edit by hand.
+// Content-adaptive widths and srcset per format for each responsive image.
+const SRCSET_MANIFEST = {
+  "Arcade-Cabinet1.png": {"widths": [320, 498], "srcset": {"png": "images/main/optimized/adaptive/Arcade-Cabinet1-320w.png 320w, images/main/optimized/adaptive/Arcade-Cabinet1-498w.png 498w", "avif": "images/main/optimized/adaptive/Arcade-Cabinet1-320w.avif 320w, images/main/optimized/adaptive/Arcade-Cabinet1-498w.avif 498w", "webp": "images/main/optimized/adaptive/Arcade-Cabinet1-320w.webp 320w, images/main/optimized/adaptive/Arcade-Cabinet1-498w.webp 498w"}},
+  "Arcade-Cabinet2.png": {"widths": [320, 498], "srcset": {"png": "images/main/optimized/adaptive/Arcade-Cabinet2-320w.png 320w, images/main/optimized/adaptive/Arcade-Cabinet2-498w.png 498w", "avif": "images/main/optimized/adaptive/Arcade-Cabinet2-320w.avif 320w, images/main/optimized/adaptive/Arcade-Cabinet2-498w.avif 498w", "webp": "images/main/optimized/adaptive/Arcade-Cabinet2-320w.webp 320w, images/main/optimized/adaptive/Arcade-Cabinet2-498w.webp 498w"}},
+  "ArcadeCabinetSketchUp1.png": {"widths": [320, 514], "srcset": {"png": "images/main/optimized/adaptive/ArcadeCabinetSketchUp1-320w.png 320w, images/main/optimized/adaptive/ArcadeCabinetSketchUp1-514w.png 514w", "avif": "images/main/optimized/adaptive/ArcadeCabinetSketchUp1-320w.avif 320w, images/main/optimized/adaptive/ArcadeCabinetSketchUp1-514w.avif 514w", "webp": "images/main/optimized/adaptive/ArcadeCabinetSketchUp1-320w.webp 320w, images/main/optimized/adaptive/ArcadeCabinetSketchUp1-514w.webp 514w"}},
+  "ArcadeCabinetSketchUp2.png": {"widths": [320, 568], "srcset": {"png": "images/main/optimized/adaptive/ArcadeCabinetSketchUp2-320w.png 320w, images/main/optimized/adaptive/ArcadeCabinetSketchUp2-568w.png 568w", "avif": "images/main/optimized/adaptive/ArcadeCabinetSketchUp2-320w.avif 320w, images/main/optimized/adaptive/ArcadeCabinetSketchUp2-568w.avif 568w", "webp": "images/main/optimized/adaptive/ArcadeCabinetSketchUp2-320w.webp 320w, images/main/optimized/adaptive/ArcadeCabinetSketchUp2-568w.webp 568w"}},
+  "ArcadeCabinetSketchUp3.png": {"widths": [320, 581], "srcset": {"png": "images/main/optimized/adaptive/ArcadeCabinetSketchUp3-320w.png 320w, images/main/optimized/adaptive/ArcadeCabinetSketchUp3-581w.png 581w", "avif": "images/main/optimized/adaptive/ArcadeCabinetSketchUp3-320w.avif 320w, images/main/optimized/adaptive/ArcadeCabinetSketchUp3-581w.avif 581w", "webp": "images/main/optimized/adaptive/ArcadeCabinetSketchUp3-320w.webp 320w, images/main/optimized/adaptive/ArcadeCabinetSketchUp3-581w.webp 581w"}},
+  "AutomationTools.png": {"widths": [320, 782, 1024], "srcset": {"png": "images/main/optimized/adaptive/AutomationTools-320w.png 320w, images/main/optimized/adaptive/AutomationTools-782w.png 782w, images/main/optimized/adaptive/AutomationTools-1024w.png 1024w", "avif": "images/main/optimized/adaptive/AutomationTools-320w.avif 320w, images/main/optimized/adaptive/AutomationTools-782w.avif 782w, images/main/optimized/adaptive/AutomationTools-1024w.avif 1024w", "webp": "images/main/optimized/adaptive/AutomationTools-320w.webp 320w, images/main/optimized/adaptive/AutomationTools-782w.webp 782w, images/main/optimized/adaptive/AutomationTools-1024w.webp 1024w"}},
+  "AutomationToolsConfigLink.png": {"widths": [320, 830], "srcset": {"png": "images/main/optimized/adaptive/AutomationToolsConfigLink-320w.png 320w, images/main/optimized/adaptive/AutomationToolsConfigLink-830w.png 830w", "avif": "images/main/optimized/adaptive/AutomationToolsConfigLink-320w.avif 320w, images/main/optimized/adaptive/AutomationToolsConfigLink-830w.avif 830w", "webp": "images/main/optimized/adaptive/AutomationToolsConfigLink-320w.webp 320w, images/main/optimized/adaptive/AutomationToolsConfigLink-830w.webp 830w"}},
+  "AutomationToolsConstantsFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/AutomationToolsConstantsFlow-320w.png 320w, images/main/optimized/adaptive/AutomationToolsConstantsFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/AutomationToolsConstantsFlow-320w.avif 320w, images/main/optimized/adaptive/AutomationToolsConstantsFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/AutomationToolsConstantsFlow-320w.webp 320w, images/main/optimized/adaptive/AutomationToolsConstantsFlow-1920w.webp 1920w"}},
+  "AutomationToolsGeneralFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/AutomationToolsGeneralFlow-320w.png 320w, images/main/optimized/adaptive/AutomationToolsGeneralFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/AutomationToolsGeneralFlow-320w.avif 320w, images/main/optimized/adaptive/AutomationToolsGeneralFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/AutomationToolsGeneralFlow-320w.webp 320w, images/main/optimized/adaptive/AutomationToolsGeneralFlow-1920w.webp 1920w"}},
+  "AutomationToolsPipelineFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/AutomationToolsPipelineFlow-320w.png 320w, images/main/optimized/adaptive/AutomationToolsPipelineFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/AutomationToolsPipelineFlow-320w.avif 320w, images/main/optimized/adaptive/AutomationToolsPipelineFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/AutomationToolsPipelineFlow-320w.webp 320w, images/main/optimized/adaptive/AutomationToolsPipelineFlow-1920w.webp 1920w"}},
+  "AutomationToolsStateMachineFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/AutomationToolsStateMachineFlow-320w.png 320w, images/main/optimized/adaptive/AutomationToolsStateMachineFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/AutomationToolsStateMachineFlow-320w.avif 320w, images/main/optimized/adaptive/AutomationToolsStateMachineFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/AutomationToolsStateMachineFlow-320w.webp 320w, images/main/optimized/adaptive/AutomationToolsStateMachineFlow-1920w.webp 1920w"}},
+  "AutomationToolsStructure.png": {"widths": [320, 1245, 1920], "srcset": {"png": "images/main/optimized/adaptive/AutomationToolsStructure-320w.png 320w, images/main/optimized/adaptive/AutomationToolsStructure-1245w.png 1245w, images/main/optimized/adaptive/AutomationToolsStructure-1920w.png 1920w", "avif": "images/main/optimized/adaptive/AutomationToolsStructure-320w.avif 320w, images/main/optimized/adaptive/AutomationToolsStructure-1245w.avif 1245w, images/main/optimized/adaptive/AutomationToolsStructure-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/AutomationToolsStructure-320w.webp 320w, images/main/optimized/adaptive/AutomationToolsStructure-1245w.webp 1245w, images/main/optimized/adaptive/AutomationToolsStructure-1920w.webp 1920w"}},
+  "BackupButtons.png": {"widths": [320, 563, 710], "srcset": {"png": "images/main/optimized/adaptive/BackupButtons-320w.png 320w, images/main/optimized/adaptive/BackupButtons-563w.png 563w, images/main/optimized/adaptive/BackupButtons-710w.png 710w", "avif": "images/main/optimized/adaptive/BackupButtons-320w.avif 320w, images/main/optimized/adaptive/BackupButtons-563w.avif 563w, images/main/optimized/adaptive/BackupButtons-710w.avif 710w", "webp": "images/main/optimized/adaptive/BackupButtons-320w.webp 320w, images/main/optimized/adaptive/BackupButtons-563w.webp 563w, images/main/optimized/adaptive/BackupButtons-710w.webp 710w"}},
+  "BackupConfigFlow.png": {"widths": [320, 1660], "srcset": {"png": "images/main/optimized/adaptive/BackupConfigFlow-320w.png 320w, images/main/optimized/adaptive/BackupConfigFlow-1660w.png 1660w", "avif": "images/main/optimized/adaptive/BackupConfigFlow-320w.avif 320w, images/main/optimized/adaptive/BackupConfigFlow-1660w.avif 1660w", "webp": "images/main/optimized/adaptive/BackupConfigFlow-320w.webp 320w, images/main/optimized/adaptive/BackupConfigFlow-1660w.webp 1660w"}},
+  "BackupCoreFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/BackupCoreFlow-320w.png 320w, images/main/optimized/adaptive/BackupCoreFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/BackupCoreFlow-320w.avif 320w, images/main/optimized/adaptive/BackupCoreFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/BackupCoreFlow-320w.webp 320w, images/main/optimized/adaptive/BackupCoreFlow-1920w.webp 1920w"}},
+  "BackupFileSystemUIFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/BackupFileSystemUIFlow-320w.png 320w, images/main/optimized/adaptive/BackupFileSystemUIFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/BackupFileSystemUIFlow-320w.avif 320w, images/main/optimized/adaptive/BackupFileSystemUIFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/BackupFileSystemUIFlow-320w.webp 320w, images/main/optimized/adaptive/BackupFileSystemUIFlow-1920w.webp 1920w"}},
+  "BackupLaunch.png": {"widths": [320, 644, 705], "srcset": {"png": "images/main/optimized/adaptive/BackupLaunch-320w.png 320w, images/main/optimized/adaptive/BackupLaunch-644w.png 644w, images/main/optimized/adaptive/BackupLaunch-705w.png 705w", "avif": "images/main/optimized/adaptive/BackupLaunch-320w.avif 320w, images/main/optimized/adaptive/BackupLaunch-644w.avif 644w, images/main/optimized/adaptive/BackupLaunch-705w.avif 705w", "webp": "images/main/optimized/adaptive/BackupLaunch-320w.webp 320w, images/main/optimized/adaptive/BackupLaunch-644w.webp 644w, images/main/optimized/adaptive/BackupLaunch-705w.webp 705w"}},
+  "BackupLogOutput.png": {"widths": [320, 492, 645, 771, 780], "srcset": {"png": "images/main/optimized/adaptive/BackupLogOutput-320w.png 320w, images/main/optimized/adaptive/BackupLogOutput-492w.png 492w, images/main/optimized/adaptive/BackupLogOutput-645w.png 645w, images/main/optimized/adaptive/BackupLogOutput-771w.png 771w, images/main/optimized/adaptive/BackupLogOutput-780w.png 780w", "avif": "images/main/optimized/adaptive/BackupLogOutput-320w.avif 320w, images/main/optimized/adaptive/BackupLogOutput-492w.avif 492w, images/main/optimized/adaptive/BackupLogOutput-645w.avif 645w, images/main/optimized/adaptive/BackupLogOutput-771w.avif 771w, images/main/optimized/adaptive/BackupLogOutput-780w.avif 780w", "webp": "images/main/optimized/adaptive/BackupLogOutput-320w.webp 320w, images/main/optimized/adaptive/BackupLogOutput-492w.webp 492w, images/main/optimized/adaptive/BackupLogOutput-645w.webp 645w, images/main/optimized/adaptive/BackupLogOutput-771w.webp 771w, images/main/optimized/adaptive/BackupLogOutput-780w.webp 780w"}},
+  "BackupMainPS1Flow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/BackupMainPS1Flow-320w.png 320w, images/main/optimized/adaptive/BackupMainPS1Flow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/BackupMainPS1Flow-320w.avif 320w, images/main/optimized/adaptive/BackupMainPS1Flow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/BackupMainPS1Flow-320w.webp 320w, images/main/optimized/adaptive/BackupMainPS1Flow-1920w.webp 1920w"}},
+  "BackupModeRobocopy.png": {"widths": [320, 633], "srcset": {"png": "images/main/optimized/adaptive/BackupModeRobocopy-320w.png 320w, images/main/optimized/adaptive/BackupModeRobocopy-633w.png 633w", "avif": "images/main/optimized/adaptive/BackupModeRobocopy-320w.avif 320w, images/main/optimized/adaptive/BackupModeRobocopy-633w.avif 633w", "webp": "images/main/optimized/adaptive/BackupModeRobocopy-320w.webp 320w, images/main/optimized/adaptive/BackupModeRobocopy-633w.webp 633w"}},
+  "BackupModeZip.png": {"widths": [320, 670], "srcset": {"png": "images/main/optimized/adaptive/BackupModeZip-320w.png 320w, images/main/optimized/adaptive/BackupModeZip-670w.png 670w", "avif": "images/main/optimized/adaptive/BackupModeZip-320w.avif 320w, images/main/optimized/adaptive/BackupModeZip-670w.avif 670w", "webp": "images/main/optimized/adaptive/BackupModeZip-320w.webp 320w, images/main/optimized/adaptive/BackupModeZip-670w.webp 670w"}},
+  "BackupSchedule.png": {"widths": [320, 706], "srcset": {"png": "images/main/optimized/adaptive/BackupSchedule-320w.png 320w, images/main/optimized/adaptive/BackupSchedule-706w.png 706w", "avif": "images/main/optimized/adaptive/BackupSchedule-320w.avif 320w, images/main/optimized/adaptive/BackupSchedule-706w.avif 706w", "webp": "images/main/optimized/adaptive/BackupSchedule-320w.webp 320w, images/main/optimized/adaptive/BackupSchedule-706w.webp 706w"}},
+  "BackupSourceDest.png": {"widths": [320, 708], "srcset": {"png": "images/main/optimized/adaptive/BackupSourceDest-320w.png 320w, images/main/optimized/adaptive/BackupSourceDest-708w.png 708w", "avif": "images/main/optimized/adaptive/BackupSourceDest-320w.avif 320w, images/main/optimized/adaptive/BackupSourceDest-708w.avif 708w", "webp": "images/main/optimized/adaptive/BackupSourceDest-320w.webp 320w, images/main/optimized/adaptive/BackupSourceDest-708w.webp 708w"}},
+  "BackupStructure.png": {"widths": [320, 1332, 1920], "srcset": {"png": "images/main/optimized/adaptive/BackupStructure-320w.png 320w, images/main/optimized/adaptive/BackupStructure-1332w.png 1332w, images/main/optimized/adaptive/BackupStructure-1920w.png 1920w", "avif": "images/main/optimized/adaptive/BackupStructure-320w.avif 320w, images/main/optimized/adaptive/BackupStructure-1332w.avif 1332w, images/main/optimized/adaptive/BackupStructure-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/BackupStructure-320w.webp 320w, images/main/optimized/adaptive/BackupStructure-1332w.webp 1332w, images/main/optimized/adaptive/BackupStructure-1920w.webp 1920w"}},
+  "BackupUIFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/BackupUIFlow-320w.png 320w, images/main/optimized/adaptive/BackupUIFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/BackupUIFlow-320w.avif 320w, images/main/optimized/adaptive/BackupUIFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/BackupUIFlow-320w.webp 320w, images/main/optimized/adaptive/BackupUIFlow-1920w.webp 1920w"}},
+  "ChineseTranslatorStructure.png": {"widths": [320, 1470, 1920], "srcset": {"png": "images/main/optimized/adaptive/ChineseTranslatorStructure-320w.png 320w, images/main/optimized/adaptive/ChineseTranslatorStructure-1470w.png 1470w, images/main/optimized/adaptive/ChineseTranslatorStructure-1920w.png 1920w", "avif": "images/main/optimized/adaptive/ChineseTranslatorStructure-320w.avif 320w, images/main/optimized/adaptive/ChineseTranslatorStructure-1470w.avif 1470w, images/main/optimized/adaptive/ChineseTranslatorStructure-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/ChineseTranslatorStructure-320w.webp 320w, images/main/optimized/adaptive/ChineseTranslatorStructure-1470w.webp 1470w, images/main/optimized/adaptive/ChineseTranslatorStructure-1920w.webp 1920w"}},
+  "DataAnalysisFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/DataAnalysisFlow-320w.png 320w, images/main/optimized/adaptive/DataAnalysisFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/DataAnalysisFlow-320w.avif 320w, images/main/optimized/adaptive/DataAnalysisFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/DataAnalysisFlow-320w.webp 320w, images/main/optimized/adaptive/DataAnalysisFlow-1920w.webp 1920w"}},
+  "DataAnalysisStructure.png": {"widths": [320, 1482, 1920], "srcset": {"png": "images/main/optimized/adaptive/DataAnalysisStructure-320w.png 320w, images/main/optimized/adaptive/DataAnalysisStructure-1482w.png 1482w, images/main/optimized/adaptive/DataAnalysisStructure-1920w.png 1920w", "avif": "images/main/optimized/adaptive/DataAnalysisStructure-320w.avif 320w, images/main/optimized/adaptive/DataAnalysisStructure-1482w.avif 1482w, images/main/optimized/adaptive/DataAnalysisStructure-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/DataAnalysisStructure-320w.webp 320w, images/main/optimized/adaptive/DataAnalysisStructure-1482w.webp 1482w, images/main/optimized/adaptive/DataAnalysisStructure-1920w.webp 1920w"}},
+  "DataAnalysisTool.png": {"widths": [320, 826, 1350], "srcset": {"png": "images/main/optimized/adaptive/DataAnalysisTool-320w.png 320w, images/main/optimized/adaptive/DataAnalysisTool-826w.png 826w, images/main/optimized/adaptive/DataAnalysisTool-1350w.png 1350w", "avif": "images/main/optimized/adaptive/DataAnalysisTool-320w.avif 320w, images/main/optimized/adaptive/DataAnalysisTool-826w.avif 826w, images/main/optimized/adaptive/DataAnalysisTool-1350w.avif 1350w", "webp": "images/main/optimized/adaptive/DataAnalysisTool-320w.webp 320w, images/main/optimized/adaptive/DataAnalysisTool-826w.webp 826w, images/main/optimized/adaptive/DataAnalysisTool-1350w.webp 1350w"}},
+  "DataAnalysisToolDataEntryPage.png": {"widths": [320, 1212], "srcset": {"png": "images/main/optimized/adaptive/DataAnalysisToolDataEntryPage-320w.png 320w, images/main/optimized/adaptive/DataAnalysisToolDataEntryPage-1212w.png 1212w", "avif": "images/main/optimized/adaptive/DataAnalysisToolDataEntryPage-320w.avif 320w, images/main/optimized/adaptive/DataAnalysisToolDataEntryPage-1212w.avif 1212w", "webp": "images/main/optimized/adaptive/DataAnalysisToolDataEntryPage-320w.webp 320w, images/main/optimized/adaptive/DataAnalysisToolDataEntryPage-1212w.webp 1212w"}},
+  "DataAnalysisToolDatabaseSettingsPage.png": {"widths": [320, 1148], "srcset": {"png": "images/main/optimized/adaptive/DataAnalysisToolDatabaseSettingsPage-320w.png 320w, images/main/optimized/adaptive/DataAnalysisToolDatabaseSettingsPage-1148w.png 1148w", "avif": "images/main/optimized/adaptive/DataAnalysisToolDatabaseSettingsPage-320w.avif 320w, images/main/optimized/adaptive/DataAnalysisToolDatabaseSettingsPage-1148w.avif 1148w", "webp": "images/main/optimized/adaptive/DataAnalysisToolDatabaseSettingsPage-320w.webp 320w, images/main/optimized/adaptive/DataAnalysisToolDatabaseSettingsPage-1148w.webp 1148w"}},
+  "DataAnalysisToolRelationshipsPage.png": {"widths": [320, 850, 1148], "srcset": {"png": "images/main/optimized/adaptive/DataAnalysisToolRelationshipsPage-320w.png 320w, images/main/optimized/adaptive/DataAnalysisToolRelationshipsPage-850w.png 850w, images/main/optimized/adaptive/DataAnalysisToolRelationshipsPage-1148w.png 1148w", "avif": "images/main/optimized/adaptive/DataAnalysisToolRelationshipsPage-320w.avif 320w, images/main/optimized/adaptive/DataAnalysisToolRelationshipsPage-850w.avif 850w, images/main/optimized/adaptive/DataAnalysisToolRelationshipsPage-1148w.avif 1148w", "webp": "images/main/optimized/adaptive/DataAnalysisToolRelationshipsPage-320w.webp 320w, images/main/optimized/adaptive/DataAnalysisToolRelationshipsPage-850w.webp 850w, images/main/optimized/adaptive/DataAnalysisToolRelationshipsPage-1148w.webp 1148w"}},
+  "DataAnalysisToolSummarySettingsPage.png": {"widths": [320, 1148], "srcset": {"png": "images/main/optimized/adaptive/DataAnalysisToolSummarySettingsPage-320w.png 320w, images/main/optimized/adaptive/DataAnalysisToolSummarySettingsPage-1148w.png 1148w", "avif": "images/main/optimized/adaptive/DataAnalysisToolSummarySettingsPage-320w.avif 320w, images/main/optimized/adaptive/DataAnalysisToolSummarySettingsPage-1148w.avif 1148w", "webp": "images/main/optimized/adaptive/DataAnalysisToolSummarySettingsPage-320w.webp 320w, images/main/optimized/adaptive/DataAnalysisToolSummarySettingsPage-1148w.webp 1148w"}},
+  "DataAnalysisToolSummaryTablePage.png": {"widths": [320, 1367, 1881], "srcset": {"png": "images/main/optimized/adaptive/DataAnalysisToolSummaryTablePage-320w.png 320w, images/main/optimized/adaptive/DataAnalysisToolSummaryTablePage-1367w.png 1367w, images/main/optimized/adaptive/DataAnalysisToolSummaryTablePage-1881w.png 1881w", "avif": "images/main/optimized/adaptive/DataAnalysisToolSummaryTablePage-320w.avif 320w, images/main/optimized/adaptive/DataAnalysisToolSummaryTablePage-1367w.avif 1367w, images/main/optimized/adaptive/DataAnalysisToolSummaryTablePage-1881w.avif 1881w", "webp": "images/main/optimized/adaptive/DataAnalysisToolSummaryTablePage-320w.webp 320w, images/main/optimized/adaptive/DataAnalysisToolSummaryTablePage-1367w.webp 1367w, images/main/optimized/adaptive/DataAnalysisToolSummaryTablePage-1881w.webp 1881w"}},
+  "Debian-SetupSuite.png": {"widths": [320, 694, 992, 1024], "srcset": {"png": "images/main/optimized/adaptive/Debian-SetupSuite-320w.png 320w, images/main/optimized/adaptive/Debian-SetupSuite-694w.png 694w, images/main/optimized/adaptive/Debian-SetupSuite-992w.png 992w, images/main/optimized/adaptive/Debian-SetupSuite-1024w.png 1024w", "avif": "images/main/optimized/adaptive/Debian-SetupSuite-320w.avif 320w, images/main/optimized/adaptive/Debian-SetupSuite-694w.avif 694w, images/main/optimized/adaptive/Debian-SetupSuite-992w.avif 992w, images/main/optimized/adaptive/Debian-SetupSuite-1024w.avif 1024w", "webp": "images/main/optimized/adaptive/Debian-SetupSuite-320w.webp 320w, images/main/optimized/adaptive/Debian-SetupSuite-694w.webp 694w, images/main/optimized/adaptive/Debian-SetupSuite-992w.webp 992w, images/main/optimized/adaptive/Debian-SetupSuite-1024w.webp 1024w"}},
+  "DebianConstantsFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/DebianConstantsFlow-320w.png 320w, images/main/optimized/adaptive/DebianConstantsFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/DebianConstantsFlow-320w.avif 320w, images/main/optimized/adaptive/DebianConstantsFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/DebianConstantsFlow-320w.webp 320w, images/main/optimized/adaptive/DebianConstantsFlow-1920w.webp 1920w"}},
+  "DebianEditAppConfig.png": {"widths": [320, 490, 593], "srcset": {"png": "images/main/optimized/adaptive/DebianEditAppConfig-320w.png 320w, images/main/optimized/adaptive/DebianEditAppConfig-490w.png 490w, images/main/optimized/adaptive/DebianEditAppConfig-593w.png 593w", "avif": "images/main/optimized/adaptive/DebianEditAppConfig-320w.avif 320w, images/main/optimized/adaptive/DebianEditAppConfig-490w.avif 490w, images/main/optimized/adaptive/DebianEditAppConfig-593w.avif 593w", "webp": "images/main/optimized/adaptive/DebianEditAppConfig-320w.webp 320w, images/main/optimized/adaptive/DebianEditAppConfig-490w.webp 490w, images/main/optimized/adaptive/DebianEditAppConfig-593w.webp 593w"}},
+  "DebianGeneralFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/DebianGeneralFlow-320w.png 320w, images/main/optimized/adaptive/DebianGeneralFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/DebianGeneralFlow-320w.avif 320w, images/main/optimized/adaptive/DebianGeneralFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/DebianGeneralFlow-320w.webp 320w, images/main/optimized/adaptive/DebianGeneralFlow-1920w.webp 1920w"}},
+  "DebianStateMachineFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/DebianStateMachineFlow-320w.png 320w, images/main/optimized/adaptive/DebianStateMachineFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/DebianStateMachineFlow-320w.avif 320w, images/main/optimized/adaptive/DebianStateMachineFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/DebianStateMachineFlow-320w.webp 320w, images/main/optimized/adaptive/DebianStateMachineFlow-1920w.webp 1920w"}},
+  "DebianSuiteStructure.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/DebianSuiteStructure-320w.png 320w, images/main/optimized/adaptive/DebianSuiteStructure-1920w.png 1920w", "avif": "images/main/optimized/adaptive/DebianSuiteStructure-320w.avif 320w, images/main/optimized/adaptive/DebianSuiteStructure-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/DebianSuiteStructure-320w.webp 320w, images/main/optimized/adaptive/DebianSuiteStructure-1920w.webp 1920w"}},
+  "FactorAnalysisWeb.png": {"widths": [320, 1233], "srcset": {"png": "images/main/optimized/adaptive/FactorAnalysisWeb-320w.png 320w, images/main/optimized/adaptive/FactorAnalysisWeb-1233w.png 1233w", "avif": "images/main/optimized/adaptive/FactorAnalysisWeb-320w.avif 320w, images/main/optimized/adaptive/FactorAnalysisWeb-1233w.avif 1233w", "webp": "images/main/optimized/adaptive/FactorAnalysisWeb-320w.webp 320w, images/main/optimized/adaptive/FactorAnalysisWeb-1233w.webp 1233w"}},
+  "FactorInput.png": {"widths": [320, 1300], "srcset": {"png": "images/main/optimized/adaptive/FactorInput-320w.png 320w, images/main/optimized/adaptive/FactorInput-1300w.png 1300w", "avif": "images/main/optimized/adaptive/FactorInput-320w.avif 320w, images/main/optimized/adaptive/FactorInput-1300w.avif 1300w", "webp": "images/main/optimized/adaptive/FactorInput-320w.webp 320w, images/main/optimized/adaptive/FactorInput-1300w.webp 1300w"}},
+  "GenerateFlowchartFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/GenerateFlowchartFlow-320w.png 320w, images/main/optimized/adaptive/GenerateFlowchartFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/GenerateFlowchartFlow-320w.avif 320w, images/main/optimized/adaptive/GenerateFlowchartFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/GenerateFlowchartFlow-320w.webp 320w, images/main/optimized/adaptive/GenerateFlowchartFlow-1920w.webp 1920w"}},
+  "GenerateSiteDiagramsFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/GenerateSiteDiagramsFlow-320w.png 320w, images/main/optimized/adaptive/GenerateSiteDiagramsFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/GenerateSiteDiagramsFlow-320w.avif 320w, images/main/optimized/adaptive/GenerateSiteDiagramsFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/GenerateSiteDiagramsFlow-320w.webp 320w, images/main/optimized/adaptive/GenerateSiteDiagramsFlow-1920w.webp 1920w"}},
+  "Glossary.png": {"widths": [320, 1067], "srcset": {"png": "images/main/optimized/adaptive/Glossary-320w.png 320w, images/main/optimized/adaptive/Glossary-1067w.png 1067w", "avif": "images/main/optimized/adaptive/Glossary-320w.avif 320w, images/main/optimized/adaptive/Glossary-1067w.avif 1067w", "webp": "images/main/optimized/adaptive/Glossary-320w.webp 320w, images/main/optimized/adaptive/Glossary-1067w.webp 1067w"}},
+  "GreenhousePlanterBox1.png": {"widths": [309], "srcset": {"png": "images/main/optimized/adaptive/GreenhousePlanterBox1-309w.png 309w", "avif": "images/main/optimized/adaptive/GreenhousePlanterBox1-309w.avif 309w", "webp": "images/main/optimized/adaptive/GreenhousePlanterBox1-309w.webp 309w"}},
+  "GreenhousePlanterBox2.png": {"widths": [309], "srcset": {"png": "images/main/optimized/adaptive/GreenhousePlanterBox2-309w.png 309w", "avif": "images/main/optimized/adaptive/GreenhousePlanterBox2-309w.avif 309w", "webp": "images/main/optimized/adaptive/GreenhousePlanterBox2-309w.webp 309w"}},
+  "GreenhousePlanterBox3.png": {"widths": [309], "srcset": {"png": "images/main/optimized/adaptive/GreenhousePlanterBox3-309w.png 309w", "avif": "images/main/optimized/adaptive/GreenhousePlanterBox3-309w.avif 309w", "webp": "images/main/optimized/adaptive/GreenhousePlanterBox3-309w.webp 309w"}},
+  "GreenhousePlanterBox4.png": {"widths": [320, 413, 497, 577, 649, 716, 782, 868], "srcset": {"png": "images/main/optimized/adaptive/GreenhousePlanterBox4-320w.png 320w, images/main/optimized/adaptive/GreenhousePlanterBox4-413w.png 413w, images/main/optimized/adaptive/GreenhousePlanterBox4-497w.png 497w, images/main/optimized/adaptive/GreenhousePlanterBox4-577w.png 577w, images/main/optimized/adaptive/GreenhousePlanterBox4-649w.png 649w, images/main/optimized/adaptive/GreenhousePlanterBox4-716w.png 716w, images/main/optimized/adaptive/GreenhousePlanterBox4-782w.png 782w, images/main/optimized/adaptive/GreenhousePlanterBox4-868w.png 868w", "avif": "images/main/optimized/adaptive/GreenhousePlanterBox4-320w.avif 320w, images/main/optimized/adaptive/GreenhousePlanterBox4-413w.avif 413w, images/main/optimized/adaptive/GreenhousePlanterBox4-497w.avif 497w, images/main/optimized/adaptive/GreenhousePlanterBox4-577w.avif 577w, images/main/optimized/adaptive/GreenhousePlanterBox4-649w.avif 649w, images/main/optimized/adaptive/GreenhousePlanterBox4-716w.avif 716w, images/main/optimized/adaptive/GreenhousePlanterBox4-782w.avif 782w, images/main/optimized/adaptive/GreenhousePlanterBox4-868w.avif 868w", "webp": "images/main/optimized/adaptive/GreenhousePlanterBox4-320w.webp 320w, images/main/optimized/adaptive/GreenhousePlanterBox4-413w.webp 413w, images/main/optimized/adaptive/GreenhousePlanterBox4-497w.webp 497w, images/main/optimized/adaptive/GreenhousePlanterBox4-577w.webp 577w, images/main/optimized/adaptive/GreenhousePlanterBox4-649w.webp 649w, images/main/optimized/adaptive/GreenhousePlanterBox4-716w.webp 716w, images/main/optimized/adaptive/GreenhousePlanterBox4-782w.webp 782w, images/main/optimized/adaptive/GreenhousePlanterBox4-868w.webp 868w"}},
+  "GreenhousePlanterBoxesSketchUp1.png": {"widths": [320, 869, 878], "srcset": {"png": "images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp1-320w.png 320w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp1-869w.png 869w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp1-878w.png 878w", "avif": "images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp1-320w.avif 320w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp1-869w.avif 869w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp1-878w.avif 878w", "webp": "images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp1-320w.webp 320w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp1-869w.webp 869w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp1-878w.webp 878w"}},
+  "GreenhousePlanterBoxesSketchUp2.png": {"widths": [320, 887, 897], "srcset": {"png": "images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp2-320w.png 320w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp2-887w.png 887w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp2-897w.png 897w", "avif": "images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp2-320w.avif 320w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp2-887w.avif 887w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp2-897w.avif 897w", "webp": "images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp2-320w.webp 320w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp2-887w.webp 887w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp2-897w.webp 897w"}},
+  "GreenhousePlanterBoxesSketchUp3.png": {"widths": [320, 815, 877], "srcset": {"png": "images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp3-320w.png 320w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp3-815w.png 815w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp3-877w.png 877w", "avif": "images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp3-320w.avif 320w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp3-815w.avif 815w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp3-877w.avif 877w", "webp": "images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp3-320w.webp 320w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp3-815w.webp 815w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp3-877w.webp 877w"}},
+  "GreenhousePlanterBoxesSketchUp4.png": {"widths": [320, 824, 877], "srcset": {"png": "images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp4-320w.png 320w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp4-824w.png 824w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp4-877w.png 877w", "avif": "images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp4-320w.avif 320w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp4-824w.avif 824w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp4-877w.avif 877w", "webp": "images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp4-320w.webp 320w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp4-824w.webp 824w, images/main/optimized/adaptive/GreenhousePlanterBoxesSketchUp4-877w.webp 877w"}},
+  "GroupAnalysisWeb.png": {"widths": [320, 1701], "srcset": {"png": "images/main/optimized/adaptive/GroupAnalysisWeb-320w.png 320w, images/main/optimized/adaptive/GroupAnalysisWeb-1701w.png 1701w", "avif": "images/main/optimized/adaptive/GroupAnalysisWeb-320w.avif 320w, images/main/optimized/adaptive/GroupAnalysisWeb-1701w.avif 1701w", "webp": "images/main/optimized/adaptive/GroupAnalysisWeb-320w.webp 320w, images/main/optimized/adaptive/GroupAnalysisWeb-1701w.webp 1701w"}},
+  "GroupingsWeb.png": {"widths": [320, 1132, 1249], "srcset": {"png": "images/main/optimized/adaptive/GroupingsWeb-320w.png 320w, images/main/optimized/adaptive/GroupingsWeb-1132w.png 1132w, images/main/optimized/adaptive/GroupingsWeb-1249w.png 1249w", "avif": "images/main/optimized/adaptive/GroupingsWeb-320w.avif 320w, images/main/optimized/adaptive/GroupingsWeb-1132w.avif 1132w, images/main/optimized/adaptive/GroupingsWeb-1249w.avif 1249w", "webp": "images/main/optimized/adaptive/GroupingsWeb-320w.webp 320w, images/main/optimized/adaptive/GroupingsWeb-1132w.webp 1132w, images/main/optimized/adaptive/GroupingsWeb-1249w.webp 1249w"}},
+  "ImageOptimizerFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/ImageOptimizerFlow-320w.png 320w, images/main/optimized/adaptive/ImageOptimizerFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/ImageOptimizerFlow-320w.avif 320w, images/main/optimized/adaptive/ImageOptimizerFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/ImageOptimizerFlow-320w.webp 320w, images/main/optimized/adaptive/ImageOptimizerFlow-1920w.webp 1920w"}},
+  "KVM-Top.drawio.png": {"widths": [320, 419, 509, 590, 664, 741, 821, 1383], "srcset": {"png": "images/main/optimized/adaptive/KVM-Top.drawio-320w.png 320w, images/main/optimized/adaptive/KVM-Top.drawio-419w.png 419w, images/main/optimized/adaptive/KVM-Top.drawio-509w.png 509w, images/main/optimized/adaptive/KVM-Top.drawio-590w.png 590w, images/main/optimized/adaptive/KVM-Top.drawio-664w.png 664w, images/main/optimized/adaptive/KVM-Top.drawio-741w.png 741w, images/main/optimized/adaptive/KVM-Top.drawio-821w.png 821w, images/main/optimized/adaptive/KVM-Top.drawio-1383w.png 1383w", "avif": "images/main/optimized/adaptive/KVM-Top.drawio-320w.avif 320w, images/main/optimized/adaptive/KVM-Top.drawio-419w.avif 419w, images/main/optimized/adaptive/KVM-Top.drawio-509w.avif 509w, images/main/optimized/adaptive/KVM-Top.drawio-590w.avif 590w, images/main/optimized/adaptive/KVM-Top.drawio-664w.avif 664w, images/main/optimized/adaptive/KVM-Top.drawio-741w.avif 741w, images/main/optimized/adaptive/KVM-Top.drawio-821w.avif 821w, images/main/optimized/adaptive/KVM-Top.drawio-1383w.avif 1383w", "webp": "images/main/optimized/adaptive/KVM-Top.drawio-320w.webp 320w, images/main/optimized/adaptive/KVM-Top.drawio-419w.webp 419w, images/main/optimized/adaptive/KVM-Top.drawio-509w.webp 509w, images/main/optimized/adaptive/KVM-Top.drawio-590w.webp 590w, images/main/optimized/adaptive/KVM-Top.drawio-664w.webp 664w, images/main/optimized/adaptive/KVM-Top.drawio-741w.webp 741w, images/main/optimized/adaptive/KVM-Top.drawio-821w.webp 821w, images/main/optimized/adaptive/KVM-Top.drawio-1383w.webp 1383w"}},
+  "LanguageTranslator.png": {"widths": [320, 881, 1024], "srcset": {"png": "images/main/optimized/adaptive/LanguageTranslator-320w.png 320w, images/main/optimized/adaptive/LanguageTranslator-881w.png 881w, images/main/optimized/adaptive/LanguageTranslator-1024w.png 1024w", "avif": "images/main/optimized/adaptive/LanguageTranslator-320w.avif 320w, images/main/optimized/adaptive/LanguageTranslator-881w.avif 881w, images/main/optimized/adaptive/LanguageTranslator-1024w.avif 1024w", "webp": "images/main/optimized/adaptive/LanguageTranslator-320w.webp 320w, images/main/optimized/adaptive/LanguageTranslator-881w.webp 881w, images/main/optimized/adaptive/LanguageTranslator-1024w.webp 1024w"}},
+  "LanguageTranslatorFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/LanguageTranslatorFlow-320w.png 320w, images/main/optimized/adaptive/LanguageTranslatorFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/LanguageTranslatorFlow-320w.avif 320w, images/main/optimized/adaptive/LanguageTranslatorFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/LanguageTranslatorFlow-320w.webp 320w, images/main/optimized/adaptive/LanguageTranslatorFlow-1920w.webp 1920w"}},
+  "LanguageTranslatorHTMLStructure.png": {"widths": [320, 1232, 1920], "srcset": {"png": "images/main/optimized/adaptive/LanguageTranslatorHTMLStructure-320w.png 320w, images/main/optimized/adaptive/LanguageTranslatorHTMLStructure-1232w.png 1232w, images/main/optimized/adaptive/LanguageTranslatorHTMLStructure-1920w.png 1920w", "avif": "images/main/optimized/adaptive/LanguageTranslatorHTMLStructure-320w.avif 320w, images/main/optimized/adaptive/LanguageTranslatorHTMLStructure-1232w.avif 1232w, images/main/optimized/adaptive/LanguageTranslatorHTMLStructure-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/LanguageTranslatorHTMLStructure-320w.webp 320w, images/main/optimized/adaptive/LanguageTranslatorHTMLStructure-1232w.webp 1232w, images/main/optimized/adaptive/LanguageTranslatorHTMLStructure-1920w.webp 1920w"}},
+  "NetworkScannerFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/NetworkScannerFlow-320w.png 320w, images/main/optimized/adaptive/NetworkScannerFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/NetworkScannerFlow-320w.avif 320w, images/main/optimized/adaptive/NetworkScannerFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/NetworkScannerFlow-320w.webp 320w, images/main/optimized/adaptive/NetworkScannerFlow-1920w.webp 1920w"}},
+  "PopulateGlossary.png": {"widths": [320, 1146, 1300], "srcset": {"png": "images/main/optimized/adaptive/PopulateGlossary-320w.png 320w, images/main/optimized/adaptive/PopulateGlossary-1146w.png 1146w, images/main/optimized/adaptive/PopulateGlossary-1300w.png 1300w", "avif": "images/main/optimized/adaptive/PopulateGlossary-320w.avif 320w, images/main/optimized/adaptive/PopulateGlossary-1146w.avif 1146w, images/main/optimized/adaptive/PopulateGlossary-1300w.avif 1300w", "webp": "images/main/optimized/adaptive/PopulateGlossary-320w.webp 320w, images/main/optimized/adaptive/PopulateGlossary-1146w.webp 1146w, images/main/optimized/adaptive/PopulateGlossary-1300w.webp 1300w"}},
+  "PortfolioWebsiteProjectPage.png": {"widths": [320, 737, 855], "srcset": {"png": "images/main/optimized/adaptive/PortfolioWebsiteProjectPage-320w.png 320w, images/main/optimized/adaptive/PortfolioWebsiteProjectPage-737w.png 737w, images/main/optimized/adaptive/PortfolioWebsiteProjectPage-855w.png 855w", "avif": "images/main/optimized/adaptive/PortfolioWebsiteProjectPage-320w.avif 320w, images/main/optimized/adaptive/PortfolioWebsiteProjectPage-737w.avif 737w, images/main/optimized/adaptive/PortfolioWebsiteProjectPage-855w.avif 855w", "webp": "images/main/optimized/adaptive/PortfolioWebsiteProjectPage-320w.webp 320w, images/main/optimized/adaptive/PortfolioWebsiteProjectPage-737w.webp 737w, images/main/optimized/adaptive/PortfolioWebsiteProjectPage-855w.webp 855w"}},
+  "PowerShell-CloudBackup.png": {"widths": [320, 1175, 1536], "srcset": {"png": "images/main/optimized/adaptive/PowerShell-CloudBackup-320w.png 320w, images/main/optimized/adaptive/PowerShell-CloudBackup-1175w.png 1175w, images/main/optimized/adaptive/PowerShell-CloudBackup-1536w.png 1536w", "avif": "images/main/optimized/adaptive/PowerShell-CloudBackup-320w.avif 320w, images/main/optimized/adaptive/PowerShell-CloudBackup-1175w.avif 1175w, images/main/optimized/adaptive/PowerShell-CloudBackup-1536w.avif 1536w", "webp": "images/main/optimized/adaptive/PowerShell-CloudBackup-320w.webp 320w, images/main/optimized/adaptive/PowerShell-CloudBackup-1175w.webp 1175w, images/main/optimized/adaptive/PowerShell-CloudBackup-1536w.webp 1536w"}},
+  "PromptForgeApiFlow.png": {"widths": [320, 1670, 1920], "srcset": {"png": "images/main/optimized/adaptive/PromptForgeApiFlow-320w.png 320w, images/main/optimized/adaptive/PromptForgeApiFlow-1670w.png 1670w, images/main/optimized/adaptive/PromptForgeApiFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/PromptForgeApiFlow-320w.avif 320w, images/main/optimized/adaptive/PromptForgeApiFlow-1670w.avif 1670w, images/main/optimized/adaptive/PromptForgeApiFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/PromptForgeApiFlow-320w.webp 320w, images/main/optimized/adaptive/PromptForgeApiFlow-1670w.webp 1670w, images/main/optimized/adaptive/PromptForgeApiFlow-1920w.webp 1920w"}},
+  "PromptForgeBatch.png": {"widths": [320, 989, 1114], "srcset": {"png": "images/main/optimized/adaptive/PromptForgeBatch-320w.png 320w, images/main/optimized/adaptive/PromptForgeBatch-989w.png 989w, images/main/optimized/adaptive/PromptForgeBatch-1114w.png 1114w", "avif": "images/main/optimized/adaptive/PromptForgeBatch-320w.avif 320w, images/main/optimized/adaptive/PromptForgeBatch-989w.avif 989w, images/main/optimized/adaptive/PromptForgeBatch-1114w.avif 1114w", "webp": "images/main/optimized/adaptive/PromptForgeBatch-320w.webp 320w, images/main/optimized/adaptive/PromptForgeBatch-989w.webp 989w, images/main/optimized/adaptive/PromptForgeBatch-1114w.webp 1114w"}},
+  "PromptForgeFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/PromptForgeFlow-320w.png 320w, images/main/optimized/adaptive/PromptForgeFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/PromptForgeFlow-320w.avif 320w, images/main/optimized/adaptive/PromptForgeFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/PromptForgeFlow-320w.webp 320w, images/main/optimized/adaptive/PromptForgeFlow-1920w.webp 1920w"}},
+  "PromptForgeForm.png": {"widths": [320, 1397], "srcset": {"png": "images/main/optimized/adaptive/PromptForgeForm-320w.png 320w, images/main/optimized/adaptive/PromptForgeForm-1397w.png 1397w", "avif": "images/main/optimized/adaptive/PromptForgeForm-320w.avif 320w, images/main/optimized/adaptive/PromptForgeForm-1397w.avif 1397w", "webp": "images/main/optimized/adaptive/PromptForgeForm-320w.webp 320w, images/main/optimized/adaptive/PromptForgeForm-1397w.webp 1397w"}},
+  "PromptForgeGenerateFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/PromptForgeGenerateFlow-320w.png 320w, images/main/optimized/adaptive/PromptForgeGenerateFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/PromptForgeGenerateFlow-320w.avif 320w, images/main/optimized/adaptive/PromptForgeGenerateFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/PromptForgeGenerateFlow-320w.webp 320w, images/main/optimized/adaptive/PromptForgeGenerateFlow-1920w.webp 1920w"}},
+  "PromptForgeIndexStructure.png": {"widths": [320, 1432, 1920], "srcset": {"png": "images/main/optimized/adaptive/PromptForgeIndexStructure-320w.png 320w, images/main/optimized/adaptive/PromptForgeIndexStructure-1432w.png 1432w, images/main/optimized/adaptive/PromptForgeIndexStructure-1920w.png 1920w", "avif": "images/main/optimized/adaptive/PromptForgeIndexStructure-320w.avif 320w, images/main/optimized/adaptive/PromptForgeIndexStructure-1432w.avif 1432w, images/main/optimized/adaptive/PromptForgeIndexStructure-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/PromptForgeIndexStructure-320w.webp 320w, images/main/optimized/adaptive/PromptForgeIndexStructure-1432w.webp 1432w, images/main/optimized/adaptive/PromptForgeIndexStructure-1920w.webp 1920w"}},
+  "PromptForgePreview.png": {"widths": [320, 791, 1114], "srcset": {"png": "images/main/optimized/adaptive/PromptForgePreview-320w.png 320w, images/main/optimized/adaptive/PromptForgePreview-791w.png 791w, images/main/optimized/adaptive/PromptForgePreview-1114w.png 1114w", "avif": "images/main/optimized/adaptive/PromptForgePreview-320w.avif 320w, images/main/optimized/adaptive/PromptForgePreview-791w.avif 791w, images/main/optimized/adaptive/PromptForgePreview-1114w.avif 1114w", "webp": "images/main/optimized/adaptive/PromptForgePreview-320w.webp 320w, images/main/optimized/adaptive/PromptForgePreview-791w.webp 791w, images/main/optimized/adaptive/PromptForgePreview-1114w.webp 1114w"}},
+  "PromptForgeProfileLoader.png": {"widths": [320, 1397], "srcset": {"png": "images/main/optimized/adaptive/PromptForgeProfileLoader-320w.png 320w, images/main/optimized/adaptive/PromptForgeProfileLoader-1397w.png 1397w", "avif": "images/main/optimized/adaptive/PromptForgeProfileLoader-320w.avif 320w, images/main/optimized/adaptive/PromptForgeProfileLoader-1397w.avif 1397w", "webp": "images/main/optimized/adaptive/PromptForgeProfileLoader-320w.webp 320w, images/main/optimized/adaptive/PromptForgeProfileLoader-1397w.webp 1397w"}},
+  "PromptForgeProfileStructure.png": {"widths": [320, 1657, 1920], "srcset": {"png": "images/main/optimized/adaptive/PromptForgeProfileStructure-320w.png 320w, images/main/optimized/adaptive/PromptForgeProfileStructure-1657w.png 1657w, images/main/optimized/adaptive/PromptForgeProfileStructure-1920w.png 1920w", "avif": "images/main/optimized/adaptive/PromptForgeProfileStructure-320w.avif 320w, images/main/optimized/adaptive/PromptForgeProfileStructure-1657w.avif 1657w, images/main/optimized/adaptive/PromptForgeProfileStructure-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/PromptForgeProfileStructure-320w.webp 320w, images/main/optimized/adaptive/PromptForgeProfileStructure-1657w.webp 1657w, images/main/optimized/adaptive/PromptForgeProfileStructure-1920w.webp 1920w"}},
+  "Quiz-web.png": {"widths": [320, 470], "srcset": {"png": "images/main/optimized/adaptive/Quiz-web-320w.png 320w, images/main/optimized/adaptive/Quiz-web-470w.png 470w", "avif": "images/main/optimized/adaptive/Quiz-web-320w.avif 320w, images/main/optimized/adaptive/Quiz-web-470w.avif 470w", "webp": "images/main/optimized/adaptive/Quiz-web-320w.webp 320w, images/main/optimized/adaptive/Quiz-web-470w.webp 470w"}},
+  "QuizCleanFlow.png": {"widths": [320, 1695, 1920], "srcset": {"png": "images/main/optimized/adaptive/QuizCleanFlow-320w.png 320w, images/main/optimized/adaptive/QuizCleanFlow-1695w.png 1695w, images/main/optimized/adaptive/QuizCleanFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/QuizCleanFlow-320w.avif 320w, images/main/optimized/adaptive/QuizCleanFlow-1695w.avif 1695w, images/main/optimized/adaptive/QuizCleanFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/QuizCleanFlow-320w.webp 320w, images/main/optimized/adaptive/QuizCleanFlow-1695w.webp 1695w, images/main/optimized/adaptive/QuizCleanFlow-1920w.webp 1920w"}},
+  "QuizCreatorScreenShot-Excel.png": {"widths": [320, 932, 1172], "srcset": {"png": "images/main/optimized/adaptive/QuizCreatorScreenShot-Excel-320w.png 320w, images/main/optimized/adaptive/QuizCreatorScreenShot-Excel-932w.png 932w, images/main/optimized/adaptive/QuizCreatorScreenShot-Excel-1172w.png 1172w", "avif": "images/main/optimized/adaptive/QuizCreatorScreenShot-Excel-320w.avif 320w, images/main/optimized/adaptive/QuizCreatorScreenShot-Excel-932w.avif 932w, images/main/optimized/adaptive/QuizCreatorScreenShot-Excel-1172w.avif 1172w", "webp": "images/main/optimized/adaptive/QuizCreatorScreenShot-Excel-320w.webp 320w, images/main/optimized/adaptive/QuizCreatorScreenShot-Excel-932w.webp 932w, images/main/optimized/adaptive/QuizCreatorScreenShot-Excel-1172w.webp 1172w"}},
+  "QuizCreatorScreenShot-QuizExcelSheetDefine.png": {"widths": [320, 557, 740, 884], "srcset": {"png": "images/main/optimized/adaptive/QuizCreatorScreenShot-QuizExcelSheetDefine-320w.png 320w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizExcelSheetDefine-557w.png 557w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizExcelSheetDefine-740w.png 740w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizExcelSheetDefine-884w.png 884w", "avif": "images/main/optimized/adaptive/QuizCreatorScreenShot-QuizExcelSheetDefine-320w.avif 320w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizExcelSheetDefine-557w.avif 557w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizExcelSheetDefine-740w.avif 740w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizExcelSheetDefine-884w.avif 884w", "webp": "images/main/optimized/adaptive/QuizCreatorScreenShot-QuizExcelSheetDefine-320w.webp 320w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizExcelSheetDefine-557w.webp 557w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizExcelSheetDefine-740w.webp 740w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizExcelSheetDefine-884w.webp 884w"}},
+  "QuizCreatorScreenShot-QuizIndex.png": {"widths": [320, 891], "srcset": {"png": "images/main/optimized/adaptive/QuizCreatorScreenShot-QuizIndex-320w.png 320w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizIndex-891w.png 891w", "avif": "images/main/optimized/adaptive/QuizCreatorScreenShot-QuizIndex-320w.avif 320w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizIndex-891w.avif 891w", "webp": "images/main/optimized/adaptive/QuizCreatorScreenShot-QuizIndex-320w.webp 320w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizIndex-891w.webp 891w"}},
+  "QuizCreatorScreenShot-QuizPostAns.png": {"widths": [320, 852], "srcset": {"png": "images/main/optimized/adaptive/QuizCreatorScreenShot-QuizPostAns-320w.png 320w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizPostAns-852w.png 852w", "avif": "images/main/optimized/adaptive/QuizCreatorScreenShot-QuizPostAns-320w.avif 320w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizPostAns-852w.avif 852w", "webp": "images/main/optimized/adaptive/QuizCreatorScreenShot-QuizPostAns-320w.webp 320w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizPostAns-852w.webp 852w"}},
+  "QuizCreatorScreenShot-QuizRedsults.png": {"widths": [320, 835], "srcset": {"png": "images/main/optimized/adaptive/QuizCreatorScreenShot-QuizRedsults-320w.png 320w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizRedsults-835w.png 835w", "avif": "images/main/optimized/adaptive/QuizCreatorScreenShot-QuizRedsults-320w.avif 320w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizRedsults-835w.avif 835w", "webp": "images/main/optimized/adaptive/QuizCreatorScreenShot-QuizRedsults-320w.webp 320w, images/main/optimized/adaptive/QuizCreatorScreenShot-QuizRedsults-835w.webp 835w"}},
+  "QuizCreatorStructure.png": {"widths": [320, 1345, 1920], "srcset": {"png": "images/main/optimized/adaptive/QuizCreatorStructure-320w.png 320w, images/main/optimized/adaptive/QuizCreatorStructure-1345w.png 1345w, images/main/optimized/adaptive/QuizCreatorStructure-1920w.png 1920w", "avif": "images/main/optimized/adaptive/QuizCreatorStructure-320w.avif 320w, images/main/optimized/adaptive/QuizCreatorStructure-1345w.avif 1345w, images/main/optimized/adaptive/QuizCreatorStructure-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/QuizCreatorStructure-320w.webp 320w, images/main/optimized/adaptive/QuizCreatorStructure-1345w.webp 1345w, images/main/optimized/adaptive/QuizCreatorStructure-1920w.webp 1920w"}},
+  "QuizImportFlow.png": {"widths": [320, 1845, 1920], "srcset": {"png": "images/main/optimized/adaptive/QuizImportFlow-320w.png 320w, images/main/optimized/adaptive/QuizImportFlow-1845w.png 1845w, images/main/optimized/adaptive/QuizImportFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/QuizImportFlow-320w.avif 320w, images/main/optimized/adaptive/QuizImportFlow-1845w.avif 1845w, images/main/optimized/adaptive/QuizImportFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/QuizImportFlow-320w.webp 320w, images/main/optimized/adaptive/QuizImportFlow-1845w.webp 1845w, images/main/optimized/adaptive/QuizImportFlow-1920w.webp 1920w"}},
+  "RiskModelCreatorWeb.png": {"widths": [320, 1150], "srcset": {"png": "images/main/optimized/adaptive/RiskModelCreatorWeb-320w.png 320w, images/main/optimized/adaptive/RiskModelCreatorWeb-1150w.png 1150w", "avif": "images/main/optimized/adaptive/RiskModelCreatorWeb-320w.avif 320w, images/main/optimized/adaptive/RiskModelCreatorWeb-1150w.avif 1150w", "webp": "images/main/optimized/adaptive/RiskModelCreatorWeb-320w.webp 320w, images/main/optimized/adaptive/RiskModelCreatorWeb-1150w.webp 1150w"}},
+  "SearchToolHTMLStructure.png": {"widths": [320, 1292, 1876], "srcset": {"png": "images/main/optimized/adaptive/SearchToolHTMLStructure-320w.png 320w, images/main/optimized/adaptive/SearchToolHTMLStructure-1292w.png 1292w, images/main/optimized/adaptive/SearchToolHTMLStructure-1876w.png 1876w", "avif": "images/main/optimized/adaptive/SearchToolHTMLStructure-320w.avif 320w, images/main/optimized/adaptive/SearchToolHTMLStructure-1292w.avif 1292w, images/main/optimized/adaptive/SearchToolHTMLStructure-1876w.avif 1876w", "webp": "images/main/optimized/adaptive/SearchToolHTMLStructure-320w.webp 320w, images/main/optimized/adaptive/SearchToolHTMLStructure-1292w.webp 1292w, images/main/optimized/adaptive/SearchToolHTMLStructure-1876w.webp 1876w"}},
+  "SiteHTMLStructure.png": {"widths": [320, 1607, 1920], "srcset": {"png": "images/main/optimized/adaptive/SiteHTMLStructure-320w.png 320w, images/main/optimized/adaptive/SiteHTMLStructure-1607w.png 1607w, images/main/optimized/adaptive/SiteHTMLStructure-1920w.png 1920w", "avif": "images/main/optimized/adaptive/SiteHTMLStructure-320w.avif 320w, images/main/optimized/adaptive/SiteHTMLStructure-1607w.avif 1607w, images/main/optimized/adaptive/SiteHTMLStructure-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/SiteHTMLStructure-320w.webp 320w, images/main/optimized/adaptive/SiteHTMLStructure-1607w.webp 1607w, images/main/optimized/adaptive/SiteHTMLStructure-1920w.webp 1920w"}},
+  "SiteJSMainPages.png": {"widths": [320, 1595, 1920], "srcset": {"png": "images/main/optimized/adaptive/SiteJSMainPages-320w.png 320w, images/main/optimized/adaptive/SiteJSMainPages-1595w.png 1595w, images/main/optimized/adaptive/SiteJSMainPages-1920w.png 1920w", "avif": "images/main/optimized/adaptive/SiteJSMainPages-320w.avif 320w, images/main/optimized/adaptive/SiteJSMainPages-1595w.avif 1595w, images/main/optimized/adaptive/SiteJSMainPages-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/SiteJSMainPages-320w.webp 320w, images/main/optimized/adaptive/SiteJSMainPages-1595w.webp 1595w, images/main/optimized/adaptive/SiteJSMainPages-1920w.webp 1920w"}},
+  "SiteJSProjectPages.png": {"widths": [320, 1482, 1920], "srcset": {"png": "images/main/optimized/adaptive/SiteJSProjectPages-320w.png 320w, images/main/optimized/adaptive/SiteJSProjectPages-1482w.png 1482w, images/main/optimized/adaptive/SiteJSProjectPages-1920w.png 1920w", "avif": "images/main/optimized/adaptive/SiteJSProjectPages-320w.avif 320w, images/main/optimized/adaptive/SiteJSProjectPages-1482w.avif 1482w, images/main/optimized/adaptive/SiteJSProjectPages-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/SiteJSProjectPages-320w.webp 320w, images/main/optimized/adaptive/SiteJSProjectPages-1482w.webp 1482w, images/main/optimized/adaptive/SiteJSProjectPages-1920w.webp 1920w"}},
+  "SpanishTranslatorStructure.png": {"widths": [320, 1432, 1920], "srcset": {"png": "images/main/optimized/adaptive/SpanishTranslatorStructure-320w.png 320w, images/main/optimized/adaptive/SpanishTranslatorStructure-1432w.png 1432w, images/main/optimized/adaptive/SpanishTranslatorStructure-1920w.png 1920w", "avif": "images/main/optimized/adaptive/SpanishTranslatorStructure-320w.avif 320w, images/main/optimized/adaptive/SpanishTranslatorStructure-1432w.avif 1432w, images/main/optimized/adaptive/SpanishTranslatorStructure-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/SpanishTranslatorStructure-320w.webp 320w, images/main/optimized/adaptive/SpanishTranslatorStructure-1432w.webp 1432w, images/main/optimized/adaptive/SpanishTranslatorStructure-1920w.webp 1920w"}},
+  "SubGroupAnalysisWeb.png": {"widths": [320, 1632, 1698], "srcset": {"png": "images/main/optimized/adaptive/SubGroupAnalysisWeb-320w.png 320w, images/main/optimized/adaptive/SubGroupAnalysisWeb-1632w.png 1632w, images/main/optimized/adaptive/SubGroupAnalysisWeb-1698w.png 1698w", "avif": "images/main/optimized/adaptive/SubGroupAnalysisWeb-320w.avif 320w, images/main/optimized/adaptive/SubGroupAnalysisWeb-1632w.avif 1632w, images/main/optimized/adaptive/SubGroupAnalysisWeb-1698w.avif 1698w", "webp": "images/main/optimized/adaptive/SubGroupAnalysisWeb-320w.webp 320w, images/main/optimized/adaptive/SubGroupAnalysisWeb-1632w.webp 1632w, images/main/optimized/adaptive/SubGroupAnalysisWeb-1698w.webp 1698w"}},
+  "TACleanFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/TACleanFlow-320w.png 320w, images/main/optimized/adaptive/TACleanFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/TACleanFlow-320w.avif 320w, images/main/optimized/adaptive/TACleanFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/TACleanFlow-320w.webp 320w, images/main/optimized/adaptive/TACleanFlow-1920w.webp 1920w"}},
+  "TAImportFlow.png": {"widths": [320, 1620], "srcset": {"png": "images/main/optimized/adaptive/TAImportFlow-320w.png 320w, images/main/optimized/adaptive/TAImportFlow-1620w.png 1620w", "avif": "images/main/optimized/adaptive/TAImportFlow-320w.avif 320w, images/main/optimized/adaptive/TAImportFlow-1620w.avif 1620w", "webp": "images/main/optimized/adaptive/TAImportFlow-320w.webp 320w, images/main/optimized/adaptive/TAImportFlow-1620w.webp 1620w"}},
+  "TAWebUpdateFlow.png": {"widths": [320, 1290, 1656], "srcset": {"png": "images/main/optimized/adaptive/TAWebUpdateFlow-320w.png 320w, images/main/optimized/adaptive/TAWebUpdateFlow-1290w.png 1290w, images/main/optimized/adaptive/TAWebUpdateFlow-1656w.png 1656w", "avif": "images/main/optimized/adaptive/TAWebUpdateFlow-320w.avif 320w, images/main/optimized/adaptive/TAWebUpdateFlow-1290w.avif 1290w, images/main/optimized/adaptive/TAWebUpdateFlow-1656w.avif 1656w", "webp": "images/main/optimized/adaptive/TAWebUpdateFlow-320w.webp 320w, images/main/optimized/adaptive/TAWebUpdateFlow-1290w.webp 1290w, images/main/optimized/adaptive/TAWebUpdateFlow-1656w.webp 1656w"}},
+  "TerraceGardensSketchUp1.png": {"widths": [320, 786, 1095, 1360, 1620, 1777], "srcset": {"png": "images/main/optimized/adaptive/TerraceGardensSketchUp1-320w.png 320w, images/main/optimized/adaptive/TerraceGardensSketchUp1-786w.png 786w, images/main/optimized/adaptive/TerraceGardensSketchUp1-1095w.png 1095w, images/main/optimized/adaptive/TerraceGardensSketchUp1-1360w.png 1360w, images/main/optimized/adaptive/TerraceGardensSketchUp1-1620w.png 1620w, images/main/optimized/adaptive/TerraceGardensSketchUp1-1777w.png 1777w", "avif": "images/main/optimized/adaptive/TerraceGardensSketchUp1-320w.avif 320w, images/main/optimized/adaptive/TerraceGardensSketchUp1-786w.avif 786w, images/main/optimized/adaptive/TerraceGardensSketchUp1-1095w.avif 1095w, images/main/optimized/adaptive/TerraceGardensSketchUp1-1360w.avif 1360w, images/main/optimized/adaptive/TerraceGardensSketchUp1-1620w.avif 1620w, images/main/optimized/adaptive/TerraceGardensSketchUp1-1777w.avif 1777w", "webp": "images/main/optimized/adaptive/TerraceGardensSketchUp1-320w.webp 320w, images/main/optimized/adaptive/TerraceGardensSketchUp1-786w.webp 786w, images/main/optimized/adaptive/TerraceGardensSketchUp1-1095w.webp 1095w, images/main/optimized/adaptive/TerraceGardensSketchUp1-1360w.webp 1360w, images/main/optimized/adaptive/TerraceGardensSketchUp1-1620w.webp 1620w, images/main/optimized/adaptive/TerraceGardensSketchUp1-1777w.webp 1777w"}},
+  "TerraceGardensSketchUp2.png": {"widths": [320, 731, 1018, 1258, 1489, 1720, 1786], "srcset": {"png": "images/main/optimized/adaptive/TerraceGardensSketchUp2-320w.png 320w, images/main/optimized/adaptive/TerraceGardensSketchUp2-731w.png 731w, images/main/optimized/adaptive/TerraceGardensSketchUp2-1018w.png 1018w, images/main/optimized/adaptive/TerraceGardensSketchUp2-1258w.png 1258w, images/main/optimized/adaptive/TerraceGardensSketchUp2-1489w.png 1489w, images/main/optimized/adaptive/TerraceGardensSketchUp2-1720w.png 1720w, images/main/optimized/adaptive/TerraceGardensSketchUp2-1786w.png 1786w", "avif": "images/main/optimized/adaptive/TerraceGardensSketchUp2-320w.avif 320w, images/main/optimized/adaptive/TerraceGardensSketchUp2-731w.avif 731w, images/main/optimized/adaptive/TerraceGardensSketchUp2-1018w.avif 1018w, images/main/optimized/adaptive/TerraceGardensSketchUp2-1258w.avif 1258w, images/main/optimized/adaptive/TerraceGardensSketchUp2-1489w.avif 1489w, images/main/optimized/adaptive/TerraceGardensSketchUp2-1720w.avif 1720w, images/main/optimized/adaptive/TerraceGardensSketchUp2-1786w.avif 1786w", "webp": "images/main/optimized/adaptive/TerraceGardensSketchUp2-320w.webp 320w, images/main/optimized/adaptive/TerraceGardensSketchUp2-731w.webp 731w, images/main/optimized/adaptive/TerraceGardensSketchUp2-1018w.webp 1018w, images/main/optimized/adaptive/TerraceGardensSketchUp2-1258w.webp 1258w, images/main/optimized/adaptive/TerraceGardensSketchUp2-1489w.webp 1489w, images/main/optimized/adaptive/TerraceGardensSketchUp2-1720w.webp 1720w, images/main/optimized/adaptive/TerraceGardensSketchUp2-1786w.webp 1786w"}},
+  "TerraceGardensSketchUp3.png": {"widths": [320, 678, 941, 1016], "srcset": {"png": "images/main/optimized/adaptive/TerraceGardensSketchUp3-320w.png 320w, images/main/optimized/adaptive/TerraceGardensSketchUp3-678w.png 678w, images/main/optimized/adaptive/TerraceGardensSketchUp3-941w.png 941w, images/main/optimized/adaptive/TerraceGardensSketchUp3-1016w.png 1016w", "avif": "images/main/optimized/adaptive/TerraceGardensSketchUp3-320w.avif 320w, images/main/optimized/adaptive/TerraceGardensSketchUp3-678w.avif 678w, images/main/optimized/adaptive/TerraceGardensSketchUp3-941w.avif 941w, images/main/optimized/adaptive/TerraceGardensSketchUp3-1016w.avif 1016w", "webp": "images/main/optimized/adaptive/TerraceGardensSketchUp3-320w.webp 320w, images/main/optimized/adaptive/TerraceGardensSketchUp3-678w.webp 678w, images/main/optimized/adaptive/TerraceGardensSketchUp3-941w.webp 941w, images/main/optimized/adaptive/TerraceGardensSketchUp3-1016w.webp 1016w"}},
+  "TerraceGardensSketchUp4.png": {"widths": [320, 733, 998, 1016], "srcset": {"png": "images/main/optimized/adaptive/TerraceGardensSketchUp4-320w.png 320w, images/main/optimized/adaptive/TerraceGardensSketchUp4-733w.png 733w, images/main/optimized/adaptive/TerraceGardensSketchUp4-998w.png 998w, images/main/optimized/adaptive/TerraceGardensSketchUp4-1016w.png 1016w", "avif": "images/main/optimized/adaptive/TerraceGardensSketchUp4-320w.avif 320w, images/main/optimized/adaptive/TerraceGardensSketchUp4-733w.avif 733w, images/main/optimized/adaptive/TerraceGardensSketchUp4-998w.avif 998w, images/main/optimized/adaptive/TerraceGardensSketchUp4-1016w.avif 1016w", "webp": "images/main/optimized/adaptive/TerraceGardensSketchUp4-320w.webp 320w, images/main/optimized/adaptive/TerraceGardensSketchUp4-733w.webp 733w, images/main/optimized/adaptive/TerraceGardensSketchUp4-998w.webp 998w, images/main/optimized/adaptive/TerraceGardensSketchUp4-1016w.webp 1016w"}},
+  "TestingTools.png": {"widths": [320, 760, 1024], "srcset": {"png": "images/main/optimized/adaptive/TestingTools-320w.png 320w, images/main/optimized/adaptive/TestingTools-760w.png 760w, images/main/optimized/adaptive/TestingTools-1024w.png 1024w", "avif": "images/main/optimized/adaptive/TestingTools-320w.avif 320w, images/main/optimized/adaptive/TestingTools-760w.avif 760w, images/main/optimized/adaptive/TestingTools-1024w.avif 1024w", "webp": "images/main/optimized/adaptive/TestingTools-320w.webp 320w, images/main/optimized/adaptive/TestingTools-760w.webp 760w, images/main/optimized/adaptive/TestingTools-1024w.webp 1024w"}},
+  "TestingToolsConfigLink.png": {"widths": [320, 900], "srcset": {"png": "images/main/optimized/adaptive/TestingToolsConfigLink-320w.png 320w, images/main/optimized/adaptive/TestingToolsConfigLink-900w.png 900w", "avif": "images/main/optimized/adaptive/TestingToolsConfigLink-320w.avif 320w, images/main/optimized/adaptive/TestingToolsConfigLink-900w.avif 900w", "webp": "images/main/optimized/adaptive/TestingToolsConfigLink-320w.webp 320w, images/main/optimized/adaptive/TestingToolsConfigLink-900w.webp 900w"}},
+  "TestingToolsConstantsFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/TestingToolsConstantsFlow-320w.png 320w, images/main/optimized/adaptive/TestingToolsConstantsFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/TestingToolsConstantsFlow-320w.avif 320w, images/main/optimized/adaptive/TestingToolsConstantsFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/TestingToolsConstantsFlow-320w.webp 320w, images/main/optimized/adaptive/TestingToolsConstantsFlow-1920w.webp 1920w"}},
+  "TestingToolsGeneralFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/TestingToolsGeneralFlow-320w.png 320w, images/main/optimized/adaptive/TestingToolsGeneralFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/TestingToolsGeneralFlow-320w.avif 320w, images/main/optimized/adaptive/TestingToolsGeneralFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/TestingToolsGeneralFlow-320w.webp 320w, images/main/optimized/adaptive/TestingToolsGeneralFlow-1920w.webp 1920w"}},
+  "TestingToolsStateMachineFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/TestingToolsStateMachineFlow-320w.png 320w, images/main/optimized/adaptive/TestingToolsStateMachineFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/TestingToolsStateMachineFlow-320w.avif 320w, images/main/optimized/adaptive/TestingToolsStateMachineFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/TestingToolsStateMachineFlow-320w.webp 320w, images/main/optimized/adaptive/TestingToolsStateMachineFlow-1920w.webp 1920w"}},
+  "TestingToolsStructure.png": {"widths": [320, 1245, 1920], "srcset": {"png": "images/main/optimized/adaptive/TestingToolsStructure-320w.png 320w, images/main/optimized/adaptive/TestingToolsStructure-1245w.png 1245w, images/main/optimized/adaptive/TestingToolsStructure-1920w.png 1920w", "avif": "images/main/optimized/adaptive/TestingToolsStructure-320w.avif 320w, images/main/optimized/adaptive/TestingToolsStructure-1245w.avif 1245w, images/main/optimized/adaptive/TestingToolsStructure-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/TestingToolsStructure-320w.webp 320w, images/main/optimized/adaptive/TestingToolsStructure-1245w.webp 1245w, images/main/optimized/adaptive/TestingToolsStructure-1920w.webp 1920w"}},
+  "TextCreator.png": {"widths": [320, 782, 1024], "srcset": {"png": "images/main/optimized/adaptive/TextCreator-320w.png 320w, images/main/optimized/adaptive/TextCreator-782w.png 782w, images/main/optimized/adaptive/TextCreator-1024w.png 1024w", "avif": "images/main/optimized/adaptive/TextCreator-320w.avif 320w, images/main/optimized/adaptive/TextCreator-782w.avif 782w, images/main/optimized/adaptive/TextCreator-1024w.avif 1024w", "webp": "images/main/optimized/adaptive/TextCreator-320w.webp 320w, images/main/optimized/adaptive/TextCreator-782w.webp 782w, images/main/optimized/adaptive/TextCreator-1024w.webp 1024w"}},
+  "TextCreatorExport.png": {"widths": [320, 879, 938], "srcset": {"png": "images/main/optimized/adaptive/TextCreatorExport-320w.png 320w, images/main/optimized/adaptive/TextCreatorExport-879w.png 879w, images/main/optimized/adaptive/TextCreatorExport-938w.png 938w", "avif": "images/main/optimized/adaptive/TextCreatorExport-320w.avif 320w, images/main/optimized/adaptive/TextCreatorExport-879w.avif 879w, images/main/optimized/adaptive/TextCreatorExport-938w.avif 938w", "webp": "images/main/optimized/adaptive/TextCreatorExport-320w.webp 320w, images/main/optimized/adaptive/TextCreatorExport-879w.webp 879w, images/main/optimized/adaptive/TextCreatorExport-938w.webp 938w"}},
+  "TextCreatorFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/TextCreatorFlow-320w.png 320w, images/main/optimized/adaptive/TextCreatorFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/TextCreatorFlow-320w.avif 320w, images/main/optimized/adaptive/TextCreatorFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/TextCreatorFlow-320w.webp 320w, images/main/optimized/adaptive/TextCreatorFlow-1920w.webp 1920w"}},
+  "TextCreatorForm.png": {"widths": [320, 1149], "srcset": {"png": "images/main/optimized/adaptive/TextCreatorForm-320w.png 320w, images/main/optimized/adaptive/TextCreatorForm-1149w.png 1149w", "avif": "images/main/optimized/adaptive/TextCreatorForm-320w.avif 320w, images/main/optimized/adaptive/TextCreatorForm-1149w.avif 1149w", "webp": "images/main/optimized/adaptive/TextCreatorForm-320w.webp 320w, images/main/optimized/adaptive/TextCreatorForm-1149w.webp 1149w"}},
+  "TextCreatorIndexStructure.png": {"widths": [320, 1632, 1920], "srcset": {"png": "images/main/optimized/adaptive/TextCreatorIndexStructure-320w.png 320w, images/main/optimized/adaptive/TextCreatorIndexStructure-1632w.png 1632w, images/main/optimized/adaptive/TextCreatorIndexStructure-1920w.png 1920w", "avif": "images/main/optimized/adaptive/TextCreatorIndexStructure-320w.avif 320w, images/main/optimized/adaptive/TextCreatorIndexStructure-1632w.avif 1632w, images/main/optimized/adaptive/TextCreatorIndexStructure-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/TextCreatorIndexStructure-320w.webp 320w, images/main/optimized/adaptive/TextCreatorIndexStructure-1632w.webp 1632w, images/main/optimized/adaptive/TextCreatorIndexStructure-1920w.webp 1920w"}},
+  "TextCreatorPiper.png": {"widths": [320, 1402], "srcset": {"png": "images/main/optimized/adaptive/TextCreatorPiper-320w.png 320w, images/main/optimized/adaptive/TextCreatorPiper-1402w.png 1402w", "avif": "images/main/optimized/adaptive/TextCreatorPiper-320w.avif 320w, images/main/optimized/adaptive/TextCreatorPiper-1402w.avif 1402w", "webp": "images/main/optimized/adaptive/TextCreatorPiper-320w.webp 320w, images/main/optimized/adaptive/TextCreatorPiper-1402w.webp 1402w"}},
+  "TextCreatorPreview.png": {"widths": [320, 565, 738, 865, 1015, 1149], "srcset": {"png": "images/main/optimized/adaptive/TextCreatorPreview-320w.png 320w, images/main/optimized/adaptive/TextCreatorPreview-565w.png 565w, images/main/optimized/adaptive/TextCreatorPreview-738w.png 738w, images/main/optimized/adaptive/TextCreatorPreview-865w.png 865w, images/main/optimized/adaptive/TextCreatorPreview-1015w.png 1015w, images/main/optimized/adaptive/TextCreatorPreview-1149w.png 1149w", "avif": "images/main/optimized/adaptive/TextCreatorPreview-320w.avif 320w, images/main/optimized/adaptive/TextCreatorPreview-565w.avif 565w, images/main/optimized/adaptive/TextCreatorPreview-738w.avif 738w, images/main/optimized/adaptive/TextCreatorPreview-865w.avif 865w, images/main/optimized/adaptive/TextCreatorPreview-1015w.avif 1015w, images/main/optimized/adaptive/TextCreatorPreview-1149w.avif 1149w", "webp": "images/main/optimized/adaptive/TextCreatorPreview-320w.webp 320w, images/main/optimized/adaptive/TextCreatorPreview-565w.webp 565w, images/main/optimized/adaptive/TextCreatorPreview-738w.webp 738w, images/main/optimized/adaptive/TextCreatorPreview-865w.webp 865w, images/main/optimized/adaptive/TextCreatorPreview-1015w.webp 1015w, images/main/optimized/adaptive/TextCreatorPreview-1149w.webp 1149w"}},
+  "TextCreatorProfileBuilder.png": {"widths": [320, 1127, 1420], "srcset": {"png": "images/main/optimized/adaptive/TextCreatorProfileBuilder-320w.png 320w, images/main/optimized/adaptive/TextCreatorProfileBuilder-1127w.png 1127w, images/main/optimized/adaptive/TextCreatorProfileBuilder-1420w.png 1420w", "avif": "images/main/optimized/adaptive/TextCreatorProfileBuilder-320w.avif 320w, images/main/optimized/adaptive/TextCreatorProfileBuilder-1127w.avif 1127w, images/main/optimized/adaptive/TextCreatorProfileBuilder-1420w.avif 1420w", "webp": "images/main/optimized/adaptive/TextCreatorProfileBuilder-320w.webp 320w, images/main/optimized/adaptive/TextCreatorProfileBuilder-1127w.webp 1127w, images/main/optimized/adaptive/TextCreatorProfileBuilder-1420w.webp 1420w"}},
+  "TextCreatorProfileLoader.png": {"widths": [320, 1282, 1420], "srcset": {"png": "images/main/optimized/adaptive/TextCreatorProfileLoader-320w.png 320w, images/main/optimized/adaptive/TextCreatorProfileLoader-1282w.png 1282w, images/main/optimized/adaptive/TextCreatorProfileLoader-1420w.png 1420w", "avif": "images/main/optimized/adaptive/TextCreatorProfileLoader-320w.avif 320w, images/main/optimized/adaptive/TextCreatorProfileLoader-1282w.avif 1282w, images/main/optimized/adaptive/TextCreatorProfileLoader-1420w.avif 1420w", "webp": "images/main/optimized/adaptive/TextCreatorProfileLoader-320w.webp 320w, images/main/optimized/adaptive/TextCreatorProfileLoader-1282w.webp 1282w, images/main/optimized/adaptive/TextCreatorProfileLoader-1420w.webp 1420w"}},
+  "TextCreatorProfileStructure.png": {"widths": [320, 1670, 1920], "srcset": {"png": "images/main/optimized/adaptive/TextCreatorProfileStructure-320w.png 320w, images/main/optimized/adaptive/TextCreatorProfileStructure-1670w.png 1670w, images/main/optimized/adaptive/TextCreatorProfileStructure-1920w.png 1920w", "avif": "images/main/optimized/adaptive/TextCreatorProfileStructure-320w.avif 320w, images/main/optimized/adaptive/TextCreatorProfileStructure-1670w.avif 1670w, images/main/optimized/adaptive/TextCreatorProfileStructure-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/TextCreatorProfileStructure-320w.webp 320w, images/main/optimized/adaptive/TextCreatorProfileStructure-1670w.webp 1670w, images/main/optimized/adaptive/TextCreatorProfileStructure-1920w.webp 1920w"}},
+  "Thematic-WebApp.png": {"widths": [320, 661, 944, 1024], "srcset": {"png": "images/main/optimized/adaptive/Thematic-WebApp-320w.png 320w, images/main/optimized/adaptive/Thematic-WebApp-661w.png 661w, images/main/optimized/adaptive/Thematic-WebApp-944w.png 944w, images/main/optimized/adaptive/Thematic-WebApp-1024w.png 1024w", "avif": "images/main/optimized/adaptive/Thematic-WebApp-320w.avif 320w, images/main/optimized/adaptive/Thematic-WebApp-661w.avif 661w, images/main/optimized/adaptive/Thematic-WebApp-944w.avif 944w, images/main/optimized/adaptive/Thematic-WebApp-1024w.avif 1024w", "webp": "images/main/optimized/adaptive/Thematic-WebApp-320w.webp 320w, images/main/optimized/adaptive/Thematic-WebApp-661w.webp 661w, images/main/optimized/adaptive/Thematic-WebApp-944w.webp 944w, images/main/optimized/adaptive/Thematic-WebApp-1024w.webp 1024w"}},
+  "ThematicAnalysisDataFlow.png": {"widths": [320, 1582, 1920], "srcset": {"png": "images/main/optimized/adaptive/ThematicAnalysisDataFlow-320w.png 320w, images/main/optimized/adaptive/ThematicAnalysisDataFlow-1582w.png 1582w, images/main/optimized/adaptive/ThematicAnalysisDataFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/ThematicAnalysisDataFlow-320w.avif 320w, images/main/optimized/adaptive/ThematicAnalysisDataFlow-1582w.avif 1582w, images/main/optimized/adaptive/ThematicAnalysisDataFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/ThematicAnalysisDataFlow-320w.webp 320w, images/main/optimized/adaptive/ThematicAnalysisDataFlow-1582w.webp 1582w, images/main/optimized/adaptive/ThematicAnalysisDataFlow-1920w.webp 1920w"}},
+  "ThematicAnalysisHTMLStructure.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/ThematicAnalysisHTMLStructure-320w.png 320w, images/main/optimized/adaptive/ThematicAnalysisHTMLStructure-1920w.png 1920w", "avif": "images/main/optimized/adaptive/ThematicAnalysisHTMLStructure-320w.avif 320w, images/main/optimized/adaptive/ThematicAnalysisHTMLStructure-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/ThematicAnalysisHTMLStructure-320w.webp 320w, images/main/optimized/adaptive/ThematicAnalysisHTMLStructure-1920w.webp 1920w"}},
+  "ThematicAnalysisIntial.png": {"widths": [320, 978, 1428, 1799, 1853], "srcset": {"png": "images/main/optimized/adaptive/ThematicAnalysisIntial-320w.png 320w, images/main/optimized/adaptive/ThematicAnalysisIntial-978w.png 978w, images/main/optimized/adaptive/ThematicAnalysisIntial-1428w.png 1428w, images/main/optimized/adaptive/ThematicAnalysisIntial-1799w.png 1799w, images/main/optimized/adaptive/ThematicAnalysisIntial-1853w.png 1853w", "avif": "images/main/optimized/adaptive/ThematicAnalysisIntial-320w.avif 320w, images/main/optimized/adaptive/ThematicAnalysisIntial-978w.avif 978w, images/main/optimized/adaptive/ThematicAnalysisIntial-1428w.avif 1428w, images/main/optimized/adaptive/ThematicAnalysisIntial-1799w.avif 1799w, images/main/optimized/adaptive/ThematicAnalysisIntial-1853w.avif 1853w", "webp": "images/main/optimized/adaptive/ThematicAnalysisIntial-320w.webp 320w, images/main/optimized/adaptive/ThematicAnalysisIntial-978w.webp 978w, images/main/optimized/adaptive/ThematicAnalysisIntial-1428w.webp 1428w, images/main/optimized/adaptive/ThematicAnalysisIntial-1799w.webp 1799w, images/main/optimized/adaptive/ThematicAnalysisIntial-1853w.webp 1853w"}},
+  "ThematicAnalysisJSPages.png": {"widths": [320, 1445, 1920], "srcset": {"png": "images/main/optimized/adaptive/ThematicAnalysisJSPages-320w.png 320w, images/main/optimized/adaptive/ThematicAnalysisJSPages-1445w.png 1445w, images/main/optimized/adaptive/ThematicAnalysisJSPages-1920w.png 1920w", "avif": "images/main/optimized/adaptive/ThematicAnalysisJSPages-320w.avif 320w, images/main/optimized/adaptive/ThematicAnalysisJSPages-1445w.avif 1445w, images/main/optimized/adaptive/ThematicAnalysisJSPages-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/ThematicAnalysisJSPages-320w.webp 320w, images/main/optimized/adaptive/ThematicAnalysisJSPages-1445w.webp 1445w, images/main/optimized/adaptive/ThematicAnalysisJSPages-1920w.webp 1920w"}},
+  "ThematicAnalysisStructureEDR.png": {"widths": [320, 917], "srcset": {"png": "images/main/optimized/adaptive/ThematicAnalysisStructureEDR-320w.png 320w, images/main/optimized/adaptive/ThematicAnalysisStructureEDR-917w.png 917w", "avif": "images/main/optimized/adaptive/ThematicAnalysisStructureEDR-320w.avif 320w, images/main/optimized/adaptive/ThematicAnalysisStructureEDR-917w.avif 917w", "webp": "images/main/optimized/adaptive/ThematicAnalysisStructureEDR-320w.webp 320w, images/main/optimized/adaptive/ThematicAnalysisStructureEDR-917w.webp 917w"}},
+  "ThematicWebResults.png": {"widths": [320, 1032, 1181], "srcset": {"png": "images/main/optimized/adaptive/ThematicWebResults-320w.png 320w, images/main/optimized/adaptive/ThematicWebResults-1032w.png 1032w, images/main/optimized/adaptive/ThematicWebResults-1181w.png 1181w", "avif": "images/main/optimized/adaptive/ThematicWebResults-320w.avif 320w, images/main/optimized/adaptive/ThematicWebResults-1032w.avif 1032w, images/main/optimized/adaptive/ThematicWebResults-1181w.avif 1181w", "webp": "images/main/optimized/adaptive/ThematicWebResults-320w.webp 320w, images/main/optimized/adaptive/ThematicWebResults-1032w.webp 1032w, images/main/optimized/adaptive/ThematicWebResults-1181w.webp 1181w"}},
+  "TranslatorPlayback.png": {"widths": [320, 1134], "srcset": {"png": "images/main/optimized/adaptive/TranslatorPlayback-320w.png 320w, images/main/optimized/adaptive/TranslatorPlayback-1134w.png 1134w", "avif": "images/main/optimized/adaptive/TranslatorPlayback-320w.avif 320w, images/main/optimized/adaptive/TranslatorPlayback-1134w.avif 1134w", "webp": "images/main/optimized/adaptive/TranslatorPlayback-320w.webp 320w, images/main/optimized/adaptive/TranslatorPlayback-1134w.webp 1134w"}},
+  "TranslatorTranslate.png": {"widths": [320, 1054, 1279], "srcset": {"png": "images/main/optimized/adaptive/TranslatorTranslate-320w.png 320w, images/main/optimized/adaptive/TranslatorTranslate-1054w.png 1054w, images/main/optimized/adaptive/TranslatorTranslate-1279w.png 1279w", "avif": "images/main/optimized/adaptive/TranslatorTranslate-320w.avif 320w, images/main/optimized/adaptive/TranslatorTranslate-1054w.avif 1054w, images/main/optimized/adaptive/TranslatorTranslate-1279w.avif 1279w", "webp": "images/main/optimized/adaptive/TranslatorTranslate-320w.webp 320w, images/main/optimized/adaptive/TranslatorTranslate-1054w.webp 1054w, images/main/optimized/adaptive/TranslatorTranslate-1279w.webp 1279w"}},
+  "UpdateCatSubCat.png": {"widths": [320, 798, 1149], "srcset": {"png": "images/main/optimized/adaptive/UpdateCatSubCat-320w.png 320w, images/main/optimized/adaptive/UpdateCatSubCat-798w.png 798w, images/main/optimized/adaptive/UpdateCatSubCat-1149w.png 1149w", "avif": "images/main/optimized/adaptive/UpdateCatSubCat-320w.avif 320w, images/main/optimized/adaptive/UpdateCatSubCat-798w.avif 798w, images/main/optimized/adaptive/UpdateCatSubCat-1149w.avif 1149w", "webp": "images/main/optimized/adaptive/UpdateCatSubCat-320w.webp 320w, images/main/optimized/adaptive/UpdateCatSubCat-798w.webp 798w, images/main/optimized/adaptive/UpdateCatSubCat-1149w.webp 1149w"}},
+  "UpdateGroupSubGroup.png": {"widths": [320, 894, 1300, 1626, 1823], "srcset": {"png": "images/main/optimized/adaptive/UpdateGroupSubGroup-320w.png 320w, images/main/optimized/adaptive/UpdateGroupSubGroup-894w.png 894w, images/main/optimized/adaptive/UpdateGroupSubGroup-1300w.png 1300w, images/main/optimized/adaptive/UpdateGroupSubGroup-1626w.png 1626w, images/main/optimized/adaptive/UpdateGroupSubGroup-1823w.png 1823w", "avif": "images/main/optimized/adaptive/UpdateGroupSubGroup-320w.avif 320w, images/main/optimized/adaptive/UpdateGroupSubGroup-894w.avif 894w, images/main/optimized/adaptive/UpdateGroupSubGroup-1300w.avif 1300w, images/main/optimized/adaptive/UpdateGroupSubGroup-1626w.avif 1626w, images/main/optimized/adaptive/UpdateGroupSubGroup-1823w.avif 1823w", "webp": "images/main/optimized/adaptive/UpdateGroupSubGroup-320w.webp 320w, images/main/optimized/adaptive/UpdateGroupSubGroup-894w.webp 894w, images/main/optimized/adaptive/UpdateGroupSubGroup-1300w.webp 1300w, images/main/optimized/adaptive/UpdateGroupSubGroup-1626w.webp 1626w, images/main/optimized/adaptive/UpdateGroupSubGroup-1823w.webp 1823w"}},
+  "UpdateSearchTool.png": {"widths": [320, 742], "srcset": {"png": "images/main/optimized/adaptive/UpdateSearchTool-320w.png 320w, images/main/optimized/adaptive/UpdateSearchTool-742w.png 742w", "avif": "images/main/optimized/adaptive/UpdateSearchTool-320w.avif 320w, images/main/optimized/adaptive/UpdateSearchTool-742w.avif 742w", "webp": "images/main/optimized/adaptive/UpdateSearchTool-320w.webp 320w, images/main/optimized/adaptive/UpdateSearchTool-742w.webp 742w"}},
+  "VegeGardenBoxesSketchUp1.png": {"widths": [320, 897, 1245], "srcset": {"png": "images/main/optimized/adaptive/VegeGardenBoxesSketchUp1-320w.png 320w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp1-897w.png 897w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp1-1245w.png 1245w", "avif": "images/main/optimized/adaptive/VegeGardenBoxesSketchUp1-320w.avif 320w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp1-897w.avif 897w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp1-1245w.avif 1245w", "webp": "images/main/optimized/adaptive/VegeGardenBoxesSketchUp1-320w.webp 320w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp1-897w.webp 897w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp1-1245w.webp 1245w"}},
+  "VegeGardenBoxesSketchUp2.png": {"widths": [320, 959, 1251], "srcset": {"png": "images/main/optimized/adaptive/VegeGardenBoxesSketchUp2-320w.png 320w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp2-959w.png 959w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp2-1251w.png 1251w", "avif": "images/main/optimized/adaptive/VegeGardenBoxesSketchUp2-320w.avif 320w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp2-959w.avif 959w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp2-1251w.avif 1251w", "webp": "images/main/optimized/adaptive/VegeGardenBoxesSketchUp2-320w.webp 320w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp2-959w.webp 959w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp2-1251w.webp 1251w"}},
+  "VegeGardenBoxesSketchUp3.png": {"widths": [320, 900, 1227], "srcset": {"png": "images/main/optimized/adaptive/VegeGardenBoxesSketchUp3-320w.png 320w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp3-900w.png 900w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp3-1227w.png 1227w", "avif": "images/main/optimized/adaptive/VegeGardenBoxesSketchUp3-320w.avif 320w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp3-900w.avif 900w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp3-1227w.avif 1227w", "webp": "images/main/optimized/adaptive/VegeGardenBoxesSketchUp3-320w.webp 320w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp3-900w.webp 900w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp3-1227w.webp 1227w"}},
+  "VegeGardenBoxesSketchUp4.png": {"widths": [320, 933, 1122], "srcset": {"png": "images/main/optimized/adaptive/VegeGardenBoxesSketchUp4-320w.png 320w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp4-933w.png 933w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp4-1122w.png 1122w", "avif": "images/main/optimized/adaptive/VegeGardenBoxesSketchUp4-320w.avif 320w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp4-933w.avif 933w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp4-1122w.avif 1122w", "webp": "images/main/optimized/adaptive/VegeGardenBoxesSketchUp4-320w.webp 320w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp4-933w.webp 933w, images/main/optimized/adaptive/VegeGardenBoxesSketchUp4-1122w.webp 1122w"}},
+  "VerticalGreenhouseSketchUp1.png": {"widths": [320, 745], "srcset": {"png": "images/main/optimized/adaptive/VerticalGreenhouseSketchUp1-320w.png 320w, images/main/optimized/adaptive/VerticalGreenhouseSketchUp1-745w.png 745w", "avif": "images/main/optimized/adaptive/VerticalGreenhouseSketchUp1-320w.avif 320w, images/main/optimized/adaptive/VerticalGreenhouseSketchUp1-745w.avif 745w", "webp": "images/main/optimized/adaptive/VerticalGreenhouseSketchUp1-320w.webp 320w, images/main/optimized/adaptive/VerticalGreenhouseSketchUp1-745w.webp 745w"}},
+  "VerticalGreenhouseSketchUp2.png": {"widths": [320, 1008, 1080], "srcset": {"png": "images/main/optimized/adaptive/VerticalGreenhouseSketchUp2-320w.png 320w, images/main/optimized/adaptive/VerticalGreenhouseSketchUp2-1008w.png 1008w, images/main/optimized/adaptive/VerticalGreenhouseSketchUp2-1080w.png 1080w", "avif": "images/main/optimized/adaptive/VerticalGreenhouseSketchUp2-320w.avif 320w, images/main/optimized/adaptive/VerticalGreenhouseSketchUp2-1008w.avif 1008w, images/main/optimized/adaptive/VerticalGreenhouseSketchUp2-1080w.avif 1080w", "webp": "images/main/optimized/adaptive/VerticalGreenhouseSketchUp2-320w.webp 320w, images/main/optimized/adaptive/VerticalGreenhouseSketchUp2-1008w.webp 1008w, images/main/optimized/adaptive/VerticalGreenhouseSketchUp2-1080w.webp 1080w"}},
+  "VerticalGreenhouseSketchUp3.png": {"widths": [320, 1022], "srcset": {"png": "images/main/optimized/adaptive/VerticalGreenhouseSketchUp3-320w.png 320w, images/main/optimized/adaptive/VerticalGreenhouseSketchUp3-1022w.png 1022w", "avif": "images/main/optimized/adaptive/VerticalGreenhouseSketchUp3-320w.avif 320w, images/main/optimized/adaptive/VerticalGreenhouseSketchUp3-1022w.avif 1022w", "webp": "images/main/optimized/adaptive/VerticalGreenhouseSketchUp3-320w.webp 320w, images/main/optimized/adaptive/VerticalGreenhouseSketchUp3-1022w.webp 1022w"}},
+  "WebSearchTool.png": {"widths": [320, 1061], "srcset": {"png": "images/main/optimized/adaptive/WebSearchTool-320w.png 320w, images/main/optimized/adaptive/WebSearchTool-1061w.png 1061w", "avif": "images/main/optimized/adaptive/WebSearchTool-320w.avif 320w, images/main/optimized/adaptive/WebSearchTool-1061w.avif 1061w", "webp": "images/main/optimized/adaptive/WebSearchTool-320w.webp 320w, images/main/optimized/adaptive/WebSearchTool-1061w.webp 1061w"}},
+  "WiFiScannerFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/WiFiScannerFlow-320w.png 320w, images/main/optimized/adaptive/WiFiScannerFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/WiFiScannerFlow-320w.avif 320w, images/main/optimized/adaptive/WiFiScannerFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/WiFiScannerFlow-320w.webp 320w, images/main/optimized/adaptive/WiFiScannerFlow-1920w.webp 1920w"}},
+  "carouselFlow.png": {"widths": [320, 1597], "srcset": {"png": "images/main/optimized/adaptive/carouselFlow-320w.png 320w, images/main/optimized/adaptive/carouselFlow-1597w.png 1597w", "avif": "images/main/optimized/adaptive/carouselFlow-320w.avif 320w, images/main/optimized/adaptive/carouselFlow-1597w.avif 1597w", "webp": "images/main/optimized/adaptive/carouselFlow-320w.webp 320w, images/main/optimized/adaptive/carouselFlow-1597w.webp 1597w"}},
+  "embedSketchfabFlow.png": {"widths": [320, 1635], "srcset": {"png": "images/main/optimized/adaptive/embedSketchfabFlow-320w.png 320w, images/main/optimized/adaptive/embedSketchfabFlow-1635w.png 1635w", "avif": "images/main/optimized/adaptive/embedSketchfabFlow-320w.avif 320w, images/main/optimized/adaptive/embedSketchfabFlow-1635w.avif 1635w", "webp": "images/main/optimized/adaptive/embedSketchfabFlow-320w.webp 320w, images/main/optimized/adaptive/embedSketchfabFlow-1635w.webp 1635w"}},
+  "footerIconLoaderFlow.png": {"widths": [320, 1596], "srcset": {"png": "images/main/optimized/adaptive/footerIconLoaderFlow-320w.png 320w, images/main/optimized/adaptive/footerIconLoaderFlow-1596w.png 1596w", "avif": "images/main/optimized/adaptive/footerIconLoaderFlow-320w.avif 320w, images/main/optimized/adaptive/footerIconLoaderFlow-1596w.avif 1596w", "webp": "images/main/optimized/adaptive/footerIconLoaderFlow-320w.webp 320w, images/main/optimized/adaptive/footerIconLoaderFlow-1596w.webp 1596w"}},
+  "githubAppLoaderFlow.png": {"widths": [320, 1573], "srcset": {"png": "images/main/optimized/adaptive/githubAppLoaderFlow-320w.png 320w, images/main/optimized/adaptive/githubAppLoaderFlow-1573w.png 1573w", "avif": "images/main/optimized/adaptive/githubAppLoaderFlow-320w.avif 320w, images/main/optimized/adaptive/githubAppLoaderFlow-1573w.avif 1573w", "webp": "images/main/optimized/adaptive/githubAppLoaderFlow-320w.webp 320w, images/main/optimized/adaptive/githubAppLoaderFlow-1573w.webp 1573w"}},
+  "initFlow.png": {"widths": [320, 1604], "srcset": {"png": "images/main/optimized/adaptive/initFlow-320w.png 320w, images/main/optimized/adaptive/initFlow-1604w.png 1604w", "avif": "images/main/optimized/adaptive/initFlow-320w.avif 320w, images/main/optimized/adaptive/initFlow-1604w.avif 1604w", "webp": "images/main/optimized/adaptive/initFlow-320w.webp 320w, images/main/optimized/adaptive/initFlow-1604w.webp 1604w"}},
+  "mainTextLoaderFlow.png": {"widths": [320, 1573], "srcset": {"png": "images/main/optimized/adaptive/mainTextLoaderFlow-320w.png 320w, images/main/optimized/adaptive/mainTextLoaderFlow-1573w.png 1573w", "avif": "images/main/optimized/adaptive/mainTextLoaderFlow-320w.avif 320w, images/main/optimized/adaptive/mainTextLoaderFlow-1573w.avif 1573w", "webp": "images/main/optimized/adaptive/mainTextLoaderFlow-320w.webp 320w, images/main/optimized/adaptive/mainTextLoaderFlow-1573w.webp 1573w"}},
+  "menuToggleFlow.png": {"widths": [320, 1075], "srcset": {"png": "images/main/optimized/adaptive/menuToggleFlow-320w.png 320w, images/main/optimized/adaptive/menuToggleFlow-1075w.png 1075w", "avif": "images/main/optimized/adaptive/menuToggleFlow-320w.avif 320w, images/main/optimized/adaptive/menuToggleFlow-1075w.avif 1075w", "webp": "images/main/optimized/adaptive/menuToggleFlow-320w.webp 320w, images/main/optimized/adaptive/menuToggleFlow-1075w.webp 1075w"}},
+  "modalZoomFlow.png": {"widths": [320, 1616], "srcset": {"png": "images/main/optimized/adaptive/modalZoomFlow-320w.png 320w, images/main/optimized/adaptive/modalZoomFlow-1616w.png 1616w", "avif": "images/main/optimized/adaptive/modalZoomFlow-320w.avif 320w, images/main/optimized/adaptive/modalZoomFlow-1616w.avif 1616w", "webp": "images/main/optimized/adaptive/modalZoomFlow-320w.webp 320w, images/main/optimized/adaptive/modalZoomFlow-1616w.webp 1616w"}},
+  "projectLinksLoaderFlow.png": {"widths": [320, 1608], "srcset": {"png": "images/main/optimized/adaptive/projectLinksLoaderFlow-320w.png 320w, images/main/optimized/adaptive/projectLinksLoaderFlow-1608w.png 1608w", "avif": "images/main/optimized/adaptive/projectLinksLoaderFlow-320w.avif 320w, images/main/optimized/adaptive/projectLinksLoaderFlow-1608w.avif 1608w", "webp": "images/main/optimized/adaptive/projectLinksLoaderFlow-320w.webp 320w, images/main/optimized/adaptive/projectLinksLoaderFlow-1608w.webp 1608w"}},
+  "projectListLoaderFlow.png": {"widths": [320, 1920], "srcset": {"png": "images/main/optimized/adaptive/projectListLoaderFlow-320w.png 320w, images/main/optimized/adaptive/projectListLoaderFlow-1920w.png 1920w", "avif": "images/main/optimized/adaptive/projectListLoaderFlow-320w.avif 320w, images/main/optimized/adaptive/projectListLoaderFlow-1920w.avif 1920w", "webp": "images/main/optimized/adaptive/projectListLoaderFlow-320w.webp 320w, images/main/optimized/adaptive/projectListLoaderFlow-1920w.webp 1920w"}},
+  "projectStepsDataFlow.png": {"widths": [320, 1584], "srcset": {"png": "images/main/optimized/adaptive/projectStepsDataFlow-320w.png 320w, images/main/optimized/adaptive/projectStepsDataFlow-1584w.png 1584w", "avif": "images/main/optimized/adaptive/projectStepsDataFlow-320w.avif 320w, images/main/optimized/adaptive/projectStepsDataFlow-1584w.avif 1584w", "webp": "images/main/optimized/adaptive/projectStepsDataFlow-320w.webp 320w, images/main/optimized/adaptive/projectStepsDataFlow-1584w.webp 1584w"}},
+  "promptForge.png": {"widths": [320, 918, 1487, 1536], "srcset": {"png": "images/main/optimized/adaptive/promptForge-320w.png 320w, images/main/optimized/adaptive/promptForge-918w.png 918w, images/main/optimized/adaptive/promptForge-1487w.png 1487w, images/main/optimized/adaptive/promptForge-1536w.png 1536w", "avif": "images/main/optimized/adaptive/promptForge-320w.avif 320w, images/main/optimized/adaptive/promptForge-918w.avif 918w, images/main/optimized/adaptive/promptForge-1487w.avif 1487w, images/main/optimized/adaptive/promptForge-1536w.avif 1536w", "webp": "images/main/optimized/adaptive/promptForge-320w.webp 320w, images/main/optimized/adaptive/promptForge-918w.webp 918w, images/main/optimized/adaptive/promptForge-1487w.webp 1487w, images/main/optimized/adaptive/promptForge-1536w.webp 1536w"}},
+  "quizWebUpdateFlow.png": {"widths": [320, 1545, 1595], "srcset": {"png": "images/main/optimized/adaptive/quizWebUpdateFlow-320w.png 320w, images/main/optimized/adaptive/quizWebUpdateFlow-1545w.png 1545w, images/main/optimized/adaptive/quizWebUpdateFlow-1595w.png 1595w", "avif": "images/main/optimized/adaptive/quizWebUpdateFlow-320w.avif 320w, images/main/optimized/adaptive/quizWebUpdateFlow-1545w.avif 1545w, images/main/optimized/adaptive/quizWebUpdateFlow-1595w.avif 1595w", "webp": "images/main/optimized/adaptive/quizWebUpdateFlow-320w.webp 320w, images/main/optimized/adaptive/quizWebUpdateFlow-1545w.webp 1545w, images/main/optimized/adaptive/quizWebUpdateFlow-1595w.webp 1595w"}},
+  "responsiveImageLoaderFlow.png": {"widths": [320, 1577], "srcset": {"png": "images/main/optimized/adaptive/responsiveImageLoaderFlow-320w.png 320w, images/main/optimized/adaptive/responsiveImageLoaderFlow-1577w.png 1577w", "avif": "images/main/optimized/adaptive/responsiveImageLoaderFlow-320w.avif 320w, images/main/optimized/adaptive/responsiveImageLoaderFlow-1577w.avif 1577w", "webp": "images/main/optimized/adaptive/responsiveImageLoaderFlow-320w.webp 320w, images/main/optimized/adaptive/responsiveImageLoaderFlow-1577w.webp 1577w"}},
+  "resumeLoaderFlow.png": {"widths": [320, 1575], "srcset": {"png": "images/main/optimized/adaptive/resumeLoaderFlow-320w.png 320w, images/main/optimized/adaptive/resumeLoaderFlow-1575w.png 1575w", "avif": "images/main/optimized/adaptive/resumeLoaderFlow-320w.avif 320w, images/main/optimized/adaptive/resumeLoaderFlow-1575w.avif 1575w", "webp": "images/main/optimized/adaptive/resumeLoaderFlow-320w.webp 320w, images/main/optimized/adaptive/resumeLoaderFlow-1575w.webp 1575w"}},
+  "sharepointGPS.png": {"widths": [320, 512], "srcset": {"png": "images/main/optimized/adaptive/sharepointGPS-320w.png 320w, images/main/optimized/adaptive/sharepointGPS-512w.png 512w", "avif": "images/main/optimized/adaptive/sharepointGPS-320w.avif 320w, images/main/optimized/adaptive/sharepointGPS-512w.avif 512w", "webp": "images/main/optimized/adaptive/sharepointGPS-320w.webp 320w, images/main/optimized/adaptive/sharepointGPS-512w.webp 512w"}},
+  "skillsLoaderFlow.png": {"widths": [320, 1573], "srcset": {"png": "images/main/optimized/adaptive/skillsLoaderFlow-320w.png 320w, images/main/optimized/adaptive/skillsLoaderFlow-1573w.png 1573w", "avif": "images/main/optimized/adaptive/skillsLoaderFlow-320w.avif 320w, images/main/optimized/adaptive/skillsLoaderFlow-1573w.avif 1573w", "webp": "images/main/optimized/adaptive/skillsLoaderFlow-320w.webp 320w, images/main/optimized/adaptive/skillsLoaderFlow-1573w.webp 1573w"}},
+  "themeToggleFlow.png": {"widths": [320, 1383, 1669], "srcset": {"png": "images/main/optimized/adaptive/themeToggleFlow-320w.png 320w, images/main/optimized/adaptive/themeToggleFlow-1383w.png 1383w, images/main/optimized/adaptive/themeToggleFlow-1669w.png 1669w", "avif": "images/main/optimized/adaptive/themeToggleFlow-320w.avif 320w, images/main/optimized/adaptive/themeToggleFlow-1383w.avif 1383w, images/main/optimized/adaptive/themeToggleFlow-1669w.avif 1669w", "webp": "images/main/optimized/adaptive/themeToggleFlow-320w.webp 320w, images/main/optimized/adaptive/themeToggleFlow-1383w.webp 1383w, images/main/optimized/adaptive/themeToggleFlow-1669w.webp 1669w"}},
+};
@@ -1,5 +1,31 @@
 // js/carousel.js
 
+// Content-hashed names written by Image-Optimizer.py (projects/js/JSON/imageFingerprints.js)
+// while fingerprinting is on; URLs missing from it are used unchanged
+const CAROUSEL_FINGERPRINTS = typeof IMAGE_FINGERPRINTS !== "undefined" ? IMAGE_FINGERPRINTS : {};
+
+// Return the fingerprinted URL of an optimized image, if it has one
+function carouselImageUrl(url) {
+  return CAROUSEL_FINGERPRINTS[url] || url;
+}
+
+// Extra formats built per image, written by Image-Optimizer.py (projects/js/JSON/imageManifest.js);
+// images missing from it get only their original format
+const CAROUSEL_IMAGE_MANIFEST = typeof IMAGE_MANIFEST !== "undefined" ? IMAGE_MANIFEST : {};
+
+// Per-image widths chosen by Image-Optimizer.py (projects/js/JSON/srcsetManifest.js);
+// images missing from it fall back to the fixed device breakpoints
+const CAROUSEL_SRCSETS = typeof SRCSET_MANIFEST !== "undefined" ? SRCSET_MANIFEST : {};
+
+// Rendered width of a carousel image (it fills the slide), for srcset selection
+const CAROUSEL_IMAGE_SIZES = "100vw";
+
+// Modern encodings in order of preference; the browser picks the first type it supports
+const CAROUSEL_MODERN_FORMATS = [
+  { ext: "avif", type: "image/avif" },
+  { ext: "webp", type: "image/webp" }
+];
+
 document.addEventListener("DOMContentLoaded", () => {
   const carousels = document.querySelectorAll(".carousel-container");
 
@@ -53,6 +79,13 @@ document.addEventListener("DOMContentLoaded", () => {
 
     const responsiveImages = slideTrack.querySelectorAll(".responsive-carousel-image");
 
+    // Responsive image sources based on screen width
+    const breakpoints = [
+      { media: "(min-width: 1280px)", folder: "desktop" },
+      { media: "(min-width: 1024px)", folder: "laptop" },
+      { media: "(min-width: 480px)",  folder: "mobile" }
+    ];
+
     responsiveImages.forEach((element, index) => {
       const imgName = element.dataset.imgName;
       const alt = element.dataset.alt || "";
@@ -62,15 +95,37 @@ document.addEventListener("DOMContentLoaded", () => {
       picture.className = "carousel-image";
       if (index === 0) picture.classList.add("active");
 
-      picture.innerHTML = `
-        <source media="(min-width: 1280px)" srcset="images/main/optimized/desktop/standard/${imgName}" />
-        <source media="(min-width: 1024px)" srcset="images/main/optimized/laptop/standard/${imgName}" />
-        <source media="(min-width: 480px)" srcset="images/main/optimized/mobile/standard/${imgName}" />
+      // Built modern formats ahead of the original-format fallback
+      const baseName = imgName.replace(/\.[^.]+$/, "");
+      const builtFormats = CAROUSEL_IMAGE_MANIFEST[imgName]?.formats || [];
+      const modernFormats = CAROUSEL_MODERN_FORMATS.filter(fmt => builtFormats.includes(fmt.ext));
+
+      // Images with adaptive widths get one srcset per format (they have no
+      // fixed standard variants); the rest get one <source> per breakpoint
+      const srcsets = CAROUSEL_SRCSETS[imgName]?.srcset;
+      const fileExt = imgName.split(".").pop().toLowerCase();
+      let sources, imgSources;
+      if (srcsets?.[fileExt]) {
+        sources = modernFormats.filter(fmt => srcsets[fmt.ext]).map(fmt => `
+        <source type="${fmt.type}" srcset="${srcsets[fmt.ext]}" sizes="${CAROUSEL_IMAGE_SIZES}" />`
+        ).join("");
+        const widest = srcsets[fileExt].split(",").pop().trim().split(/\s+/)[0];
+        imgSources = `src="${widest}" srcset="${srcsets[fileExt]}" sizes="${CAROUSEL_IMAGE_SIZES}"`;
+      } else {
+        sources = breakpoints.map(bp => modernFormats.map(fmt => `
+        <source media="${bp.media}" type="${fmt.type}" srcset="${carouselImageUrl(`images/main/optimized/${bp.folder}/standard/${baseName}.${fmt.ext}`)}" />`
+        ).join("") + `
+        <source media="${bp.media}" srcset="${carouselImageUrl(`images/main/optimized/${bp.folder}/standard/${imgName}`)}" />`
+        ).join("");
+        imgSources = `src="${carouselImageUrl(`images/main/optimized/mobile/standard/${imgName}`)}"`;
+      }
+
+      picture.innerHTML = `${sources}
         <img 
-          src="images/main/optimized/mobile/standard/${imgName}" 
+          ${imgSources} 
           alt="${alt}" 
           class="${extraClass}" 
-          data-full="images/main/optimized/desktop/zoom/${imgName}" 
+          data-full="${carouselImageUrl(`images/main/optimized/desktop/zoom/${imgName}`)}" 
         />
       `;
 
@@ -1,3 +1,20 @@
+// Deep zoom tile pyramids written by Image-Optimizer.py (projects/js/JSON/deepZoom.js);
+// images listed there open in a tiled viewer, all others as a single zoom image
+const DEEP_ZOOM_IMAGES = typeof DEEP_ZOOM !== "undefined" ? DEEP_ZOOM : {};
+
+// Furthest the tiled viewer zooms in, in screen pixels per source pixel
+const DEEP_ZOOM_MAX_SCALE = 2;
+
+// Plain URL of each content-hashed image (projects/js/JSON/imageFingerprints.js), so
+// fingerprinted zoom images still find their pyramid
+const DEEP_ZOOM_PLAIN_URLS = Object.fromEntries(
+  Object.entries(typeof IMAGE_FINGERPRINTS !== "undefined" ? IMAGE_FINGERPRINTS : {})
+    .map(([plain, hashed]) => [hashed, plain])
+);
+
+// The open tiled viewer, if any (see openDeepZoom)
+let deepZoomViewer = null;
+
 // Opens the fullscreen image modal using either a direct image element
 // or the currently active image in a carousel (if no element is passed)
 function openFullScreen(imgElement) {
@@ -20,7 +37,19 @@ function openFullScreen(imgElement) {
     }
   }
 
+  // Display the modal, tiled when the image has a deep zoom pyramid
+  const plainSrc = DEEP_ZOOM_PLAIN_URLS[src] || src;
+  const fileName = decodeURIComponent(plainSrc.split("/").pop() || "");
+  const pyramid = DEEP_ZOOM_IMAGES[fileName];
+  if (pyramid) {
+    modalImg.style.display = "none";
+    modal.style.display = "block";
+    deepZoomViewer = openDeepZoom(modal, pyramid, imgElement?.alt || "");
+    return;
+  }
+
   // Set modal image and display the modal
+  modalImg.style.display = "";
   modalImg.src = src;
   modalImg.alt = imgElement?.alt || "";
   modal.style.display = "block";
@@ -31,6 +60,203 @@ function closeFullScreen() {
   const modal = document.getElementById("imgModal");
   const modalImg = document.getElementById("fullImg");
 
+  if (deepZoomViewer) {
+    deepZoomViewer.close();
+    deepZoomViewer = null;
+  }
   modalImg.src = "";
   modal.style.display = "none";
 }
+
+// Builds a pan/zoom viewer for one DZI pyramid inside the modal. Only the
+// tiles covering the screen at the current zoom level are requested; the
+// single-tile lowest level stays underneath while they load.
+function openDeepZoom(modal, pyramid, altText) {
+  const viewer = document.createElement("div");
+  viewer.className = "deep-zoom";
+  viewer.setAttribute("role", "img");
+  viewer.setAttribute("aria-label", altText);
+  modal.insertBefore(viewer, modal.firstChild); // stays below the close button
+
+  const maxLevel = Math.ceil(Math.log2(Math.max(pyramid.width, pyramid.height)));
+  const baseLevel = Math.max(0, maxLevel - Math.ceil(Math.log2(
+    Math.max(pyramid.width, pyramid.height) / pyramid.tileSize
+  )));
+  const tiles = new Map();
+  let scale = 1;
+  let minScale = 1;
+  let x = 0;
+  let y = 0;
+
+  // Size of a pyramid level in pixels (each level halves the one above)
+  function levelSize(level) {
+    const factor = Math.pow(2, maxLevel - level);
+    return [Math.ceil(pyramid.width / factor), Math.ceil(pyramid.height / factor)];
+  }
+
+  // Position (or create) one tile, returning its key
+  function placeTile(level, col, row, layer) {
+    const key = `${level}/${col}_${row}`;
+    let tile = tiles.get(key);
+    if (!tile) {
+      tile = document.createElement("img");
+      tile.className = "deep-zoom-tile";
+      tile.alt = "";
+      tile.draggable = false;
+      tile.style.zIndex = layer;
+      tile.src = `${pyramid.tiles}${level}/${col}_${row}.${pyramid.format}`;
+      viewer.appendChild(tile);
+      tiles.set(key, tile);
+    }
+    const [levelWidth, levelHeight] = levelSize(level);
+    const toScreen = scale * Math.pow(2, maxLevel - level);
+    const left = Math.max(0, col * pyramid.tileSize - pyramid.overlap);
+    const top = Math.max(0, row * pyramid.tileSize - pyramid.overlap);
+    const right = Math.min(levelWidth, (col + 1) * pyramid.tileSize + pyramid.overlap);
+    const bottom = Math.min(levelHeight, (row + 1) * pyramid.tileSize + pyramid.overlap);
+    tile.style.left = `${x + left * toScreen}px`;
+    tile.style.top = `${y + top * toScreen}px`;
+    tile.style.width = `${(right - left) * toScreen}px`;
+    tile.style.height = `${(bottom - top) * toScreen}px`;
+    return key;
+  }
+
+  // Lay out the backdrop and every visible tile of the level matching the zoom
+  function render() {
+    const needed = new Set();
+    const dpr = window.devicePixelRatio || 1;
+    const level = Math.min(maxLevel, Math.max(baseLevel,
+      maxLevel + Math.ceil(Math.log2(scale * dpr))));
+    const [baseWidth, baseHeight] = levelSize(baseLevel);
+    for (let col = 0; col < Math.ceil(baseWidth / pyramid.tileSize); col++) {
+      for (let row = 0; row < Math.ceil(baseHeight / pyramid.tileSize); row++) {
+        needed.add(placeTile(baseLevel, col, row, 0));
+      }
+    }
+    if (level > baseLevel) {
+      const toLevel = Math.pow(2, level - maxLevel) / scale;
+      const [levelWidth, levelHeight] = levelSize(level);
+      const firstCol = Math.max(0, Math.floor(-x * toLevel / pyramid.tileSize));
+      const firstRow = Math.max(0, Math.floor(-y * toLevel / pyramid.tileSize));
+      const lastCol = Math.min(Math.ceil(levelWidth / pyramid.tileSize) - 1,
+        Math.floor((viewer.clientWidth - x) * toLevel / pyramid.tileSize));
+      const lastRow = Math.min(Math.ceil(levelHeight / pyramid.tileSize) - 1,
+        Math.floor((viewer.clientHeight - y) * toLevel / pyramid.tileSize));
+      for (let col = firstCol; col <= lastCol; col++) {
+        for (let row = firstRow; row <= lastRow; row++) {
+          needed.add(placeTile(level, col, row, 1));
+        }
+      }
+    }
+    tiles.forEach((tile, key) => {
+      if (!needed.has(key)) {
+        tile.remove();
+        tiles.delete(key);
+      }
+    });
+  }
+
+  // Keep the image on screen: centred when smaller than the viewer, edge-to-edge otherwise
+  function clampPosition() {
+    const width = pyramid.width * scale;
+    const height = pyramid.height * scale;
+    x = width <= viewer.clientWidth ? (viewer.clientWidth - width) / 2
+      : Math.min(0, Math.max(viewer.clientWidth - width, x));
+    y = height <= viewer.clientHeight ? (viewer.clientHeight - height) / 2
+      : Math.min(0, Math.max(viewer.clientHeight - height, y));
+  }
+
+  // Zoom by a factor, keeping the source pixel under (cx, cy) in place
+  function zoomAt(factor, cx, cy) {
+    const next = Math.min(DEEP_ZOOM_MAX_SCALE, Math.max(minScale, scale * factor));
+    x = cx - (cx - x) * (next / scale);
+    y = cy - (cy - y) * (next / scale);
+    scale = next;
+    clampPosition();
+    render();
+  }
+
+  // Fit the whole image to the viewer
+  function fit() {
+    minScale = Math.min(1, viewer.clientWidth / pyramid.width, viewer.clientHeight / pyramid.height);
+    scale = Math.max(scale, minScale);
+    clampPosition();
+    render();
+  }
+
+  // Pointer tracking for drag-to-pan and two-finger pinch
+  const pointers = new Map();
+  let pinchDistance = 0;
+
+  function onPointerDown(e) {
+    viewer.setPointerCapture(e.pointerId);
+    pointers.set(e.pointerId, { x: e.clientX, y: e.clientY });
+    if (pointers.size === 2) {
+      const [a, b] = [...pointers.values()];
+      pinchDistance = Math.hypot(a.x - b.x, a.y - b.y);
+    }
+  }
+
+  function onPointerMove(e) {
+    const last = pointers.get(e.pointerId);
+    if (!last) return;
+    pointers.set(e.pointerId, { x: e.clientX, y: e.clientY });
+    if (pointers.size === 2) {
+      const [a, b] = [...pointers.values()];
+      const distance = Math.hypot(a.x - b.x, a.y - b.y);
+      const rect = viewer.getBoundingClientRect();
+      zoomAt(pinchDistance ? distance / pinchDistance : 1, (a.x + b.x) / 2 - rect.left, (a.y + b.y) / 2 - rect.top);
+      pinchDistance = distance;
+    } else {
+      x += e.clientX - last.x;
+      y += e.clientY - last.y;
+      clampPosition();
+      render();
+    }
+  }
+
+  function onPointerUp(e) {
+    pointers.delete(e.pointerId);
+  }
+
+  function onWheel(e) {
+    e.preventDefault();
+    const rect = viewer.getBoundingClientRect();
+    zoomAt(Math.exp(-e.deltaY * 0.002), e.clientX - rect.left, e.clientY - rect.top);
+  }
+
+  function onDoubleClick(e) {
+    const rect = viewer.getBoundingClientRect();
+    zoomAt(2, e.clientX - rect.left, e.clientY - rect.top);
+  }
+
+  // Clicks inside the viewer zoom and pan rather than closing the modal
+  function onClick(e) {
+    e.stopPropagation();
+  }
+
+  function onKeyDown(e) {
+    if (e.key === "Escape") closeFullScreen();
+  }
+
+  viewer.addEventListener("pointerdown", onPointerDown);
+  viewer.addEventListener("pointermove", onPointerMove);
+  viewer.addEventListener("pointerup", onPointerUp);
+  viewer.addEventListener("pointercancel", onPointerUp);
+  viewer.addEventListener("wheel", onWheel, { passive: false });
+  viewer.addEventListener("dblclick", onDoubleClick);
+  viewer.addEventListener("click", onClick);
+  window.addEventListener("resize", fit);
+  document.addEventListener("keydown", onKeyDown);
+
+  scale = 0;
+  fit();
+
+  return {
+    close() {
+      window.removeEventListener("resize", fit);
+      document.removeEventListener("keydown", onKeyDown);
+      viewer.remove();
+    }
+  };
+}